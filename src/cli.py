@@ -1,22 +1,358 @@
+import json
+import os
+import sys
 import click
-from typing import Optional
+from click.core import ParameterSource
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
+from src.core.cache import ResultCache
+from src.core.scheduler import EXECUTORS
 from src.main import main
-from src.reports.export import export_report
+from src.scoring.get_rules import get_all_rules
+from src.scoring.registry import RuleLoadError, default_registry
+from src.scoring.rules_base import Rule
+from src.reports.export import FORMAT_EXTENSIONS, export_report, write_ndjson
+from src.utils.http import DEFAULT_MAX_SPEC_BYTES, DEFAULT_TIMEOUT, SpecFetcher
+from src.utils.spec_cache import SpecCache
+from src.utils.validation import VALIDATION_LEVELS, VerdictCache
 
 
-@click.command()
+class DefaultCommandGroup(click.Group):
+    """
+    Command group that falls back to ``score`` when no subcommand is named,
+    so ``python -m src.cli spec.yaml`` keeps working.
+    """
+
+    default_command = "score"
+
+    def parse_args(self, ctx: click.Context, args: List[str]) -> List[str]:
+        if (
+            args
+            and args[0] not in self.commands
+            and args[0] not in ctx.help_option_names
+        ):
+            args.insert(0, self.default_command)
+        return super().parse_args(ctx, args)
+
+
+def engine_options(command: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Attach the cache and validation options shared by the scoring commands.
+    """
+    options = [
+        click.option(
+            "--cache-dir",
+            type=click.Path(file_okay=False),
+            envvar="API_SCORING_CACHE_DIR",
+            help="Cache reports, parsed specs and validation verdicts here, keyed by "
+            "spec content",
+        ),
+        click.option(
+            "--cache-max-mb",
+            type=click.IntRange(min=1),
+            default=256,
+            show_default=True,
+            help="Evict least recently used reports beyond this size",
+        ),
+        click.option("--no-cache", is_flag=True, help="Bypass the cache for this run"),
+        click.option(
+            "--clear-cache", is_flag=True, help="Empty the cache before scoring"
+        ),
+        click.option(
+            "--validation",
+            type=click.Choice(VALIDATION_LEVELS),
+            default="full",
+            show_default=True,
+            help="OpenAPI validation level",
+        ),
+        click.option(
+            "--max-validation-errors",
+            type=click.IntRange(min=0),
+            default=0,
+            show_default=True,
+            help="Collect up to N validation errors into the report and keep "
+            "scoring; 0 aborts on the first error",
+        ),
+        click.option(
+            "--fetch-timeout",
+            type=click.FloatRange(min=0.1),
+            default=DEFAULT_TIMEOUT,
+            show_default=True,
+            help="Seconds allowed for downloading a spec URL",
+        ),
+        click.option(
+            "--max-spec-mb",
+            type=click.IntRange(min=1),
+            default=DEFAULT_MAX_SPEC_BYTES // (1024 * 1024),
+            show_default=True,
+            help="Abort downloads of spec URLs larger than this",
+        ),
+        click.option(
+            "--rule-workers",
+            type=click.IntRange(min=1),
+            default=1,
+            show_default=True,
+            help="Run up to N rules concurrently",
+        ),
+        click.option(
+            "--rule-timeout",
+            type=click.FloatRange(min=0, min_open=True),
+            help="Seconds each rule may take before it is reported as timed "
+            "out with a partial score",
+        ),
+        click.option(
+            "--rule-executor",
+            type=click.Choice(EXECUTORS),
+            default="thread",
+            show_default=True,
+            help="Run concurrent rules on threads or worker processes "
+            "(processes are not available inside 'batch' workers)",
+        ),
+        click.option(
+            "--path-workers",
+            type=click.IntRange(min=1),
+            default=1,
+            show_default=True,
+            help="Split the paths of one large spec across N worker processes; "
+            "excludes --rule-workers and --rule-timeout; not available inside 'batch' workers",
+        ),
+        click.option(
+            "--lazy",
+            is_flag=True,
+            help="Decode path items and components of JSON specs on first use to "
+            "save memory; faster only when the selected rules read little of the "
+            "spec, slower with all rules; best with --validation off",
+        ),
+        click.option(
+            "--rules",
+            help="Comma-separated ids of the rules to run, e.g. 'misc,security'; "
+            "defaults to all",
+        ),
+        click.option("--skip-rules", help="Comma-separated ids of rules not to run"),
+        click.option(
+            "--fail-under",
+            type=click.FloatRange(min=0, max=100),
+            help="Exit with status 1 when the score is below this; scoring "
+            "stops as soon as the threshold is out of reach",
+        ),
+    ]
+    for option in reversed(options):
+        command = option(command)
+    return command
+
+
+def make_engine_options(
+    cache_dir: Optional[str],
+    cache_max_mb: int,
+    no_cache: bool,
+    clear_cache: bool,
+    validation: str,
+    max_validation_errors: int,
+    fetch_timeout: float,
+    max_spec_mb: int,
+    rule_workers: int = 1,
+    rule_timeout: Optional[float] = None,
+    rule_executor: str = "thread",
+    path_workers: int = 1,
+    lazy: bool = False,
+    rules: Optional[str] = None,
+    skip_rules: Optional[str] = None,
+    fail_under: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Turn the shared CLI options into ``ScoringEngine`` keyword arguments.
+
+    Raises:
+        click.BadParameter: If ``--rules`` or ``--skip-rules`` names an
+            unknown rule.
+    """
+    fetch_options: Dict[str, Any] = {
+        "timeout": fetch_timeout,
+        "max_bytes": max_spec_mb * 1024 * 1024,
+    }
+    options: Dict[str, Any] = {
+        "validation": validation,
+        "max_validation_errors": max_validation_errors,
+        "fetcher": SpecFetcher(**fetch_options),
+        "rule_workers": rule_workers,
+        "rule_timeout": rule_timeout,
+        "rule_executor": rule_executor,
+        "path_workers": path_workers,
+        "fail_under": fail_under,
+        "lazy": lazy,
+    }
+    if rules or skip_rules:
+        options["rules"] = select_rules(rules, skip_rules)
+    if not cache_dir:
+        return options
+
+    max_bytes = cache_max_mb * 1024 * 1024
+    cache = ResultCache(os.path.join(cache_dir, "results"), max_bytes)
+    verdicts = VerdictCache(os.path.join(cache_dir, "verdicts"), max_bytes=max_bytes)
+    spec_cache = SpecCache(os.path.join(cache_dir, "specs"), max_bytes)
+    fetcher = SpecFetcher(
+        os.path.join(cache_dir, "http"), cache_max_bytes=max_bytes, **fetch_options
+    )
+    if clear_cache:
+        cache.clear()
+        verdicts.clear()
+        spec_cache.clear()
+        fetcher.clear()
+    if not no_cache:
+        options.update(
+            cache=cache, verdicts=verdicts, fetcher=fetcher, spec_cache=spec_cache
+        )
+    return options
+
+
+# Options of 'score' that watch mode does not support.
+WATCH_UNSUPPORTED = (
+    "fail_under",
+    "cache_dir",
+    "cache_max_mb",
+    "no_cache",
+    "clear_cache",
+    "lazy",
+    "rule_workers",
+    "rule_timeout",
+    "rule_executor",
+    "path_workers",
+    "profile",
+    "profile_dir",
+    "fetch_timeout",
+    "max_spec_mb",
+)
+
+HISTORY_COLUMNS = [
+    "commit",
+    "timestamp",
+    "score",
+    "grade",
+    "issues",
+    "changed_paths",
+    "path_checks",
+    "path_checks_reused",
+    "subject",
+    "error",
+]
+
+
+def select_rules(rules: Optional[str], skip_rules: Optional[str]) -> List[Rule]:
+    """
+    Rule instances for the ``--rules`` and ``--skip-rules`` options.
+
+    Raises:
+        click.BadParameter: If either option names an unknown rule.
+        click.ClickException: If a selected rule cannot be loaded, see
+            ``RuleLoadError``.
+    """
+    try:
+        rule_ids = default_registry.select(_split_ids(rules), _split_ids(skip_rules))
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="--rules/--skip-rules")
+    try:
+        return get_all_rules(rule_ids)
+    except RuleLoadError as e:
+        raise click.ClickException(str(e))
+
+
+def _split_ids(ids: Optional[str]) -> Optional[List[str]]:
+    if not ids:
+        return None
+    return [rule_id.strip() for rule_id in ids.split(",") if rule_id.strip()]
+
+
+def check_fail_under(report: Dict[str, Any], fail_under: Optional[float]) -> None:
+    """
+    Exit with status 1 when the report missed its ``--fail-under`` gate or,
+    with ``fail_under`` set, has no gate at all.
+    """
+    if fail_under is None:
+        return
+    gate = report.get("gate")
+    if gate is None:
+        click.echo(
+            f"{score_label(report)} {report.get('score', 'N/A')} was not checked "
+            f"against --fail-under {fail_under}",
+            err=True,
+        )
+        sys.exit(1)
+    if gate["passed"]:
+        return
+    skipped = gate["skipped_rules"]
+    note = f" (stopped early, skipped: {', '.join(skipped)})" if skipped else ""
+    click.echo(
+        f"{score_label(report)} {report['score']} is below "
+        f"--fail-under {gate['fail_under']}{note}",
+        err=True,
+    )
+    sys.exit(1)
+
+
+def score_label(report: Dict[str, Any]) -> str:
+    """
+    "Partial score" for a report that stopped before running every rule,
+    whose score only covers the rules that ran; "Score" otherwise.
+    """
+    gate = report.get("gate")
+    return "Partial score" if gate and gate["skipped_rules"] else "Score"
+
+
+@click.group(cls=DefaultCommandGroup)
+def cli() -> None:
+    """
+    Score OpenAPI 3.x specifications.
+
+    Run 'score INPUT_PATH' (the default command) for a single spec or
+    'batch' for many.
+    """
+
+
+@cli.command()
 @click.argument("input_path", type=click.Path(exists=False))
 @click.option(
     "--export",
     "-e",
-    type=click.Choice(["json", "markdown", "html"]),
+    type=click.Choice(list(FORMAT_EXTENSIONS)),
     help="Export report format",
 )
 @click.option(
     "--output", "-o", type=click.Path(), help="Output file path for exported report"
 )
-def cli(input_path: str, export: Optional[str], output: Optional[str]) -> None:
+@click.option(
+    "--watch",
+    "-w",
+    is_flag=True,
+    help="Keep running and rescore changed parts of the file on every save",
+)
+@click.option(
+    "--interval",
+    type=click.FloatRange(min=0.05),
+    default=1.0,
+    show_default=True,
+    help="Polling interval in seconds for --watch",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Time every stage and rule, add a 'timings' section and print it",
+)
+@click.option(
+    "--profile-dir",
+    type=click.Path(file_okay=False),
+    help="Also dump cProfile stats of every rule into this directory",
+)
+@engine_options
+def score(
+    input_path: str,
+    export: Optional[str],
+    output: Optional[str],
+    watch: bool,
+    interval: float,
+    profile: bool,
+    profile_dir: Optional[str],
+    **options: Any,
+) -> None:
     """
     Score an OpenAPI 3.x specification from INPUT_PATH (file or URL).
 
@@ -24,19 +360,480 @@ def cli(input_path: str, export: Optional[str], output: Optional[str]) -> None:
         input_path (str): Path or URL to the OpenAPI spec file.
         export (Optional[str]): Format to export the report ('json', 'markdown', 'html').
         output (Optional[str]): Output file path to save the exported report.
+        watch (bool): Rescore incrementally whenever the file changes.
+        interval (float): Polling interval for watch mode.
+        profile (bool): Collect and print per-stage and per-rule timings.
+        profile_dir (Optional[str]): Directory for per-rule cProfile dumps.
+        options: Cache and validation options, see ``make_engine_options``.
     """
+    if export and not output:
+        output = f"report.{FORMAT_EXTENSIONS[export]}"
+    if watch:
+        check_watch_options()
+        watch_spec(input_path, export, output, interval, options)
+        return
+
+    engine_kwargs = make_engine_options(**options)
+    if profile or profile_dir:
+        engine_kwargs.update(profile=True, profile_dir=profile_dir)
     try:
-        report = main(input_path)
-        if export:
-            if not output:
-                ext_map = {"json": "json", "markdown": "md", "html": "html"}
-                output = f"report.{ext_map[export]}"
-            export_report(report, export, output)
-            click.echo(f"Report exported to: {output}")
+        if export in ("ndjson", "html") and output:
+            summary = stream_report(input_path, export, output, engine_kwargs)
         else:
-            click.echo(f"Score: {report.get('score', 'N/A')}")
+            summary = main(input_path, **engine_kwargs)
+            emit_report(summary, export, output)
+        if "timings" in summary:
+            from src.core.profiling import format_timings
+
+            click.echo(format_timings(summary["timings"]), err=True)
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
+        if options.get("fail_under") is not None:
+            # A spec that could not be scored must not pass the gate.
+            sys.exit(1)
+        return
+    check_fail_under(summary, options.get("fail_under"))
+
+
+def stream_report(
+    input_path: str, export: str, output: str, options: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Write issues to an ndjson or HTML report as they are produced.
+
+    Returns:
+        dict: The report summary written after the issues.
+    """
+    from src.core.scoring_engine import ScoringEngine
+
+    stream = ScoringEngine(input_path, **options).stream()
+    summary: Dict[str, Any] = {}
+
+    def keep_summary() -> Dict[str, Any]:
+        summary.update(stream.summary())
+        return summary
+
+    if export == "html":
+        from src.reports.html import write_html
+
+        write_html(stream, keep_summary, output)
+    else:
+        with open(output, "w", encoding="utf-8") as f:
+            write_ndjson(stream, keep_summary, f)
+    click.echo(f"Report exported to: {output}")
+    return summary
+
+
+def emit_report(
+    report: Dict[str, Any], export: Optional[str], output: Optional[str], note: str = ""
+) -> None:
+    if export and output:
+        export_report(report, export, output)
+        click.echo(f"Report exported to: {output}{note}")
+    else:
+        click.echo(f"{score_label(report)}: {report.get('score', 'N/A')}{note}")
+
+
+def check_watch_options() -> None:
+    """
+    Reject options of the current command that ``--watch`` would ignore.
+
+    Raises:
+        click.UsageError: If one of ``WATCH_UNSUPPORTED`` was given on the
+            command line.
+    """
+    ctx = click.get_current_context()
+    given = [
+        param.opts[0]
+        for param in ctx.command.params
+        if param.name in WATCH_UNSUPPORTED
+        and ctx.get_parameter_source(param.name) is ParameterSource.COMMANDLINE
+    ]
+    if given:
+        raise click.UsageError(f"--watch cannot be combined with {', '.join(given)}")
+
+
+def watch_spec(
+    input_path: str,
+    export: Optional[str],
+    output: Optional[str],
+    interval: float,
+    options: Dict[str, Any],
+) -> None:
+    from src.core.incremental import SpecWatcher
+
+    try:
+        watcher = SpecWatcher(
+            input_path,
+            rules=make_engine_options(**options).get("rules"),
+            validation=options["validation"],
+            max_validation_errors=options["max_validation_errors"],
+        )
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        return
+
+    def on_report(report: Dict[str, Any]) -> None:
+        stats = watcher.scorer.last_stats
+        emit_report(
+            report,
+            export,
+            output,
+            f" (rescored {len(stats['changed_paths'])}/{stats['paths']} path items)",
+        )
+
+    click.echo(f"Watching {input_path} (Ctrl+C to stop)", err=True)
+    try:
+        watcher.run(on_report, lambda e: click.echo(f"Error: {e}", err=True), interval)
+    except KeyboardInterrupt:
+        pass
+
+
+@cli.command()
+@click.argument("inputs", nargs=-1)
+@click.option(
+    "--manifest",
+    "-m",
+    type=click.Path(exists=True, dir_okay=False),
+    help="File listing one spec path, URL, directory or glob per line",
+)
+@click.option(
+    "--workers",
+    "-j",
+    type=click.IntRange(min=1),
+    help="Number of worker processes (defaults to CPU count)",
+)
+@click.option(
+    "--export",
+    "-e",
+    type=click.Choice(list(FORMAT_EXTENSIONS)),
+    help="Also export a full report per spec in this format",
+)
+@click.option(
+    "--export-dir",
+    type=click.Path(file_okay=False),
+    default="reports",
+    show_default=True,
+    help="Directory for per-spec reports",
+)
+@click.option(
+    "--summary", "-s", type=click.Path(), help="Write a JSON summary to this file"
+)
+@engine_options
+def batch(
+    inputs: Tuple[str, ...],
+    manifest: Optional[str],
+    workers: Optional[int],
+    export: Optional[str],
+    export_dir: str,
+    summary: Optional[str],
+    **options: Any,
+) -> None:
+    """
+    Score many specs given as files, directories, globs or a manifest.
+
+    One JSON line per spec is printed as soon as it is scored; a summary
+    follows once all specs are done.
+    """
+    from src.core.batch import discover_specs, score_batch, summarize
+
+    paths = discover_specs(inputs, manifest)
+    if not paths:
+        raise click.UsageError("No specs found for the given inputs.")
+
+    engine_kwargs = make_engine_options(**options)
+    results = []
+    for result in score_batch(paths, workers, export, export_dir, **engine_kwargs):
+        results.append(result)
+        click.echo(json.dumps(result))
+
+    batch_summary = summarize(results)
+    if summary:
+        with open(summary, "w", encoding="utf-8") as f:
+            json.dump(batch_summary, f, indent=2)
+    click.echo(
+        f"Scored {batch_summary['scored']}/{batch_summary['total']} specs, "
+        f"mean score: {batch_summary['mean_score']}",
+        err=True,
+    )
+    below = [r["input"] for r in results if r.get("gate_passed") is False]
+    if below:
+        click.echo(
+            f"{len(below)} specs scored below --fail-under {options['fail_under']}",
+            err=True,
+        )
+    if batch_summary["failed"] or below:
+        sys.exit(1)
+
+
+@cli.command()
+@click.argument("spec_path")
+@click.option(
+    "--repo",
+    type=click.Path(exists=True, file_okay=False),
+    default=".",
+    show_default=True,
+    help="Git repository to read the spec from",
+)
+@click.option(
+    "--revisions",
+    default="HEAD",
+    show_default=True,
+    help="Revision range passed to 'git log', e.g. 'v1.0..main'",
+)
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(["ndjson", "csv"]),
+    default="ndjson",
+    show_default=True,
+    help="Time series format written to stdout",
+)
+@click.option(
+    "--validation",
+    type=click.Choice(VALIDATION_LEVELS),
+    default="full",
+    show_default=True,
+    help="OpenAPI validation level",
+)
+@click.option(
+    "--max-validation-errors",
+    type=click.IntRange(min=0),
+    default=0,
+    show_default=True,
+    help="Collect up to N validation errors and keep scoring; 0 records an "
+    "invalid version as an error",
+)
+@click.option("--rules", help="Comma-separated ids of the rules to run")
+@click.option("--skip-rules", help="Comma-separated ids of rules not to run")
+def history(
+    spec_path: str,
+    repo: str,
+    revisions: str,
+    fmt: str,
+    validation: str,
+    max_validation_errors: int,
+    rules: Optional[str],
+    skip_rules: Optional[str],
+) -> None:
+    """
+    Score every commit that changed SPEC_PATH and print a score time series.
+
+    SPEC_PATH is relative to the repository root. Versions are read straight
+    from git objects, oldest first, and only path items and components that
+    changed since the previous version are checked again.
+    """
+    from src.core.history import HistoryError, score_history
+
+    rule_list = select_rules(rules, skip_rules) if rules or skip_rules else None
+    points = score_history(
+        repo, spec_path, revisions, rule_list, validation, max_validation_errors
+    )
+    writer = None
+    if fmt == "csv":
+        import csv
+
+        writer = csv.DictWriter(
+            sys.stdout, HISTORY_COLUMNS, extrasaction="ignore", lineterminator="\n"
+        )
+        writer.writeheader()
+    count = 0
+    try:
+        for point in points:
+            count += 1
+            if writer is not None:
+                writer.writerow(point)
+            else:
+                click.echo(json.dumps(point))
+    except HistoryError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+    click.echo(f"Scored {count} revisions of {spec_path}", err=True)
+
+
+@cli.command()
+@click.option(
+    "--sizes",
+    default="10,100,500",
+    show_default=True,
+    help="Comma-separated path counts of the synthetic specs",
+)
+@click.option(
+    "--repeat",
+    "-n",
+    type=click.IntRange(min=1),
+    default=5,
+    show_default=True,
+    help="Timed runs per stage",
+)
+@click.option(
+    "--validation",
+    type=click.Choice(VALIDATION_LEVELS),
+    default="full",
+    show_default=True,
+)
+@click.option(
+    "--save", type=click.Path(dir_okay=False), help="Write results to this JSON file"
+)
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Compare against results saved earlier with --save",
+)
+@click.option(
+    "--threshold",
+    type=click.FloatRange(min=0),
+    default=0.2,
+    show_default=True,
+    help="Flag stages slower or larger than the baseline by this fraction",
+)
+@click.option(
+    "--import-budget",
+    type=click.FloatRange(min=0),
+    default=None,
+    help="Fail when importing the CLI takes longer than this many ms "
+    "(default budget: 250)",
+)
+@click.option(
+    "--no-startup", is_flag=True, help="Skip the CLI startup and import benchmark"
+)
+def bench(
+    sizes: str,
+    repeat: int,
+    validation: str,
+    save: Optional[str],
+    baseline: Optional[str],
+    threshold: float,
+    import_budget: Optional[float],
+    no_startup: bool,
+) -> None:
+    """
+    Time CLI startup, loading, every rule, the engine and every export
+    format on synthetic specs, and compare with a stored baseline.
+
+    Exits with status 1 when a regression is flagged or the CLI import time
+    is over budget.
+    """
+    from src.core import bench as benchmark
+
+    try:
+        size_list = [int(size) for size in sizes.split(",") if size.strip()]
+    except ValueError:
+        raise click.BadParameter(
+            "Expected comma-separated integers.", param_hint="--sizes"
+        )
+
+    def on_stage(size: Union[int, str], stage: str, stats: Dict[str, float]) -> None:
+        click.echo(benchmark.format_stage(size, stage, stats))
+
+    results = benchmark.run_bench(
+        size_list, repeat, validation, on_stage, startup=not no_startup
+    )
+    if save:
+        benchmark.save_baseline(results, save)
+        click.echo(f"Results saved to: {save}", err=True)
+    failed = False
+    if not no_startup:
+        violation = benchmark.check_import_budget(
+            results,
+            benchmark.IMPORT_BUDGET_MS if import_budget is None else import_budget,
+        )
+        if violation:
+            click.echo(benchmark.format_budget_violation(violation), err=True)
+            failed = True
+    if baseline:
+        regressions = benchmark.compare(
+            results, benchmark.load_baseline(baseline), threshold
+        )
+        for regression in regressions:
+            click.echo(benchmark.format_regression(regression), err=True)
+        if regressions:
+            failed = True
+        else:
+            click.echo(f"No regressions against {baseline}", err=True)
+    if failed:
+        sys.exit(1)
+
+
+@cli.command()
+@click.argument("output", type=click.Path(dir_okay=False))
+@click.option("--paths", type=click.IntRange(min=0), default=100, show_default=True)
+@click.option(
+    "--methods-per-path", type=click.IntRange(1, 5), default=2, show_default=True
+)
+@click.option(
+    "--schema-depth", type=click.IntRange(min=1), default=3, show_default=True
+)
+@click.option(
+    "--schemas",
+    type=click.IntRange(min=0),
+    default=0,
+    help="Component schemas [default: one per ten paths]",
+)
+@click.option(
+    "--ref-density", type=click.FloatRange(0, 1), default=0.5, show_default=True
+)
+@click.option(
+    "--missing-descriptions",
+    type=click.FloatRange(0, 1),
+    default=0.2,
+    show_default=True,
+)
+@click.option(
+    "--missing-examples", type=click.FloatRange(0, 1), default=0.2, show_default=True
+)
+@click.option(
+    "--missing-security", type=click.FloatRange(0, 1), default=0.2, show_default=True
+)
+@click.option("--seed", type=int, default=0, show_default=True)
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(["json", "yaml"]),
+    help="Output format [default: from the file suffix]",
+)
+def generate(output: str, fmt: Optional[str], **shape: Any) -> None:
+    """
+    Write a deterministic synthetic spec of the given size to OUTPUT.
+    """
+    from src.utils.spec_generator import SpecShape, write_spec
+
+    written = write_spec(SpecShape(**shape), output, fmt or "")
+    click.echo(f"Spec written to: {output} ({written})")
+
+
+@cli.command()
+@click.option("--host", default="127.0.0.1", show_default=True, help="Bind address")
+@click.option("--port", type=click.IntRange(0, 65535), default=8080, show_default=True)
+@click.option(
+    "--max-body-mb",
+    type=click.IntRange(min=1),
+    default=32,
+    show_default=True,
+    help="Reject spec bodies larger than this",
+)
+@click.option("--quiet", "-q", is_flag=True, help="Do not log every request")
+@engine_options
+def serve(host: str, port: int, max_body_mb: int, quiet: bool, **options: Any) -> None:
+    """
+    Run a local HTTP scoring service with warm rules and caches.
+
+    POST a spec to /score, or GET /score?path=FILE_OR_URL, to receive the
+    report as JSON.
+    """
+    from src.core.server import ScoringServer, ScoringService
+
+    service = ScoringService(**make_engine_options(**options))
+    server = ScoringServer((host, port), service, max_body_mb * 1024 * 1024, quiet)
+    click.echo(
+        f"Serving on http://{host}:{server.server_port} (Ctrl+C to stop)", err=True
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import glob
+import multiprocessing
+import os
+import re
+from functools import partial
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from src.core.scoring_engine import ScoringEngine
+from src.reports.export import FORMAT_EXTENSIONS, export_report
+from src.scoring.get_rules import get_all_rules
+from src.scoring.registry import RuleLoadError
+from src.scoring.rules_base import Rule
+
+SPEC_SUFFIXES = (".json", ".yaml", ".yml")
+
+_worker_rules: Optional[List[Rule]] = None
+
+
+def discover_specs(inputs: Iterable[str], manifest: Optional[str] = None) -> List[str]:
+    """
+    Expand batch inputs into a list of spec locations.
+
+    Args:
+        inputs (Iterable[str]): Files, URLs, directories (searched recursively
+            for .json/.yaml/.yml files) or glob patterns.
+        manifest (Optional[str]): File listing one input per line. Blank lines
+            and lines starting with '#' are ignored; relative entries are
+            resolved against the manifest's directory.
+
+    Returns:
+        List[str]: Spec locations in input order, without duplicates.
+    """
+    entries = list(inputs)
+    if manifest:
+        base = os.path.dirname(os.path.abspath(manifest))
+        with open(manifest, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                if not _is_url(line) and not os.path.isabs(line):
+                    line = os.path.join(base, line)
+                entries.append(line)
+
+    found: List[str] = []
+    for entry in entries:
+        if _is_url(entry) or os.path.isfile(entry):
+            found.append(entry)
+        elif os.path.isdir(entry):
+            for root, dirs, files in os.walk(entry):
+                dirs.sort()
+                found.extend(
+                    os.path.join(root, name)
+                    for name in sorted(files)
+                    if name.lower().endswith(SPEC_SUFFIXES)
+                )
+        elif glob.has_magic(entry):
+            found.extend(sorted(glob.glob(entry, recursive=True)))
+        else:
+            # Keep unknown paths so they surface as per-spec load errors.
+            found.append(entry)
+
+    return list(dict.fromkeys(found))
+
+
+def score_one(
+    input_path: str,
+    export: Optional[str] = None,
+    export_dir: Optional[str] = None,
+    engine_options: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Score a single spec inside a batch worker.
+
+    The full report is exported from the worker (when requested) so only a
+    small summary record travels back to the parent process.
+    """
+    global _worker_rules
+    options = dict(engine_options or {})
+    try:
+        if "rules" not in options:
+            if _worker_rules is None:
+                _worker_rules = get_all_rules()
+            options["rules"] = _worker_rules
+        engine = ScoringEngine(input_path, **options)
+        report = engine.run()
+    except Exception as e:
+        return {"input": input_path, "error": str(e)}
+
+    result: Dict[str, Any] = {
+        "input": input_path,
+        # The report of an empty spec carries its score as the string "0".
+        "score": float(report["score"]),
+        "grade": report["grade"],
+        "issues": len(report.get("issues", [])),
+    }
+    if options.get("fail_under") is not None:
+        # A report without a gate was never checked, so it does not pass.
+        result["gate_passed"] = report.get("gate", {}).get("passed", False)
+    if export and export_dir:
+        output = os.path.join(
+            export_dir, f"{_report_name(input_path)}.{FORMAT_EXTENSIONS[export]}"
+        )
+        export_report(report, export, output)
+        result["report"] = output
+    return result
+
+
+def score_batch(
+    paths: List[str],
+    workers: Optional[int] = None,
+    export: Optional[str] = None,
+    export_dir: Optional[str] = None,
+    **engine_options: Any,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Score many specs on a pool of worker processes.
+
+    Each worker instantiates the rules once and reuses them for every spec it
+    receives. Results are yielded as soon as each spec finishes, so their
+    order does not follow ``paths``.
+
+    Args:
+        paths (List[str]): Spec locations, e.g. from ``discover_specs``.
+        workers (Optional[int]): Number of worker processes. Defaults to the
+            CPU count; 1 scores in the current process.
+        export (Optional[str]): Per-spec report format to write, if any.
+        export_dir (Optional[str]): Directory for per-spec reports.
+        engine_options: Extra ``ScoringEngine`` arguments (cache, validation).
+
+    Yields:
+        dict: One result per spec with either score/grade or an error.
+    """
+    if export and export_dir:
+        os.makedirs(export_dir, exist_ok=True)
+    task = partial(
+        score_one, export=export, export_dir=export_dir, engine_options=engine_options
+    )
+
+    workers = min(workers or os.cpu_count() or 1, max(len(paths), 1))
+    if workers == 1:
+        for path in paths:
+            yield task(path)
+        return
+
+    with multiprocessing.Pool(workers, initializer=_init_worker) as pool:
+        yield from pool.imap_unordered(task, paths)
+
+
+def summarize(results: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Aggregate batch results into a summary.
+    """
+    scores: List[float] = []
+    grades: Dict[str, int] = {}
+    failures: List[Dict[str, Any]] = []
+    for result in results:
+        if "error" in result:
+            failures.append(result)
+            continue
+        scores.append(result["score"])
+        grades[result["grade"]] = grades.get(result["grade"], 0) + 1
+
+    return {
+        "total": len(scores) + len(failures),
+        "scored": len(scores),
+        "failed": len(failures),
+        "mean_score": round(sum(scores) / len(scores), 2) if scores else None,
+        "min_score": min(scores) if scores else None,
+        "max_score": max(scores) if scores else None,
+        "grades": dict(sorted(grades.items())),
+        "failures": failures,
+    }
+
+
+def _init_worker() -> None:
+    global _worker_rules
+    try:
+        _worker_rules = get_all_rules()
+    except RuleLoadError:
+        # An error here would make the pool restart the worker forever;
+        # score_one reports it for every spec instead.
+        _worker_rules = None
+
+
+def _is_url(value: str) -> bool:
+    return value.startswith("http://") or value.startswith("https://")
+
+
+def _report_name(input_path: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", input_path).strip("_") or "report"
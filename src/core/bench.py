@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from src.core.scoring_engine import ScoringEngine
+from src.reports.export import FORMAT_EXTENSIONS, export_report
+from src.scoring.get_rules import get_all_rules
+from src.utils.loader import load_spec
+from src.utils.spec_generator import SpecShape, dump_spec, generate_spec
+from src.utils.validation import VerdictCache
+
+BENCH_VERSION = 1
+DEFAULT_SIZES = (10, 100, 500)
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.2
+# Differences below this many seconds are noise, whatever the ratio.
+NOISE_FLOOR = 0.001
+# Budget for the cumulative import time of the CLI module, as reported by
+# "python -X importtime" (interpreter startup itself is not included).
+IMPORT_BUDGET_MS = 250.0
+STARTUP_MODULE = "src.cli"
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of ``samples``.
+    """
+    ordered = sorted(samples)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def measure(
+    func: Callable[[], Any], repeat: int, trace_memory: bool = True
+) -> Dict[str, float]:
+    """
+    Time ``func`` ``repeat`` times, then run it once more under tracemalloc.
+
+    Returns:
+        dict: Median, p90, p99, min and max wall time in seconds, plus the
+            peak traced allocation in KiB.
+    """
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+
+    stats = summarize_samples(samples)
+    if trace_memory:
+        tracemalloc.start()
+        try:
+            func()
+            stats["peak_kb"] = tracemalloc.get_traced_memory()[1] / 1024
+        finally:
+            tracemalloc.stop()
+    return stats
+
+
+def summarize_samples(samples: List[float]) -> Dict[str, float]:
+    return {
+        "median": percentile(samples, 50),
+        "p90": percentile(samples, 90),
+        "p99": percentile(samples, 99),
+        "min": min(samples),
+        "max": max(samples),
+    }
+
+
+def import_time(module: str = STARTUP_MODULE) -> Tuple[float, List[Tuple[str, float]]]:
+    """
+    Import ``module`` in a fresh interpreter under ``-X importtime``.
+
+    Returns:
+        Tuple[float, List[Tuple[str, float]]]: The cumulative import time of
+            ``module`` in seconds, and every module it pulled in with its own
+            (self) import time, slowest first.
+    """
+    done = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=PROJECT_ROOT,
+    )
+    total = 0.0
+    modules = []
+    # Lines look like "import time:  self [us] | cumulative | name".
+    for line in done.stderr.splitlines():
+        parts = line.removeprefix("import time:").split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        name = parts[2].strip()
+        modules.append((name, int(parts[0]) / 1e6))
+        if name == module:
+            total = int(parts[1]) / 1e6
+    modules.sort(key=lambda item: item[1], reverse=True)
+    return total, modules
+
+
+def bench_startup(repeat: int) -> Dict[str, Dict[str, float]]:
+    """
+    Benchmark CLI startup: the import time of ``src.cli`` and the wall time
+    of ``python -m src.cli --help``, both in fresh interpreters.
+    """
+    imports = [import_time()[0] for _ in range(repeat)]
+
+    def run_help() -> None:
+        subprocess.run(
+            [sys.executable, "-m", STARTUP_MODULE, "--help"],
+            capture_output=True,
+            check=True,
+            cwd=PROJECT_ROOT,
+        )
+
+    return {
+        f"import:{STARTUP_MODULE}": summarize_samples(imports),
+        "cli --help": measure(run_help, repeat, trace_memory=False),
+    }
+
+
+def check_import_budget(
+    results: Dict[str, Any], budget_ms: float = IMPORT_BUDGET_MS
+) -> Optional[Dict[str, Any]]:
+    """
+    Return a budget violation when the median import time of the CLI
+    exceeds ``budget_ms``, else None.
+    """
+    stats = (
+        results.get("results", {}).get("startup", {}).get(f"import:{STARTUP_MODULE}")
+    )
+    if stats is None or stats["median"] * 1000 <= budget_ms:
+        return None
+    return {
+        "stage": f"import:{STARTUP_MODULE}",
+        "budget_ms": budget_ms,
+        "median_ms": round(stats["median"] * 1000, 1),
+        "slowest": [
+            (name, round(seconds * 1000, 1)) for name, seconds in import_time()[1][:5]
+        ],
+    }
+
+
+def bench_size(
+    size: int, repeat: int, validation: str, work_dir: str
+) -> Dict[str, Dict[str, float]]:
+    """
+    Benchmark every pipeline stage on one synthetic spec with ``size`` paths.
+    """
+    spec_path = os.path.join(work_dir, f"spec-{size}.json")
+    with open(spec_path, "w", encoding="utf-8") as f:
+        f.write(dump_spec(generate_spec(SpecShape(paths=size))))
+
+    stages: Dict[str, Dict[str, float]] = {}
+    # A fresh verdict cache keeps validation in every timed run.
+    stages["load_spec"] = measure(
+        lambda: load_spec(spec_path, validation, verdicts=VerdictCache()), repeat
+    )
+    spec = load_spec(spec_path, "off")
+
+    rules = get_all_rules()
+    for rule in rules:
+        stages[f"rule:{rule.name}"] = measure(lambda: rule.apply(spec), repeat)
+
+    def run_engine() -> Dict[str, Any]:
+        engine = ScoringEngine(
+            spec_path, rules=rules, validation=validation, verdicts=VerdictCache()
+        )
+        return engine.run()
+
+    stages["engine.run"] = measure(run_engine, repeat)
+
+    report = run_engine()
+    for fmt, ext in FORMAT_EXTENSIONS.items():
+        output = os.path.join(work_dir, f"report-{size}.{ext}")
+        stages[f"export:{fmt}"] = measure(
+            lambda: export_report(report, fmt, output), repeat
+        )
+    return stages
+
+
+def run_bench(
+    sizes: Iterable[int] = DEFAULT_SIZES,
+    repeat: int = DEFAULT_REPEAT,
+    validation: str = "full",
+    on_stage: Optional[Callable[[Union[int, str], str, Dict[str, float]], None]] = None,
+    startup: bool = True,
+) -> Dict[str, Any]:
+    """
+    Benchmark the scoring pipeline over a matrix of spec sizes.
+
+    Args:
+        sizes (Iterable[int]): Path counts of the synthetic specs.
+        repeat (int): Timed runs per stage.
+        validation (str): Validation level used by ``load_spec`` and the engine.
+        on_stage: Called with ``(size, stage, stats)`` for every stage once
+            a size is done; ``size`` is "startup" for the startup stages.
+        startup (bool): Also benchmark CLI startup, stored under the
+            "startup" key of the results.
+
+    Returns:
+        dict: The benchmark results, ready to be saved as a baseline.
+    """
+    sizes = list(sizes)
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    if startup:
+        results["startup"] = bench_startup(repeat)
+        if on_stage is not None:
+            for stage, stats in results["startup"].items():
+                on_stage("startup", stage, stats)
+    with tempfile.TemporaryDirectory(prefix="api-scoring-bench-") as work_dir:
+        for size in sizes:
+            stages = bench_size(size, repeat, validation, work_dir)
+            results[str(size)] = stages
+            if on_stage is not None:
+                for stage, stats in stages.items():
+                    on_stage(size, stage, stats)
+
+    return {
+        "version": BENCH_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {"sizes": sizes, "repeat": repeat, "validation": validation},
+        "results": results,
+    }
+
+
+def compare(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[Dict[str, Any]]:
+    """
+    Find stages that got slower or hungrier than the baseline.
+
+    A stage regresses when its median time or peak memory exceeds the
+    baseline by more than ``threshold`` (0.2 means 20%). Time differences
+    below ``NOISE_FLOOR`` are ignored. Stages or sizes missing from either
+    side are skipped.
+
+    Returns:
+        List[dict]: One entry per regression with size, stage, metric,
+            baseline and current values and the ratio between them.
+    """
+    regressions = []
+    for size, stages in current.get("results", {}).items():
+        base_stages = baseline.get("results", {}).get(size, {})
+        for stage, stats in stages.items():
+            base = base_stages.get(stage)
+            if base is None:
+                continue
+            for metric, floor in (("median", NOISE_FLOOR), ("peak_kb", 0.0)):
+                if metric not in stats or not base.get(metric):
+                    continue
+                ratio = stats[metric] / base[metric]
+                if ratio > 1 + threshold and stats[metric] - base[metric] > floor:
+                    regressions.append(
+                        {
+                            "size": int(size) if size.isdigit() else size,
+                            "stage": stage,
+                            "metric": metric,
+                            "baseline": base[metric],
+                            "current": stats[metric],
+                            "ratio": round(ratio, 3),
+                        }
+                    )
+    return regressions
+
+
+def load_baseline(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baseline(results: Dict[str, Any], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+
+def format_stage(size: Union[int, str], stage: str, stats: Dict[str, float]) -> str:
+    """
+    One aligned line of the benchmark table.
+    """
+    peak = f"{stats['peak_kb']:>10.0f} KiB" if "peak_kb" in stats else ""
+    return (
+        f"{size:>7} {stage:<38} "
+        f"median {_ms(stats['median'])} p90 {_ms(stats['p90'])} "
+        f"p99 {_ms(stats['p99'])}{peak}"
+    )
+
+
+def format_regression(regression: Dict[str, Any]) -> str:
+    name, scale = ("ms", 1000.0) if regression["metric"] == "median" else ("KiB", 1.0)
+    size = regression["size"]
+    where = f"{size} paths" if isinstance(size, int) else size
+    return (
+        f"REGRESSION {where}, {regression['stage']} "
+        f"{regression['metric']}: {regression['baseline'] * scale:.1f} -> "
+        f"{regression['current'] * scale:.1f} {name} (x{regression['ratio']})"
+    )
+
+
+def format_budget_violation(violation: Dict[str, Any]) -> str:
+    slowest = ", ".join(f"{name} {ms} ms" for name, ms in violation["slowest"])
+    return (
+        f"OVER BUDGET {violation['stage']}: {violation['median_ms']} ms > "
+        f"{violation['budget_ms']} ms (slowest imports: {slowest})"
+    )
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:>10.2f} ms"
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional
+
+from src.scoring.issues import StoredIssue, json_default
+from src.scoring.rules_base import ApplyRule, Rule
+from src.utils.disk_cache import DEFAULT_MAX_BYTES, DiskCache
+
+# Bump whenever the report layout changes so stale entries are not served.
+CACHE_VERSION = "3"
+DEFAULT_CACHE_DIR = os.path.join(".cache", "api-scoring", "results")
+
+
+def rules_fingerprint(rules: Iterable[Rule]) -> str:
+    """
+    Hash the identity, code version, weight and configuration of the given
+    rules.
+
+    Any change to the active rule set (added/removed rules, weights,
+    constructor options or the module defining a rule) yields a different
+    fingerprint.
+    """
+    parts = []
+    for rule in rules:
+        # Adapted apply-only rules are identified by the object they wrap.
+        source = rule.wrapped if isinstance(rule, ApplyRule) else rule
+        parts.append(
+            {
+                "rule": f"{type(source).__module__}.{type(source).__qualname__}",
+                "version": _module_version(type(source).__module__),
+                "name": rule.name,
+                "weight": rule.weight,
+                "config": _canonical(_instance_state(source)),
+            }
+        )
+    payload = json.dumps(parts, sort_keys=True, default=repr)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    Persistent cache of scoring reports keyed by spec content and rule set.
+    """
+
+    def __init__(
+        self, directory: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        self.store = DiskCache(directory, max_bytes, suffix=".json")
+
+    def key(self, content_digest: str, fingerprint: str, *options: str) -> str:
+        """
+        Build the cache key for a spec.
+
+        Args:
+            content_digest (str): sha256 hex digest of the raw spec bytes.
+            fingerprint (str): Result of ``rules_fingerprint`` for the rules.
+            options (str): Further settings that change the report.
+        """
+        parts = (CACHE_VERSION, content_digest, fingerprint, *options)
+        return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        The stored report, its issues as ``StoredIssue`` dicts, or None.
+        """
+        data = self.store.get(key)
+        if data is None:
+            return None
+        try:
+            entry = json.loads(data)
+            report = entry["report"]
+            codes = entry["issue_codes"]
+            issues = report.get("issues", [])
+        except (ValueError, KeyError, TypeError):
+            return None
+        if len(codes) != len(issues):
+            return None
+        report["issues"] = [StoredIssue(i, c) for i, c in zip(issues, codes)]
+        return report
+
+    def put(self, key: str, report: Dict[str, Any]) -> None:
+        """
+        Store ``report``. The codes of its issues' kinds are stored next to
+        it, since the serialized issues leave them out.
+        """
+        codes = [getattr(issue, "code", None) for issue in report.get("issues", [])]
+        entry = {"report": report, "issue_codes": codes}
+        self.store.put(key, json.dumps(entry, default=json_default).encode("utf-8"))
+
+    def clear(self) -> None:
+        self.store.clear()
+
+
+def _instance_state(obj: Any) -> Dict[str, Any]:
+    # Attributes in __dict__ plus those in __slots__ anywhere in the MRO.
+    state = dict(getattr(obj, "__dict__", {}))
+    for cls in type(obj).__mro__:
+        slots = cls.__dict__.get("__slots__", ())
+        for slot in (slots,) if isinstance(slots, str) else slots:
+            if slot not in ("__dict__", "__weakref__") and hasattr(obj, slot):
+                state[slot] = getattr(obj, slot)
+    return state
+
+
+@lru_cache(maxsize=None)
+def _module_version(module_name: str) -> str:
+    """
+    The ``__version__`` of a module, or else a hash of its source file, so
+    that cached reports are not served after the code of a rule changes.
+    """
+    module = sys.modules.get(module_name)
+    version = getattr(module, "__version__", None)
+    if version is not None:
+        return str(version)
+    path = getattr(module, "__file__", None)
+    if not path:
+        return ""
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return ""
+
+
+def _canonical(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (set, frozenset)):
+        return sorted(_canonical(v) for v in value)
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    return value
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import hashlib
+import subprocess
+from dataclasses import dataclass
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
+
+from src.core.incremental import IncrementalScorer
+from src.scoring.rules_base import Rule
+from src.utils.loader import SpecLoadError, decode_spec
+from src.utils.validation import validate_spec
+
+
+class HistoryError(Exception):
+    """Raised when the git history of a spec cannot be read."""
+
+
+@dataclass(frozen=True)
+class Revision:
+    """
+    A commit that touched the spec.
+
+    Attributes:
+        commit (str): Full commit hash.
+        timestamp (int): Committer date as a Unix timestamp.
+        subject (str): First line of the commit message.
+    """
+
+    commit: str
+    timestamp: int
+    subject: str
+
+
+def list_revisions(
+    repo: str, spec_path: str, revisions: str = "HEAD"
+) -> List[Revision]:
+    """
+    Commits in ``revisions`` that touched ``spec_path``, oldest first.
+
+    Args:
+        repo (str): Directory inside a git work tree or a bare repository.
+        spec_path (str): Path of the spec relative to the repository root,
+            even when ``repo`` is a subdirectory.
+        revisions (str): Anything ``git log`` accepts, e.g. "v1.0..main".
+
+    Raises:
+        HistoryError: If git fails, e.g. on an unknown revision.
+    """
+    # ":(top)" makes the pathspec root-relative, like the "commit:path"
+    # names BlobReader reads.
+    out = _git(
+        repo,
+        "log",
+        "--reverse",
+        "--format=%H%x00%ct%x00%s",
+        revisions,
+        "--",
+        f":(top){spec_path}",
+    )
+    found = []
+    for line in out.splitlines():
+        commit, timestamp, subject = line.split("\0", 2)
+        found.append(Revision(commit, int(timestamp), subject))
+    return found
+
+
+class BlobReader:
+    """
+    Reads file contents at given commits through one long-running
+    ``git cat-file --batch`` process, without checking anything out.
+    """
+
+    def __init__(self, repo: str) -> None:
+        try:
+            self._process = subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                cwd=repo,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as e:
+            raise HistoryError(f"Cannot run git: {e}")
+        self._stdin: IO[bytes] = self._process.stdin  # type: ignore[assignment]
+        self._stdout: IO[bytes] = self._process.stdout  # type: ignore[assignment]
+
+    def read(self, commit: str, path: str) -> Optional[Tuple[str, bytes]]:
+        """
+        Return the blob id and content of ``path`` at ``commit``, or None
+        when the file does not exist there.
+        """
+        self._stdin.write(f"{commit}:{path}\n".encode("utf-8"))
+        self._stdin.flush()
+        header = self._stdout.readline().split()
+        if len(header) != 3 or header[1] != b"blob":
+            return None
+        content = self._stdout.read(int(header[2]))
+        self._stdout.read(1)  # trailing newline
+        return header[0].decode("ascii"), content
+
+    def close(self) -> None:
+        self._stdin.close()
+        self._process.wait()
+        self._stdout.close()
+
+    def __enter__(self) -> BlobReader:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def score_history(
+    repo: str,
+    spec_path: str,
+    revisions: str = "HEAD",
+    rules: Optional[List[Rule]] = None,
+    validation: str = "full",
+    max_validation_errors: int = 0,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Score every version of a spec in a range of git revisions.
+
+    Versions are scored oldest first by one ``IncrementalScorer``, so only
+    path items, components and spec-wide checks that changed since the
+    previous version are checked again. A version whose blob was scored
+    before, e.g. after a revert, is not parsed again.
+
+    Args:
+        repo (str): Directory of the git repository.
+        spec_path (str): Path of the spec relative to the repository root.
+        revisions (str): Revision range passed to ``git log``.
+        rules (Optional[List[Rule]]): Rules to apply; defaults to all rules.
+        validation (str): Validation level for every version.
+        max_validation_errors (int): As for ``ScoringEngine``; with 0, an
+            invalid version is reported as an error point.
+
+    Yields:
+        dict: One point per commit with ``commit``, ``timestamp``,
+            ``subject`` and either ``score``, ``grade``, ``issues`` and reuse
+            counters, or ``error``.
+
+    Raises:
+        HistoryError: If the revisions cannot be listed or none of them
+            touched ``spec_path``.
+    """
+    found = list_revisions(repo, spec_path, revisions)
+    if not found:
+        raise HistoryError(f"No commits in {revisions} touched {spec_path}")
+    scorer = IncrementalScorer(rules)
+    # Score, grade and issue count per blob id seen so far.
+    seen: Dict[str, Dict[str, Any]] = {}
+    with BlobReader(repo) as reader:
+        for revision in found:
+            point: Dict[str, Any] = {
+                "commit": revision.commit,
+                "timestamp": revision.timestamp,
+                "subject": revision.subject,
+            }
+            blob = reader.read(revision.commit, spec_path)
+            if blob is None:
+                point["error"] = f"{spec_path} does not exist at this commit"
+                yield point
+                continue
+
+            blob_id, content = blob
+            point["blob"] = blob_id
+            summary = seen.get(blob_id)
+            if summary is not None:
+                point.update(
+                    summary, changed_paths=0, path_checks=0, path_checks_reused=0
+                )
+                yield point
+                continue
+            try:
+                report = _score_blob(scorer, content, validation, max_validation_errors)
+            except SpecLoadError as e:
+                point["error"] = str(e)
+                yield point
+                continue
+            summary = {
+                "score": report["score"],
+                "grade": report["grade"],
+                "issues": len(report.get("issues", [])),
+            }
+            seen[blob_id] = summary
+            stats = scorer.last_stats
+            point.update(
+                summary,
+                changed_paths=len(stats.get("changed_paths", [])),
+                path_checks=stats.get("path_checks", 0),
+                path_checks_reused=stats.get("path_checks_reused", 0),
+            )
+            yield point
+
+
+def _score_blob(
+    scorer: IncrementalScorer,
+    content: bytes,
+    validation: str,
+    max_validation_errors: int,
+) -> Dict[str, Any]:
+    spec = decode_spec(content)
+    errors = validate_spec(
+        spec,
+        validation,
+        digest=hashlib.sha256(content).hexdigest(),
+        max_errors=max(max_validation_errors, 1),
+    )
+    if errors and not max_validation_errors:
+        raise SpecLoadError(f"OpenAPI validation failed: {errors[0]}")
+    return scorer.score(spec)
+
+
+def _git(repo: str, *args: str) -> str:
+    try:
+        done = subprocess.run(
+            ["git", *args], cwd=repo, capture_output=True, text=True, check=True
+        )
+    except OSError as e:
+        raise HistoryError(f"Cannot run git: {e}")
+    except subprocess.CalledProcessError as e:
+        raise HistoryError(e.stderr.strip() or f"git {args[0]} failed")
+    return done.stdout
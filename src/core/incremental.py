@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import marshal
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.core.scoring_engine import build_report, empty_report
+from src.core.spec_index import SpecIndex
+from src.scoring.get_rules import get_all_rules
+from src.scoring.rules_base import Rule, RuleTally, applies_whole_spec, as_rule
+from src.utils.loader import SpecLoadError, decode_spec, read_spec_source
+from src.utils.validation import validate_spec
+
+
+def subtree_digest(obj: Any) -> str:
+    """
+    Content hash of a parsed subtree.
+
+    Plain JSON-like data is serialized with marshal format 2, which is
+    several times faster than ``json.dumps`` and, unlike later formats,
+    does not depend on object sharing. Anything else falls back to JSON.
+    """
+    try:
+        data = marshal.dumps(obj, 2)
+    except ValueError:
+        try:
+            text = json.dumps(obj, default=str, separators=(",", ":"))
+        except (TypeError, ValueError):
+            text = repr(obj)
+        data = text.encode("utf-8")
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _combine(digests: Dict[str, str]) -> str:
+    data = "\n".join(f"{name}={digest}" for name, digest in digests.items())
+    return hashlib.blake2b(data.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class SpecDigests:
+    """
+    Content hashes of every ``paths`` entry, every component and every other
+    top-level key of a spec.
+    """
+
+    def __init__(self, spec: Dict[str, Any]) -> None:
+        paths = spec.get("paths")
+        self.paths: Dict[str, str] = (
+            {path: subtree_digest(item) for path, item in paths.items()}
+            if isinstance(paths, dict)
+            else {}
+        )
+
+        self.components: Dict[str, str] = {}
+        self.sections: Dict[str, str] = {}
+        components = spec.get("components")
+        if isinstance(components, dict):
+            for section, entries in components.items():
+                if isinstance(entries, dict):
+                    section_digests = {
+                        name: subtree_digest(entry) for name, entry in entries.items()
+                    }
+                    for name, digest in section_digests.items():
+                        self.components[f"{section}.{name}"] = digest
+                    self.sections[section] = _combine(section_digests)
+                else:
+                    self.sections[section] = subtree_digest(entries)
+
+        self.keys: Dict[str, str] = {
+            key: subtree_digest(value)
+            for key, value in spec.items()
+            if key not in ("paths", "components")
+        }
+        self.keys["paths"] = (
+            _combine(self.paths) if isinstance(paths, dict) else subtree_digest(paths)
+        )
+        self.keys["components"] = (
+            _combine(self.sections)
+            if isinstance(components, dict)
+            else subtree_digest(components)
+        )
+
+    def of(self, key: str) -> str:
+        """
+        Digest of a top-level key, or of a components section as
+        "components.<section>". Missing keys hash to an empty string.
+        """
+        if key.startswith("components."):
+            return self.sections.get(key.split(".", 1)[1], "")
+        return self.keys.get(key, "")
+
+
+class IncrementalScorer:
+    """
+    Scores successive versions of a spec, reusing per-rule results for every
+    ``paths`` entry and spec-wide check whose inputs did not change.
+
+    Per-path results of a rule are keyed by the hash of the path item plus
+    the hashes of the rule's ``spec_keys``; spec-wide results by the hashes of
+    ``spec_keys`` alone.
+    """
+
+    def __init__(self, rules: Optional[List[Rule]] = None) -> None:
+        self.rules = (
+            [as_rule(r) for r in rules] if rules is not None else get_all_rules()
+        )
+        self.last_stats: Dict[str, Any] = {}
+        self._spec_parts: Dict[int, Tuple[str, RuleTally]] = {}
+        self._path_parts: Dict[Tuple[int, str], Tuple[str, RuleTally]] = {}
+        self._previous: Optional[SpecDigests] = None
+
+    def score(self, spec: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Score ``spec``, recomputing only what changed since the last call.
+
+        Returns:
+            dict: The same report ``ScoringEngine.run`` would produce.
+        """
+        if not spec:
+            return empty_report()
+
+        digests = SpecDigests(spec)
+        index = SpecIndex(spec)
+        path_checks = 0
+        path_parts = 0
+        spec_checks = 0
+        live: set = set()
+        results = []
+
+        for i, rule in enumerate(self.rules):
+            deps = "|".join(digests.of(k) for k in rule.spec_keys if k != "paths")
+            spec_key = "|".join(digests.of(k) for k in rule.spec_keys)
+            if applies_whole_spec(rule):
+                spec_key = _combine(digests.keys)
+
+            tally = RuleTally()
+            cached = self._spec_parts.get(i)
+            if cached is None or cached[0] != spec_key:
+                cached = (spec_key, rule.check_spec(index))
+                self._spec_parts[i] = cached
+                spec_checks += 1
+            tally.add(cached[1])
+
+            # Rules without per-path checks are fully covered by check_spec.
+            if type(rule).check_path is Rule.check_path:
+                results.append((rule, *rule.finalize(tally)))
+                continue
+
+            for entry in index.paths:
+                part_id = (i, entry.path)
+                part_key = f"{digests.paths.get(entry.path, '')}|{deps}"
+                live.add(part_id)
+                path_parts += 1
+                cached = self._path_parts.get(part_id)
+                if cached is None or cached[0] != part_key:
+                    cached = (part_key, rule.check_path(index, entry))
+                    self._path_parts[part_id] = cached
+                    path_checks += 1
+                tally.add(cached[1])
+
+            results.append((rule, *rule.finalize(tally)))
+
+        for part_id in set(self._path_parts) - live:
+            del self._path_parts[part_id]
+
+        self.last_stats = {
+            "paths": len(index.paths),
+            "changed_paths": self._changed(digests.paths, "paths"),
+            "changed_components": self._changed(digests.components, "components"),
+            "spec_checks": spec_checks,
+            "path_checks": path_checks,
+            "path_checks_reused": path_parts - path_checks,
+        }
+        self._previous = digests
+        return build_report(results)
+
+    def _changed(self, current: Dict[str, str], kind: str) -> List[str]:
+        previous: Dict[str, str] = (
+            getattr(self._previous, kind) if self._previous is not None else {}
+        )
+        names = [
+            name for name, digest in current.items() if previous.get(name) != digest
+        ]
+        return names + [name for name in previous if name not in current]
+
+
+class SpecWatcher:
+    """
+    Keeps an ``IncrementalScorer`` resident and rescores a spec file whenever
+    its content changes.
+    """
+
+    def __init__(
+        self,
+        input_path: str,
+        rules: Optional[List[Rule]] = None,
+        validation: str = "full",
+        max_validation_errors: int = 0,
+    ) -> None:
+        if input_path.startswith("http://") or input_path.startswith("https://"):
+            raise SpecLoadError("Watch mode only supports local files.")
+        self.input_path = input_path
+        self.scorer = IncrementalScorer(rules)
+        self.validation = validation
+        self.max_validation_errors = max_validation_errors
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._digest: Optional[str] = None
+
+    def poll(self) -> Optional[Dict[str, Any]]:
+        """
+        Rescore the spec if the file changed since the last poll.
+
+        Returns:
+            Optional[dict]: The new report, or None when nothing changed.
+
+        Raises:
+            SpecLoadError: If the changed file cannot be loaded or is invalid.
+        """
+        try:
+            stat = os.stat(self.input_path)
+        except OSError as e:
+            raise SpecLoadError(f"Failed to load spec: {e}")
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp == self._stamp:
+            return None
+        self._stamp = stamp
+
+        source = read_spec_source(self.input_path)
+        digest = hashlib.sha256(source).hexdigest()
+        if digest == self._digest:
+            return None
+        self._digest = digest
+
+        spec = decode_spec(source)
+        errors = validate_spec(
+            spec,
+            self.validation,
+            digest=digest,
+            max_errors=max(self.max_validation_errors, 1),
+        )
+        if errors and not self.max_validation_errors:
+            raise SpecLoadError(f"OpenAPI validation failed: {errors[0]}")
+
+        report = self.scorer.score(spec)
+        if errors:
+            report["validation"] = {"level": self.validation, "errors": errors}
+        return report
+
+    def run(
+        self,
+        on_report: Callable[[Dict[str, Any]], None],
+        on_error: Callable[[Exception], None],
+        interval: float = 1.0,
+    ) -> None:
+        """
+        Poll forever, calling ``on_report`` after every rescore.
+        """
+        while True:
+            try:
+                report = self.poll()
+            except SpecLoadError as e:
+                on_error(e)
+            else:
+                if report is not None:
+                    on_report(report)
+            time.sleep(interval)
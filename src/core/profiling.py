@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import cProfile
+import os
+import re
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+
+class Profiler:
+    """
+    Records wall time, CPU time and tracemalloc peak of pipeline stages and
+    rules for the ``timings`` section of a report.
+
+    Memory tracing is started on creation (unless already running) and
+    stopped by ``finish``. When ``profile_dir`` is given, every rule also
+    runs under cProfile and its stats are dumped to ``<rule>.prof`` there.
+    """
+
+    def __init__(
+        self, profile_dir: Optional[str] = None, trace_memory: bool = True
+    ) -> None:
+        self.profile_dir = profile_dir
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.rules: Dict[str, Dict[str, float]] = {}
+        self.counters: Dict[str, Dict[str, Any]] = {}
+        self._owns_tracing = trace_memory and not tracemalloc.is_tracing()
+        if self._owns_tracing:
+            tracemalloc.start()
+        if profile_dir:
+            os.makedirs(profile_dir, exist_ok=True)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Measure a pipeline stage such as reading, parsing or validation.
+        """
+        with self._measure(self.stages, name):
+            yield
+
+    @contextmanager
+    def rule(self, name: str) -> Iterator[None]:
+        """
+        Measure one rule, under cProfile when ``profile_dir`` is set.
+        """
+        if not self.profile_dir:
+            with self._measure(self.rules, name):
+                yield
+            return
+
+        profile = cProfile.Profile()
+        with self._measure(self.rules, name):
+            profile.enable()
+            try:
+                yield
+            finally:
+                profile.disable()
+        profile.dump_stats(os.path.join(self.profile_dir, f"{_slug(name)}.prof"))
+
+    def finish(self) -> Dict[str, Any]:
+        """
+        Stop memory tracing and return the recorded timings.
+
+        Returns:
+            dict: ``stages`` and ``rules``, each mapping a name to
+                ``wall_ms``, ``cpu_ms`` and ``peak_kb``, plus the ``total``
+                wall and CPU time of all stages and rules and any
+                ``counters`` recorded by the caller (e.g. memo hit rates).
+        """
+        if self._owns_tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        measured = [*self.stages.values(), *self.rules.values()]
+        timings: Dict[str, Any] = {
+            "stages": self.stages,
+            "rules": self.rules,
+            "total": {
+                "wall_ms": round(sum(m["wall_ms"] for m in measured), 3),
+                "cpu_ms": round(sum(m["cpu_ms"] for m in measured), 3),
+            },
+        }
+        if self.counters:
+            timings["counters"] = self.counters
+        return timings
+
+    @contextmanager
+    def _measure(self, into: Dict[str, Dict[str, float]], name: str) -> Iterator[None]:
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield
+        finally:
+            entry = {
+                "wall_ms": round((time.perf_counter() - wall) * 1000, 3),
+                "cpu_ms": round((time.process_time() - cpu) * 1000, 3),
+            }
+            if tracing:
+                peak = tracemalloc.get_traced_memory()[1] - baseline
+                entry["peak_kb"] = round(max(peak, 0) / 1024, 1)
+            into[name] = entry
+
+
+def format_timings(timings: Dict[str, Any]) -> str:
+    """
+    Render a ``timings`` section as an aligned text table.
+    """
+    lines = [f"{'':<40} {'wall ms':>10} {'cpu ms':>10} {'peak KiB':>10}"]
+    for section in ("stages", "rules"):
+        for name, entry in timings.get(section, {}).items():
+            peak = entry.get("peak_kb")
+            lines.append(
+                f"{name:<40} {entry['wall_ms']:>10.1f} {entry['cpu_ms']:>10.1f} "
+                f"{'' if peak is None else f'{peak:.1f}':>10}"
+            )
+    total = timings.get("total", {})
+    lines.append(
+        f"{'total':<40} {total.get('wall_ms', 0):>10.1f} {total.get('cpu_ms', 0):>10.1f}"
+    )
+    for name, counters in timings.get("counters", {}).items():
+        values = ", ".join(f"{key}={value}" for key, value in counters.items())
+        lines.append(f"{name}: {values}")
+    return "\n".join(lines)
+
+
+def _slug(name: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List
+from urllib.parse import unquote
+
+
+class RefResolutionError(Exception):
+    """Raised when a local $ref does not point at anything."""
+
+
+class RefCycleError(RefResolutionError):
+    """Raised when a chain of $refs loops back on itself."""
+
+    def __init__(self, chain: List[str]) -> None:
+        super().__init__(f"Circular $ref chain: {' -> '.join(chain)}")
+        self.chain = chain
+
+
+class RefResolver:
+    """
+    Resolves local JSON-pointer ``$ref`` values within a single spec.
+
+    Every distinct ref is looked up at most once; later uses are served from
+    a memo. Only local refs (starting with ``#``) are followed.
+    """
+
+    def __init__(self, spec: Dict[str, Any]) -> None:
+        self.spec = spec
+        self._targets: Dict[str, Any] = {}
+        self._resolved: Dict[str, Any] = {}
+
+    @staticmethod
+    def is_local(ref: Any) -> bool:
+        return isinstance(ref, str) and ref.startswith("#")
+
+    def lookup(self, ref: str) -> Any:
+        """
+        Return the object a local ref points at, without following further refs.
+
+        Raises:
+            RefResolutionError: If the pointer is not local or does not exist.
+        """
+        if ref in self._targets:
+            return self._targets[ref]
+        target = self._walk_pointer(ref)
+        self._targets[ref] = target
+        return target
+
+    def resolve(self, obj: Any) -> Any:
+        """
+        Follow ``$ref`` objects until a concrete value is reached.
+
+        Non-ref values are returned unchanged. External refs are returned as
+        the ref object itself, since they cannot be followed.
+
+        Raises:
+            RefResolutionError: If a ref in the chain does not exist.
+            RefCycleError: If the chain refers back to itself.
+        """
+        chain: List[str] = []
+        while isinstance(obj, dict) and self.is_local(obj.get("$ref")):
+            ref = obj["$ref"]
+            if ref in self._resolved:
+                return self._resolved[ref]
+            if ref in chain:
+                raise RefCycleError(chain + [ref])
+            chain.append(ref)
+            obj = self.lookup(ref)
+
+        for ref in chain:
+            self._resolved[ref] = obj
+        return obj
+
+    def _walk_pointer(self, ref: str) -> Any:
+        if not self.is_local(ref):
+            raise RefResolutionError(f"Only local $refs can be resolved: {ref}")
+
+        node: Any = self.spec
+        pointer = unquote(ref[1:])
+        if not pointer:
+            return node
+        if not pointer.startswith("/"):
+            raise RefResolutionError(f"Invalid JSON pointer in $ref: {ref}")
+
+        for token in pointer[1:].split("/"):
+            token = token.replace("~1", "/").replace("~0", "~")
+            if isinstance(node, dict) and token in node:
+                node = node[token]
+            elif isinstance(node, list) and token.isdigit() and int(token) < len(node):
+                node = node[int(token)]
+            else:
+                raise RefResolutionError(f"Unresolvable $ref: {ref}")
+        return node
@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import closing
+from typing import Any, Dict, Generator, List, Optional, Tuple
+
+from src.core.spec_index import SpecIndex
+from src.scoring.issues import RULE_TIMEOUT, Issue
+from src.scoring.rules_base import Rule, RuleTally
+
+EXECUTORS = ("thread", "process")
+# Extra seconds a rule may overrun its deadline inside a single check before
+# the scheduler stops waiting and scores it 0.
+HARD_GRACE = 1.0
+
+RuleOutcome = Tuple[Rule, float, List[Issue]]
+Outcomes = Generator[RuleOutcome, None, None]
+
+
+def run_rule(
+    rule: Rule, index: SpecIndex, timeout: Optional[float] = None
+) -> Tuple[float, List[Issue]]:
+    """
+    Apply one rule, stopping at the first part finished after ``timeout``.
+
+    A rule that runs out of time is scored on the parts it got through,
+    with a ``RULE_TIMEOUT`` issue appended; with no part done it scores 0.
+
+    Args:
+        rule (Rule): The rule to apply.
+        index (SpecIndex): Index of the spec.
+        timeout (Optional[float]): Seconds the rule may take, counted from
+            its start.
+
+    Returns:
+        Tuple[float, List[Issue]]: The score and issues of the rule.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    tally = RuleTally()
+    for part in rule.iter_parts(index):
+        tally.add(part)
+        if deadline is not None and time.monotonic() > deadline:
+            break
+    else:
+        return rule.finalize(tally)
+
+    if tally.total:
+        score, issues = rule.finalize(tally)
+    else:
+        score, issues = 0, tally.issues
+    issues.append(timeout_issue(rule, timeout))
+    return score, issues
+
+
+def timeout_issue(rule: Rule, timeout: Optional[float]) -> Issue:
+    return Issue(
+        RULE_TIMEOUT, "N/A", "GLOBAL", ("rules", rule.name), (rule.name, timeout)
+    )
+
+
+class RuleScheduler:
+    """
+    Runs independent rules concurrently with a deadline per rule.
+
+    Rules only read the spec, so they can share one ``SpecIndex`` across
+    threads. The "thread" executor uses daemon threads: a rule stuck past
+    its deadline is abandoned and a replacement worker is started, so it
+    never blocks the report or interpreter exit. The "process" executor
+    hands the index to each worker process once.
+    It suits rules that hold the GIL for long. Stuck workers are terminated
+    when the run ends.
+
+    The deadline is checked between rule parts, i.e. after the spec-wide
+    check and after each path. A rule past its deadline is scored on the
+    parts it finished. A rule stuck inside a single part for more than
+    ``HARD_GRACE`` extra seconds is scored 0. Both get a timeout issue.
+    """
+
+    def __init__(
+        self,
+        workers: int = 1,
+        rule_timeout: Optional[float] = None,
+        executor: str = "thread",
+    ) -> None:
+        """
+        Args:
+            workers (int): Rules run at the same time.
+            rule_timeout (Optional[float]): Seconds each rule may take; None
+                for no deadline.
+            executor (str): "thread" or "process".
+        """
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unknown rule executor: {executor}")
+        self.workers = max(workers, 1)
+        self.rule_timeout = rule_timeout
+        self.executor = executor
+        self.timed_out: List[str] = []
+
+    def run(self, rules: List[Rule], index: SpecIndex) -> Outcomes:
+        """
+        Apply ``rules`` and yield their outcomes in the order of ``rules``.
+
+        Closing the generator early stops starting further rules.
+        """
+        self.timed_out = []
+        if self.executor == "process":
+            outcomes = self._run_processes(rules, index)
+        else:
+            outcomes = self._run_threads(rules, index)
+        with closing(outcomes):
+            for rule, score, issues in outcomes:
+                if issues and issues[-1].kind is RULE_TIMEOUT:
+                    self.timed_out.append(rule.name)
+                yield rule, score, issues
+
+    def _run_threads(self, rules: List[Rule], index: SpecIndex) -> Outcomes:
+        pending = list(range(len(rules)))
+        pending.reverse()
+        started: Dict[int, float] = {}
+        results: Dict[int, Any] = {}
+        changed = threading.Condition()
+
+        def worker() -> None:
+            while True:
+                with changed:
+                    if not pending:
+                        return
+                    i = pending.pop()
+                    started[i] = time.monotonic()
+                    changed.notify_all()
+                outcome: Any
+                try:
+                    outcome = run_rule(rules[i], index, self.rule_timeout)
+                except Exception as e:
+                    outcome = e
+                with changed:
+                    results.setdefault(i, outcome)
+                    changed.notify_all()
+
+        def spawn() -> None:
+            threading.Thread(target=worker, daemon=True).start()
+
+        for _ in range(min(self.workers, len(rules))):
+            spawn()
+
+        try:
+            for i, rule in enumerate(rules):
+                with changed:
+                    while i not in results:
+                        if self.rule_timeout is None or i not in started:
+                            changed.wait()
+                            continue
+                        limit = started[i] + self.rule_timeout + HARD_GRACE
+                        remaining = limit - time.monotonic()
+                        if remaining <= 0:
+                            # Abandon the stuck thread and keep the pool size.
+                            results[i] = (0, [timeout_issue(rule, self.rule_timeout)])
+                            spawn()
+                            break
+                        changed.wait(remaining)
+                    outcome = results.pop(i)
+                if isinstance(outcome, Exception):
+                    raise outcome
+                score, issues = outcome
+                yield rule, score, issues
+        finally:
+            with changed:
+                pending.clear()
+
+    def _run_processes(self, rules: List[Rule], index: SpecIndex) -> Outcomes:
+        import multiprocessing
+
+        workers = min(self.workers, len(rules))
+        pool = multiprocessing.Pool(workers, _init_process, (index, []))
+        try:
+            start = time.monotonic()
+            pending = [
+                pool.apply_async(_run_in_process, (rule, self.rule_timeout))
+                for rule in rules
+            ]
+            for i, (rule, result) in enumerate(zip(rules, pending)):
+                if self.rule_timeout is None:
+                    score, issues = result.get()
+                else:
+                    # Start times are unknown here, so rule i may take until
+                    # its wave would end if every earlier rule used its budget.
+                    wave = i // workers + 1
+                    limit = start + wave * (self.rule_timeout + HARD_GRACE)
+                    try:
+                        score, issues = result.get(max(limit - time.monotonic(), 0))
+                    except multiprocessing.TimeoutError:
+                        score, issues = 0, [timeout_issue(rule, self.rule_timeout)]
+                yield rule, score, issues
+        finally:
+            pool.terminate()
+            pool.join()
+
+
+class PathShardScheduler(RuleScheduler):
+    """
+    Scores one large spec by splitting its ``paths`` across worker processes.
+
+    Every worker receives the index and the rules once. It then runs ``check_paths`` of every rule over consecutive
+    shards of path entries. The parent runs each rule's ``check_spec`` and
+    adds the shard tallies in path order. It then calls ``finalize``, so the
+    scores and issues equal a serial run exactly. Rules without per-path
+    checks run entirely in the parent.
+    """
+
+    # Shards per worker; more, smaller shards balance uneven paths better.
+    SHARDS_PER_WORKER = 4
+
+    def __init__(self, workers: int = 2) -> None:
+        super().__init__(workers)
+
+    def run(self, rules: List[Rule], index: SpecIndex) -> Outcomes:
+        self.timed_out = []
+        shards = shard_ranges(len(index.paths), self.workers * self.SHARDS_PER_WORKER)
+        sharded = [type(rule).check_path is not Rule.check_path for rule in rules]
+        tallies = [rule.check_spec(index) for rule in rules]
+
+        if len(shards) > 1 and any(sharded):
+            import multiprocessing
+
+            with multiprocessing.Pool(
+                min(self.workers, len(shards)),
+                _init_process,
+                (index, [r for r, s in zip(rules, sharded) if s]),
+            ) as pool:
+                for parts in pool.imap(_check_shard, shards):
+                    shard_parts = iter(parts)
+                    for i, is_sharded in enumerate(sharded):
+                        if is_sharded:
+                            tallies[i].add(next(shard_parts))
+        else:
+            for i, is_sharded in enumerate(sharded):
+                if is_sharded:
+                    tallies[i].add(rules[i].check_paths(index, index.paths))
+
+        for rule, tally in zip(rules, tallies):
+            score, issues = rule.finalize(tally)
+            yield rule, score, issues
+
+
+def shard_ranges(count: int, shards: int) -> List[Tuple[int, int]]:
+    """
+    Split ``range(count)`` into at most ``shards`` consecutive, near-equal
+    ``(start, stop)`` ranges.
+    """
+    shards = max(1, min(shards, count))
+    size, extra = divmod(count, shards)
+    ranges = []
+    start = 0
+    for n in range(shards):
+        stop = start + size + (1 if n < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+_process_index: Optional[SpecIndex] = None
+_process_rules: List[Rule] = []
+
+
+def _init_process(index: SpecIndex, rules: List[Rule]) -> None:
+    # With the default "fork" start method the index is inherited, not
+    # pickled; other start methods pickle it once per worker.
+    global _process_index, _process_rules
+    _process_index = index
+    _process_rules = rules
+
+
+def _check_shard(bounds: Tuple[int, int]) -> List[RuleTally]:
+    assert _process_index is not None
+    entries = _process_index.paths[bounds[0] : bounds[1]]
+    return [rule.check_paths(_process_index, entries) for rule in _process_rules]
+
+
+def _run_in_process(rule: Rule, timeout: Optional[float]) -> Tuple[float, List[Issue]]:
+    assert _process_index is not None
+    return run_rule(rule, _process_index, timeout)
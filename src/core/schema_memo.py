@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+def canonical_key(obj: Any) -> Optional[str]:
+    """
+    Canonical JSON text of ``obj``; equal structures give equal keys.
+
+    Returns None when the object cannot be canonicalized, e.g. a mapping
+    mixing string and integer keys, in which case only identity is used.
+    """
+    try:
+        return json.dumps(obj, sort_keys=True, separators=(",", ":"), default=repr)
+    except (TypeError, ValueError, RecursionError):
+        return None
+
+
+class SchemaMemo:
+    """
+    Per-spec memo of schema verdicts, so each distinct schema is judged once.
+
+    Lookups first try the object identity, which catches the same object
+    reached twice (YAML anchors and aliases, shared ``$ref`` targets). They
+    then try a canonical structural key, which catches equal inline schemas
+    repeated across operations. Verdicts must depend only on the schema and
+    on the spec the memo belongs to.
+
+    Attributes:
+        identity_hits (int): Lookups answered by object identity.
+        structural_hits (int): Lookups answered by an equal schema.
+        misses (int): Lookups that had to run the judge.
+    """
+
+    def __init__(self) -> None:
+        # The schema is kept next to its verdict so its id cannot be reused.
+        self._by_id: Dict[int, Tuple[Any, Any]] = {}
+        self._by_shape: Dict[Hashable, Any] = {}
+        self.identity_hits = 0
+        self.structural_hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        schema: Any,
+        judge: Callable[[Any], Any],
+        key: Callable[[Any], Optional[Hashable]] = canonical_key,
+    ) -> Any:
+        """
+        Return the memoized verdict for ``schema``, calling ``judge`` on a miss.
+
+        Args:
+            schema (Any): The schema to judge.
+            judge: Computes the verdict of a schema.
+            key: Structural key of a schema; schemas with equal keys must get
+                equal verdicts. Defaults to ``canonical_key``; a judge that
+                reads only part of a schema can pass a cheaper projection.
+                Returning None skips the structural lookup.
+        """
+        known = self._by_id.get(id(schema))
+        if known is not None:
+            self.identity_hits += 1
+            return known[1]
+
+        shape = key(schema)
+        if shape is not None and shape in self._by_shape:
+            self.structural_hits += 1
+            verdict = self._by_shape[shape]
+        else:
+            self.misses += 1
+            verdict = judge(schema)
+            if shape is not None:
+                self._by_shape[shape] = verdict
+        self._by_id[id(schema)] = (schema, verdict)
+        return verdict
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Counters plus the share of lookups served from the memo.
+        """
+        lookups = self.identity_hits + self.structural_hits + self.misses
+        hits = lookups - self.misses
+        return {
+            "lookups": lookups,
+            "identity_hits": self.identity_hits,
+            "structural_hits": self.structural_hits,
+            "misses": self.misses,
+            "distinct_shapes": len(self._by_shape),
+            "hit_ratio": round(hits / lookups, 3) if lookups else 0.0,
+        }
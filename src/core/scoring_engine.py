@@ -1,8 +1,33 @@
 from __future__ import annotations
 
-from typing import Any, Dict
-from src.utils.loader import load_spec
+import hashlib
+from contextlib import nullcontext
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+from src.core.cache import ResultCache, rules_fingerprint
+from src.core.scheduler import PathShardScheduler, RuleScheduler
+from src.core.spec_index import SpecIndex
+from src.utils.http import SpecFetcher
+from src.utils.loader import SpecLoadError, decode_spec, read_spec_source
+from src.utils.spec_cache import SpecCache
+from src.utils.validation import VerdictCache, validate_spec
 from src.scoring.get_rules import get_all_rules
+from src.scoring.issues import Issue
+from src.scoring.rules_base import Rule, RuleTally, as_rule
+
+if TYPE_CHECKING:
+    from src.core.profiling import Profiler
 
 
 class ScoringEngine:
@@ -10,10 +35,157 @@ class ScoringEngine:
     Encapsulates the scoring logic for OpenAPI specs.
     """
 
-    def __init__(self, input_path: str) -> None:
+    def __init__(
+        self,
+        input_path: str,
+        rules: Optional[List[Rule]] = None,
+        cache: Optional[ResultCache] = None,
+        validation: str = "full",
+        max_validation_errors: int = 0,
+        verdicts: Optional[VerdictCache] = None,
+        content: Optional[bytes] = None,
+        fetcher: Optional[SpecFetcher] = None,
+        profile: bool = False,
+        profile_dir: Optional[str] = None,
+        rule_workers: int = 1,
+        rule_timeout: Optional[float] = None,
+        rule_executor: str = "thread",
+        path_workers: int = 1,
+        fail_under: Optional[float] = None,
+        lazy: bool = False,
+        spec_cache: Optional[SpecCache] = None,
+    ) -> None:
+        """
+        Args:
+            input_path (str): File path or URL to the OpenAPI spec. Only used
+                as a label when ``content`` is given.
+            rules (Optional[List[Rule]]): Rule instances to apply. Long-running
+                callers pass the same list for every spec instead of paying for
+                ``get_all_rules()`` each time.
+            cache (Optional[ResultCache]): Report cache. When the raw spec bytes
+                and the rule set match a stored entry, parsing, validation and
+                scoring are skipped entirely.
+            validation (str): Validation level: "off", "structural" or "full".
+            max_validation_errors (int): With 0, an invalid spec raises
+                ``SpecLoadError`` as before. Otherwise up to this many
+                validation errors are collected into the report and the spec
+                is scored anyway.
+            verdicts (Optional[VerdictCache]): Cache of validation verdicts by
+                content hash; defaults to the process-wide in-memory cache.
+            content (Optional[bytes]): Raw spec bytes to score instead of
+                reading ``input_path``.
+            fetcher (Optional[SpecFetcher]): Downloader used when
+                ``input_path`` is a URL.
+            profile (bool): Record wall time, CPU time and allocation peak of
+                every pipeline stage and rule into a ``timings`` section of
+                the report. Timings are never stored in the result cache.
+            profile_dir (Optional[str]): Also dump cProfile stats of every
+                rule into this directory; implies ``profile``.
+            rule_workers (int): Rules scored at the same time; see
+                ``RuleScheduler``.
+            rule_timeout (Optional[float]): Seconds each rule may take before
+                it is reported as timed out. Reports with a timed-out rule
+                are not cached.
+            rule_executor (str): "thread" or "process" for concurrent rules.
+            path_workers (int): Split ``paths`` across this many worker
+                processes; see ``PathShardScheduler``. Cannot be combined
+                with ``rule_workers`` or ``rule_timeout``.
+            fail_under (Optional[float]): Score the spec must reach. Rules
+                then run cheapest first (see ``Rule.cost``) and scoring stops
+                as soon as the rules left cannot lift the score to this
+                value. The report gets a ``gate`` section; stopped reports
+                are not cached.
+            lazy (bool): Decode path items and component entries of a JSON
+                spec only when a rule first reads them, so memory follows
+                what the selected rules touch. Pair it with
+                ``validation="off"``, since validation reads everything.
+            spec_cache (Optional[SpecCache]): Snapshots of parsed specs.
+                When the rules changed but the spec bytes did not, parsing
+                is skipped; with a persistent ``verdicts`` cache, so is
+                validation. Not used with ``lazy``.
+
+        Raises:
+            ValueError: If both path sharding and rule scheduling are set.
+        """
         self.input_path = input_path
-        self.spec = load_spec(input_path)
-        self.rules = get_all_rules()
+        self.rules = (
+            [as_rule(r) for r in rules] if rules is not None else get_all_rules()
+        )
+        self.fail_under = fail_under
+        if fail_under is not None:
+            self.rules = order_by_cost(self.rules)
+        self.cache = cache
+        self.validation = validation
+        self.max_validation_errors = max_validation_errors
+        self.validation_errors: List[str] = []
+        self.cache_key: Optional[str] = None
+        self.cached_report: Optional[Dict[str, Any]] = None
+        self.profiler: Optional[Profiler] = None
+        if profile or profile_dir is not None:
+            from src.core.profiling import Profiler
+
+            self.profiler = Profiler(profile_dir)
+        self.scheduler: Optional[RuleScheduler] = None
+        if path_workers > 1:
+            if rule_workers > 1 or rule_timeout is not None:
+                raise ValueError(
+                    "path_workers cannot be combined with rule_workers or rule_timeout"
+                )
+            self.scheduler = PathShardScheduler(path_workers)
+        elif rule_workers > 1 or rule_timeout is not None:
+            self.scheduler = RuleScheduler(rule_workers, rule_timeout, rule_executor)
+
+        with self._stage("read"):
+            source = (
+                content
+                if content is not None
+                else read_spec_source(input_path, fetcher)
+            )
+            self.digest = hashlib.sha256(source).hexdigest()
+        if cache is not None:
+            with self._stage("cache_lookup"):
+                self.cache_key = cache.key(
+                    self.digest,
+                    rules_fingerprint(self.rules),
+                    validation,
+                    str(max_validation_errors),
+                )
+                self.cached_report = cache.get(self.cache_key)
+
+        self.spec: Dict[str, Any] = {}
+        if self.cached_report is None:
+            snapshots = None if lazy else spec_cache
+            snapshot = None
+            if snapshots is not None:
+                with self._stage("snapshot_lookup"):
+                    snapshot = snapshots.get(self.digest)
+            if snapshot is not None:
+                self.spec = snapshot
+            else:
+                with self._stage("parse"):
+                    self.spec = decode_spec(source, lazy)
+            with self._stage("validate"):
+                self._validate(verdicts)
+            if snapshots is not None and snapshot is None:
+                with self._stage("snapshot_store"):
+                    snapshots.put(self.digest, self.spec)
+
+    def _stage(self, name: str) -> ContextManager[None]:
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.stage(name)
+
+    def _validate(self, verdicts: Optional[VerdictCache]) -> None:
+        errors = validate_spec(
+            self.spec,
+            self.validation,
+            digest=self.digest,
+            max_errors=max(self.max_validation_errors, 1),
+            verdicts=verdicts,
+        )
+        if errors and not self.max_validation_errors:
+            raise SpecLoadError(f"OpenAPI validation failed: {errors[0]}")
+        self.validation_errors = errors
 
     def run(self) -> Dict[str, Any]:
         """
@@ -22,42 +194,74 @@ class ScoringEngine:
         Returns:
             dict: The report including overall score, grade, per-rule scores, and issues.
         """
+        if self.cached_report is not None:
+            report = self._with_gate(self.cached_report)
+            if self.profiler is not None:
+                return {**report, "timings": self.profiler.finish()}
+            return report
 
-        if not self.spec:
-            return {
-                "score": "0",
-                "grade": "F",
-                "issues": [{"description": "Empty OpenAPI specification provided."}],
-            }
-
-        total_score = 0.0
-        criteria = []
-        issues = []
-
-        for rule in self.rules:
-            rule_score, rule_issues = rule.apply(self.spec)
-            weighted_score = rule.weight * (rule_score / 100)
-            total_score += weighted_score
-
-            criteria.append(
-                {
-                    "name": rule.name,
-                    "score": rule_score,
-                    "weight": rule.weight,
-                }
+        report = self._score()
+        partial = (self.scheduler is not None and self.scheduler.timed_out) or (
+            "gate" in report and report["gate"]["skipped_rules"]
+        )
+        if self.cache is not None and self.cache_key is not None and not partial:
+            self.cache.put(
+                self.cache_key,
+                {k: v for k, v in report.items() if k not in ("timings", "gate")},
             )
-            issues.extend(rule_issues)
+        return report
 
-        rounded_score = round(total_score, 2)
+    def _with_gate(self, report: Dict[str, Any]) -> Dict[str, Any]:
+        if self.fail_under is None:
+            return report
+        if "criteria" not in report:
+            # A cached empty spec: nothing was scored.
+            return empty_report(self.fail_under)
+        gate = gate_section(report["score"], self.fail_under)
+        return {**report, "gate": gate}
 
-        grade = self._grade_from_score(rounded_score)
+    def stream(self) -> ReportStream:
+        """
+        Score the spec lazily, yielding issues as the rules produce them.
+
+        Only the current path item's issues and the per-rule counters are held
+        in memory. The stream does not populate the result cache, since the
+        full report never exists; cached reports are replayed, though.
 
-        return {
-            "score": rounded_score,
-            "grade": grade,
-            "criteria": criteria,
-            "issues": issues,
+        Returns:
+            ReportStream: Iterate it for the issues, then call ``summary()``.
+        """
+        if self.cached_report is not None:
+            return StoredReportStream(
+                self._with_gate(self.cached_report), self.profiler
+            )
+        if not self.spec:
+            return StoredReportStream(empty_report(self.fail_under), self.profiler)
+
+        extra: Dict[str, Any] = {}
+        if self.validation_errors:
+            extra["validation"] = {
+                "level": self.validation,
+                "errors": self.validation_errors,
+            }
+        with self._stage("index"):
+            index = SpecIndex(self.spec)
+        if self.scheduler is not None:
+            return ScheduledReportStream(
+                self.rules, index, extra, self.profiler, self.scheduler, self.fail_under
+            )
+        return ReportStream(self.rules, index, extra, self.profiler, self.fail_under)
+
+    def _score(self) -> Dict[str, Any]:
+        stream = self.stream()
+        issues = list(stream)
+        report = stream.summary()
+        trailing: Dict[str, Any] = {
+            k: report.pop(k) for k in ("validation", "timings") if k in report
         }
+        report["issues"] = issues
+        report.update(trailing)
+        return report
 
     @staticmethod
     def _grade_from_score(score: float) -> str:
@@ -73,3 +277,243 @@ class ScoringEngine:
             return "E"
         else:
             return "F"
+
+
+def order_by_cost(rules: Iterable[Rule]) -> List[Rule]:
+    """
+    Rules sorted by ``cost``, cheapest first; ties keep their order.
+    """
+    return sorted(rules, key=lambda rule: getattr(rule, "cost", 1.0))
+
+
+def gate_section(
+    score: float, fail_under: float, skipped: Iterable[str] = ()
+) -> Dict[str, Any]:
+    """
+    The ``gate`` section of a report scored against ``fail_under``.
+    """
+    return {
+        "fail_under": fail_under,
+        "passed": score >= fail_under,
+        "skipped_rules": list(skipped),
+    }
+
+
+def empty_report(fail_under: Optional[float] = None) -> Dict[str, Any]:
+    """
+    The report of an empty spec. Nothing was scored, so with ``fail_under``
+    its ``gate`` section fails whatever the threshold.
+    """
+    report: Dict[str, Any] = {
+        "score": "0",
+        "grade": "F",
+        "issues": [{"description": "Empty OpenAPI specification provided."}],
+    }
+    if fail_under is not None:
+        report["gate"] = {**gate_section(0, fail_under), "passed": False}
+    return report
+
+
+class ReportStream:
+    """
+    Issues of a report produced rule by rule and path item by path item.
+
+    Iterate the stream once to obtain the issues; ``summary()`` then returns
+    the score, grade and criteria computed from the counters along the way.
+
+    With ``fail_under``, the stream stops before the next rule once the
+    score of the rules run so far plus the weights of the rules left is
+    below it; the skipped rules are listed in the ``gate`` section.
+    """
+
+    def __init__(
+        self,
+        rules: Iterable[Rule],
+        index: SpecIndex,
+        extra: Optional[Dict[str, Any]] = None,
+        profiler: Optional[Profiler] = None,
+        fail_under: Optional[float] = None,
+    ) -> None:
+        self.rules = list(rules)
+        self.index = index
+        self.extra = extra or {}
+        self.profiler = profiler
+        self.fail_under = fail_under
+        self.scores: List[Tuple[Rule, float]] = []
+        self.skipped: List[Rule] = []
+        self.done = False
+
+    def __iter__(self) -> Iterator[Mapping[str, str]]:
+        for i, rule in enumerate(self.rules):
+            if self._out_of_reach(i):
+                break
+            if self.profiler is None:
+                yield from self._run_rule(rule)
+            else:
+                # Time spent by the consumer between issues counts towards
+                # the rule; ScoringEngine.run only collects them.
+                with self.profiler.rule(rule.name):
+                    yield from self._run_rule(rule)
+        self.done = True
+
+    def _run_rule(self, rule: Rule) -> Iterator[Issue]:
+        tally = RuleTally()
+        for part in rule.iter_parts(self.index):
+            tally.passed += part.passed
+            tally.total += part.total
+            yield from part.issues
+        rule_score, trailing = rule.finalize(tally)
+        yield from trailing
+        self.scores.append((rule, rule_score))
+
+    def _out_of_reach(self, done: int) -> bool:
+        """
+        Whether ``fail_under`` is missed even if every rule from ``done`` on
+        scores 100; records those rules as skipped if so.
+        """
+        if self.fail_under is None or done == len(self.rules):
+            return False
+        left = self.rules[done:]
+        reachable = sum(rule.weight * score / 100 for rule, score in self.scores)
+        reachable += sum(rule.weight for rule in left)
+        if round(reachable, 2) >= self.fail_under:
+            return False
+        self.skipped = left
+        return True
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Score, grade, criteria and any extra sections, without issues.
+
+        Raises:
+            RuntimeError: If the stream has not been fully consumed.
+        """
+        if not self.done:
+            raise RuntimeError("ReportStream must be consumed before summary().")
+        report = summarize_scores(self.scores)
+        if self.fail_under is not None:
+            report["gate"] = gate_section(
+                report["score"], self.fail_under, [r.name for r in self.skipped]
+            )
+        report.update(self.extra)
+        if self.profiler is not None:
+            self.profiler.counters["schema_memo"] = self.index.schema_memo.stats()
+            report["timings"] = self.profiler.finish()
+        return report
+
+
+class ScheduledReportStream(ReportStream):
+    """
+    Report stream whose rules run on a ``RuleScheduler`` or are sharded by
+    path on a ``PathShardScheduler``.
+
+    Issues are still yielded in rule order, each rule's issues as soon as it
+    and every rule before it have finished. With profiling, all rules are
+    timed together as the "rules" stage. With ``fail_under``, rules already
+    running when the score goes out of reach are discarded and no further
+    rules are started.
+    """
+
+    def __init__(
+        self,
+        rules: Iterable[Rule],
+        index: SpecIndex,
+        extra: Optional[Dict[str, Any]],
+        profiler: Optional[Profiler],
+        scheduler: RuleScheduler,
+        fail_under: Optional[float] = None,
+    ) -> None:
+        super().__init__(rules, index, extra, profiler, fail_under)
+        self.scheduler = scheduler
+
+    def __iter__(self) -> Iterator[Mapping[str, str]]:
+        stage = nullcontext() if self.profiler is None else self.profiler.stage("rules")
+        with stage:
+            outcomes = self.scheduler.run(self.rules, self.index)
+            for i, (rule, rule_score, issues) in enumerate(outcomes):
+                yield from issues
+                self.scores.append((rule, rule_score))
+                if self._out_of_reach(i + 1):
+                    outcomes.close()
+                    break
+        self.done = True
+
+
+class StoredReportStream(ReportStream):
+    """
+    Replays the issues of an already computed report.
+    """
+
+    def __init__(
+        self, report: Dict[str, Any], profiler: Optional[Profiler] = None
+    ) -> None:
+        self.report = report
+        self.profiler = profiler
+
+    def __iter__(self) -> Iterator[Mapping[str, str]]:
+        return iter(self.report.get("issues", []))
+
+    def summary(self) -> Dict[str, Any]:
+        report = {k: v for k, v in self.report.items() if k != "issues"}
+        if self.profiler is not None:
+            report["timings"] = self.profiler.finish()
+        return report
+
+
+def build_report(
+    results: Iterable[Tuple[Rule, float, List[Issue]]],
+) -> Dict[str, Any]:
+    """
+    Combine per-rule results into the report layout.
+
+    Args:
+        results: ``(rule, score, issues)`` for every applied rule, in order.
+
+    Returns:
+        dict: The report including overall score, grade, per-rule scores, and issues.
+    """
+    scores: List[Tuple[Rule, float]] = []
+    issues: List[Mapping[str, str]] = []
+    for rule, rule_score, rule_issues in results:
+        scores.append((rule, rule_score))
+        issues.extend(rule_issues)
+
+    report = summarize_scores(scores)
+    report["issues"] = issues
+    return report
+
+
+def summarize_scores(scores: Iterable[Tuple[Rule, float]]) -> Dict[str, Any]:
+    """
+    Weighted overall score, grade and per-rule criteria.
+
+    Args:
+        scores: ``(rule, score)`` for every applied rule, in order.
+
+    Returns:
+        dict: The report without its ``issues``.
+    """
+    total_score = 0.0
+    criteria = []
+
+    for rule, rule_score in scores:
+        weighted_score = rule.weight * (rule_score / 100)
+        total_score += weighted_score
+
+        criteria.append(
+            {
+                "name": rule.name,
+                "score": rule_score,
+                "weight": rule.weight,
+            }
+        )
+
+    rounded_score = round(total_score, 2)
+
+    grade = ScoringEngine._grade_from_score(rounded_score)
+
+    return {
+        "score": rounded_score,
+        "grade": grade,
+        "criteria": criteria,
+    }
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import json
+import logging
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from src.core.scoring_engine import ScoringEngine
+from src.reports.export import render_report
+from src.scoring.get_rules import get_all_rules
+from src.scoring.rules_base import Rule
+from src.utils.loader import SpecLoadError
+from src.utils.validation import VALIDATION_LEVELS
+
+DEFAULT_MAX_BODY_BYTES = 32 * 1024 * 1024
+logger = logging.getLogger(__name__)
+CONTENT_TYPES = {
+    "json": "application/json",
+    "markdown": "text/markdown; charset=utf-8",
+    "html": "text/html; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+
+class RequestError(Exception):
+    """Raised for a malformed scoring request; carries the HTTP status."""
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class ScoringService:
+    """
+    Scores specs with rule instances and caches that live as long as the
+    process, so each request only pays for parsing, validation and scoring.
+    """
+
+    def __init__(
+        self, rules: Optional[List[Rule]] = None, **engine_options: Any
+    ) -> None:
+        """
+        Args:
+            rules (Optional[List[Rule]]): Rule instances shared by all requests.
+            engine_options: Default ``ScoringEngine`` keyword arguments (cache,
+                verdicts, validation, max_validation_errors).
+        """
+        self.rules = rules if rules is not None else get_all_rules()
+        self.engine_options = engine_options
+        if engine_options.get("validation", "full") == "full":
+            # Pay for the validator import at startup rather than on the first
+            # request.
+            import openapi_spec_validator.shortcuts  # noqa: F401
+
+    def score(
+        self,
+        input_path: str,
+        content: Optional[bytes] = None,
+        **overrides: Any,
+    ) -> Dict[str, Any]:
+        """
+        Score a spec given by location or by its raw bytes.
+
+        Args:
+            input_path (str): File path or URL, or a label when ``content``
+                is given.
+            content (Optional[bytes]): Raw spec bytes.
+            overrides: Per-request ``ScoringEngine`` options.
+
+        Returns:
+            dict: The scoring report.
+
+        Raises:
+            SpecLoadError: If the spec cannot be loaded or is invalid.
+        """
+        options = {**self.engine_options, **overrides}
+        engine = ScoringEngine(input_path, rules=self.rules, content=content, **options)
+        return engine.run()
+
+    def handle(
+        self, method: str, target: str, body: Optional[bytes]
+    ) -> Tuple[int, str, str]:
+        """
+        Answer one HTTP request.
+
+        Routes:
+            GET /health: Liveness check listing the loaded rules.
+            POST /score: Score the YAML or JSON spec sent as request body.
+            GET /score?path=...: Score a spec file or URL.
+
+        The ``validation``, ``max_validation_errors`` and ``format`` (json,
+        markdown, html or ndjson) query parameters apply to both /score routes.
+        Any other failure, e.g. a rule raising on a malformed spec scored
+        with ``validation=off``, is logged and answered with status 500.
+
+        Returns:
+            Tuple[int, str, str]: Status code, content type and response body.
+        """
+        url = urlsplit(target)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        try:
+            if url.path == "/health" and method == "GET":
+                payload = {"status": "ok", "rules": [r.name for r in self.rules]}
+                return 200, CONTENT_TYPES["json"], json.dumps(payload)
+            if url.path != "/score":
+                raise RequestError(404, f"Unknown endpoint: {url.path}")
+
+            fmt = query.get("format", "json")
+            if fmt not in CONTENT_TYPES:
+                raise RequestError(400, f"Unsupported format: {fmt}")
+            overrides = self._overrides(query)
+            if method == "POST" and body:
+                report = self.score("<request body>", content=body, **overrides)
+            elif query.get("path"):
+                report = self.score(query["path"], **overrides)
+            else:
+                raise RequestError(400, "Send a spec as request body or ?path=...")
+            return 200, CONTENT_TYPES[fmt], render_report(report, fmt)
+        except RequestError as e:
+            return e.status, CONTENT_TYPES["json"], json.dumps({"error": str(e)})
+        except SpecLoadError as e:
+            return 422, CONTENT_TYPES["json"], json.dumps({"error": str(e)})
+        except Exception as e:
+            logger.exception("Failed to answer %s %s", method, target)
+            message = f"Internal error: {type(e).__name__}: {e}"
+            return 500, CONTENT_TYPES["json"], json.dumps({"error": message})
+
+    @staticmethod
+    def _overrides(query: Dict[str, str]) -> Dict[str, Any]:
+        overrides: Dict[str, Any] = {}
+        if "validation" in query:
+            if query["validation"] not in VALIDATION_LEVELS:
+                raise RequestError(
+                    400, f"Unsupported validation level: {query['validation']}"
+                )
+            overrides["validation"] = query["validation"]
+        if "max_validation_errors" in query:
+            value = query["max_validation_errors"]
+            if not value.isdigit():
+                raise RequestError(400, f"Invalid max_validation_errors: {value}")
+            overrides["max_validation_errors"] = int(value)
+        return overrides
+
+
+class ScoringRequestHandler(BaseHTTPRequestHandler):
+    """
+    Thin HTTP adapter around the server's ``ScoringService``.
+    """
+
+    server: "ScoringServer"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        self._respond(*self.server.service.handle("GET", self.path, None))
+
+    def do_POST(self) -> None:
+        header = self.headers.get("Content-Length") or "0"
+        if not header.strip().isdigit():
+            self.close_connection = True
+            message = f"Invalid Content-Length: {header}"
+            self._respond(400, CONTENT_TYPES["json"], json.dumps({"error": message}))
+            return
+        length = int(header)
+        if length > self.server.max_body_bytes:
+            self.close_connection = True
+            message = f"Request body exceeds {self.server.max_body_bytes} bytes"
+            self._respond(413, CONTENT_TYPES["json"], json.dumps({"error": message}))
+            return
+        body = self.rfile.read(length) if length else b""
+        self._respond(*self.server.service.handle("POST", self.path, body))
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+    def _respond(self, status: int, content_type: str, body: str) -> None:
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class ScoringServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server answering each request on its own thread.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        service: ScoringService,
+        max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+        quiet: bool = False,
+    ) -> None:
+        super().__init__(address, ScoringRequestHandler)
+        self.service = service
+        self.max_body_bytes = max_body_bytes
+        self.quiet = quiet
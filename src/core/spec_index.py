@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from src.core.ref_resolver import RefResolver
+from src.core.schema_memo import SchemaMemo
+
+HTTP_METHODS = ("get", "put", "post", "delete", "options", "head", "patch", "trace")
+PATH_PARAM_PATTERN = re.compile(r"\{[^}]+}")
+# Component sections whose entries embed schemas under a "schema" key.
+SCHEMA_BEARING_COMPONENTS = ("parameters", "headers", "requestBodies", "responses")
+
+# Structured location of a node: dict keys as strings, list indices as ints.
+Location = Tuple[Union[str, int], ...]
+SchemaLocation = Tuple[Any, Location, str, str]
+# (parent link, key) chain from a walk's base location down to a node.
+_Link = Optional[Tuple[Any, Union[str, int]]]
+
+
+def normalize_path(path: str) -> str:
+    """
+    Normalize a path template so that equivalent routes compare equal.
+
+    Query strings and trailing slashes are dropped, the path is lower-cased
+    and every path parameter is replaced with ``{id}``.
+    """
+    path = path.split("?")[0].lower().rstrip("/")
+    return PATH_PARAM_PATTERN.sub("{id}", path)
+
+
+@dataclass(frozen=True, slots=True)
+class Operation:
+    """
+    A single HTTP operation found under ``paths``.
+
+    Attributes:
+        path (str): Path template as written in the spec.
+        method (str): Lower-cased HTTP method.
+        key (str): Method key exactly as written in the spec.
+        operation (Dict[str, Any]): The raw operation object.
+        normalized_path (str): Result of ``normalize_path(path)``.
+        security (List[Any]): Effective security requirements (the
+            operation's own, falling back to the global ``security``).
+        responses (Any): The operation's ``responses`` object.
+        request_body (Any): The operation's ``requestBody`` object.
+    """
+
+    path: str
+    method: str
+    key: str
+    operation: Dict[str, Any]
+    normalized_path: str
+    security: Any
+    responses: Any
+    request_body: Any
+
+
+@dataclass(slots=True)
+class PathEntry:
+    """
+    A ``paths`` entry together with the operations it defines.
+
+    ``item`` is kept even when it is not a mapping, since some rules still
+    judge the path template itself.
+    """
+
+    path: str
+    item: Any
+    normalized_path: str
+    operations: List[Operation] = field(default_factory=list)
+
+
+class SpecIndex:
+    """
+    Precomputed view of an OpenAPI spec shared by all rules.
+
+    The ``paths`` object is traversed exactly once, on first use; rules then
+    iterate the resulting entries instead of re-walking the raw document.
+    With a lazily decoded spec (see ``lazy_loads``), rules that never look
+    at ``paths`` never decode it.
+    """
+
+    def __init__(self, spec: Dict[str, Any]) -> None:
+        self.spec = spec
+        self._paths: Optional[List[PathEntry]] = None
+        self._operations: Optional[List[Operation]] = None
+        self._schema_locations: Optional[List[SchemaLocation]] = None
+        self._resolver: Optional[RefResolver] = None
+        self._schema_memo: Optional[SchemaMemo] = None
+
+    @property
+    def paths(self) -> List[PathEntry]:
+        """
+        One entry per ``paths`` item, in document order.
+        """
+        if self._paths is None:
+            self._paths = list(self._iter_path_entries())
+        return self._paths
+
+    @property
+    def operations(self) -> List[Operation]:
+        """
+        Every operation of every ``paths`` item, in document order.
+        """
+        if self._operations is None:
+            self._operations = [op for entry in self.paths for op in entry.operations]
+        return self._operations
+
+    def iter_operations(self) -> Iterator[Operation]:
+        """
+        Yield operations without indexing all of ``paths`` first, so checks
+        that stop at the first match only decode the path items they reach.
+        """
+        if self._paths is not None:
+            return iter(self.operations)
+        return (op for entry in self._iter_path_entries() for op in entry.operations)
+
+    def _iter_path_entries(self) -> Iterator[PathEntry]:
+        paths = self.spec.get("paths") or {}
+        global_security = self.spec.get("security", [])
+        for path, item in paths.items():
+            entry = PathEntry(path, item, normalize_path(path))
+            if isinstance(item, dict):
+                for key, op in item.items():
+                    method = key.lower()
+                    if method not in HTTP_METHODS or not isinstance(op, dict):
+                        continue
+                    entry.operations.append(
+                        Operation(
+                            path=path,
+                            method=method,
+                            key=key,
+                            operation=op,
+                            normalized_path=entry.normalized_path,
+                            security=op.get("security", global_security),
+                            responses=op.get("responses", {}),
+                            request_body=op.get("requestBody", {}),
+                        )
+                    )
+            yield entry
+
+    def operations_for(self, methods: Iterable[str]) -> Iterator[Operation]:
+        """
+        Yield operations whose lower-cased method is in ``methods``.
+        """
+        allowed = set(methods)
+        return (op for op in self.operations if op.method in allowed)
+
+    @property
+    def components(self) -> Dict[str, Any]:
+        return self.spec.get("components") or {}
+
+    @property
+    def resolver(self) -> RefResolver:
+        """
+        Memoizing ``$ref`` resolver shared by all rules for this spec.
+        """
+        if self._resolver is None:
+            self._resolver = RefResolver(self.spec)
+        return self._resolver
+
+    @property
+    def schema_memo(self) -> SchemaMemo:
+        """
+        Memo of schema verdicts shared by all rules for this spec.
+        """
+        if self._schema_memo is None:
+            self._schema_memo = SchemaMemo()
+        return self._schema_memo
+
+    @property
+    def schema_locations(self) -> List[SchemaLocation]:
+        """
+        Every schema reachable from an operation or from ``components``.
+
+        Returns:
+            List of ``(schema, location, path, operation)`` tuples. Computed on
+            first access so rules that never look at schemas do not pay for it.
+        """
+        if self._schema_locations is None:
+            found: List[SchemaLocation] = []
+            for op in self.operations:
+                found.extend(self.operation_schema_locations(op))
+            found.extend(self.component_schema_locations())
+            self._schema_locations = found
+        return self._schema_locations
+
+    @staticmethod
+    def operation_schema_locations(op: Operation) -> List[SchemaLocation]:
+        """
+        Schemas embedded anywhere inside one operation.
+        """
+        return list(
+            walk_schemas(op.operation, ("paths", op.path, op.key), op.path, op.key)
+        )
+
+    def component_schema_locations(self) -> List[SchemaLocation]:
+        """
+        Schemas defined or embedded under ``components``.
+        """
+        found: List[SchemaLocation] = []
+        for section in SCHEMA_BEARING_COMPONENTS:
+            entries = self.components.get(section)
+            if isinstance(entries, dict):
+                for name, entry in entries.items():
+                    found.extend(
+                        walk_schemas(entry, ("components", section, str(name)))
+                    )
+
+        for name, schema in (self.components.get("schemas") or {}).items():
+            found.append((schema, ("components", "schemas", str(name)), "N/A", "N/A"))
+
+        return found
+
+
+def walk_schemas(
+    obj: Any, base: Location, path: str = "N/A", operation: str = "N/A"
+) -> Iterator[SchemaLocation]:
+    """
+    Yield every schema found under a ``schema`` key anywhere inside ``obj``.
+
+    The walk is iterative with an explicit stack, so nesting depth is not
+    bounded by the recursion limit, and visits nodes in document order.
+    Locations are carried as ``(parent, key)`` links and only turned into a
+    ``Location`` tuple for the schemas actually yielded.
+
+    Args:
+        obj (Any): Any part of the spec, e.g. an operation or a component.
+        base (Location): Location of ``obj`` itself.
+        path (str): Path reported with every schema.
+        operation (str): Operation reported with every schema.
+
+    Returns:
+        Iterator of ``(schema, location, path, operation)`` tuples.
+    """
+    stack: List[Tuple[Any, _Link]] = [(obj, None)]
+    while stack:
+        node, link = stack.pop()
+        if isinstance(node, dict):
+            if "schema" in node:
+                yield node["schema"], _unwind(base, (link, "schema")), path, operation
+            stack.extend(
+                (v, (link, k if isinstance(k, str) else str(k)))
+                for k, v in reversed(node.items())
+            )
+        elif isinstance(node, list):
+            stack.extend((node[i], (link, i)) for i in range(len(node) - 1, -1, -1))
+
+
+def _unwind(base: Location, link: _Link) -> Location:
+    keys: List[Union[str, int]] = []
+    while link is not None:
+        link, key = link
+        keys.append(key)
+    keys.reverse()
+    return base + tuple(keys)
@@ -3,15 +3,17 @@ from typing import Dict, Any
 from src.core.scoring_engine import ScoringEngine
 
 
-def main(input_path: str) -> Dict[str, Any]:
+def main(input_path: str, **engine_options: Any) -> Dict[str, Any]:
     """
     Main function to produce a report for the given OpenAPI spec.
 
     Args:
         input_path (str): File path or URL to the OpenAPI spec.
+        engine_options: Extra ``ScoringEngine`` arguments such as ``cache``,
+            ``validation`` or ``max_validation_errors``.
 
     Returns:
         dict: Report including score, grade, subscores, and issues.
     """
-    engine = ScoringEngine(input_path)
+    engine = ScoringEngine(input_path, **engine_options)
     return engine.run()
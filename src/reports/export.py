@@ -1,30 +1,100 @@
 import json
-from typing import Dict
-from markdown2 import markdown  # type: ignore
+from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, TextIO, Union
+
+from src.scoring.issues import json_default
+
+FORMAT_EXTENSIONS = {
+    "json": "json",
+    "markdown": "md",
+    "html": "html",
+    "ndjson": "ndjson",
+}
+
+Summary = Union[Dict[str, Any], Callable[[], Dict[str, Any]]]
 
 
 def export_report(report: Dict, fmt: str, output_path: str) -> None:
     """
     Export the report dictionary to the given format and write to output_path.
-    Supported formats: json, markdown, html.
+    Supported formats: json, markdown, html, ndjson. Large HTML reports also
+    write issue pages next to output_path, see ``write_html``.
 
     Args:
         report (Dict[str, Any]): The scoring report dictionary.
-        fmt (str): Output format, one of "json", "markdown", or "html".
+        fmt (str): Output format, one of "json", "markdown", "html" or "ndjson".
         output_path (str): File path to write the exported report.
     """
+    if fmt not in FORMAT_EXTENSIONS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+    if fmt == "html":
+        from src.reports.html import write_html
+
+        summary = {k: v for k, v in report.items() if k != "issues"}
+        write_html(report.get("issues", []), summary, output_path)
+        return
+    with open(output_path, "w", encoding="utf-8") as f:
+        if fmt == "json":
+            json.dump(report, f, indent=2, default=json_default)
+        elif fmt == "ndjson":
+            issues = report.get("issues", [])
+            summary = {k: v for k, v in report.items() if k != "issues"}
+            write_ndjson(issues, summary, f)
+        else:
+            f.write(render_report(report, fmt))
+
+
+def write_ndjson(
+    issues: Iterable[Mapping[str, Any]], summary: Summary, f: TextIO
+) -> None:
+    """
+    Write one JSON line per issue as it is produced, then a summary line.
+
+    Issue lines carry ``"type": "issue"`` plus the usual issue keys; the last
+    line carries ``"type": "summary"`` with the score, grade and criteria.
+
+    Args:
+        issues (Iterable[Mapping[str, Any]]): Issues, possibly a lazy stream.
+        summary (Summary): The report without its issues, or a callable
+            returning it once ``issues`` is exhausted (``ReportStream.summary``).
+        f (TextIO): Destination file.
+    """
+    for line in iter_ndjson(issues, summary):
+        f.write(line)
+
+
+def iter_ndjson(issues: Iterable[Mapping[str, Any]], summary: Summary) -> Iterator[str]:
+    """
+    Lines of the ndjson export, see ``write_ndjson``.
+    """
+    for issue in issues:
+        yield json.dumps({"type": "issue", **issue}) + "\n"
+    if callable(summary):
+        summary = summary()
+    yield json.dumps({"type": "summary", **summary}) + "\n"
+
+
+def render_report(report: Dict, fmt: str) -> str:
+    """
+    Render the report dictionary in the given format.
+
+    Args:
+        report (Dict[str, Any]): The scoring report dictionary.
+        fmt (str): Output format, one of "json", "markdown", "html" or "ndjson".
+
+    Returns:
+        str: The rendered report.
+    """
     if fmt == "json":
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(report, f, indent=2)
+        return json.dumps(report, indent=2, default=json_default)
+    elif fmt == "ndjson":
+        summary = {k: v for k, v in report.items() if k != "issues"}
+        return "".join(iter_ndjson(report.get("issues", []), summary))
     elif fmt == "markdown":
-        md = report_to_markdown(report)
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(md)
+        return report_to_markdown(report)
     elif fmt == "html":
-        md = report_to_markdown(report)
-        html = markdown(md)
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html)
+        from src.reports.html import render_html
+
+        return render_html(report)
     else:
         raise ValueError(f"Unsupported export format: {fmt}")
 
@@ -51,6 +121,12 @@ def report_to_markdown(report: Dict) -> str:
             f"- **{crit.get('name', 'Unnamed')}**: {crit.get('score', 0)} / 100, Weight: {crit.get('weight', 0)}"
         )
 
+    validation = report.get("validation")
+    if validation:
+        lines.append(f"\n## Validation Errors ({validation.get('level', 'full')})")
+        for error in validation.get("errors", []):
+            lines.append(f"- {error}")
+
     lines.append("\n## Issues")
     issues = report.get("issues", [])
     if not issues:
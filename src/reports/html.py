@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import io
+import os
+import re
+from html import escape
+from typing import Any, Dict, Iterable, List, Mapping, Optional, TextIO, Tuple
+
+from src.reports.export import Summary
+from src.scoring.issues import issue_group
+
+# Issues per page once a report no longer fits on a single page.
+ISSUES_PER_PAGE = 1000
+SEVERITIES = ("high", "medium", "low")
+ISSUE_COLUMNS = ("path", "operation", "location", "description", "suggestion")
+
+Group = Tuple[str, str]
+# Name of an issue page inside the pages directory of a report.
+_PAGE_NAME = re.compile(r"[a-z0-9-]*-\d+\.html")
+
+_STYLE = (
+    "body{font-family:sans-serif;margin:2em;max-width:80em}"
+    "table{border-collapse:collapse;margin-bottom:1.5em}"
+    "th,td{border:1px solid #ccc;padding:.3em .6em;text-align:left;vertical-align:top}"
+    "th{background:#f4f4f4}.high{color:#b00020}.medium{color:#a15c00}"
+)
+
+
+def write_html(
+    issues: Iterable[Mapping[str, Any]],
+    summary: Summary,
+    output_path: str,
+    per_page: int = ISSUES_PER_PAGE,
+) -> List[str]:
+    """
+    Stream an HTML report to ``output_path`` with issues grouped by rule and
+    severity.
+
+    Up to ``per_page`` issues are shown on the report page itself. Beyond
+    that, every group is written to its own numbered pages in the
+    ``<name>-pages`` directory next to ``output_path`` as the issues arrive,
+    and the report page becomes an index linking to them. At most
+    ``per_page`` issues are held in memory. Pages left in that directory by
+    an earlier export are removed first.
+
+    Args:
+        issues (Iterable[Mapping[str, Any]]): Issues, possibly a lazy stream.
+        summary (Summary): The report without its issues, or a callable
+            returning it once ``issues`` is exhausted.
+        output_path (str): The report page to write.
+        per_page (int): Issues per page.
+
+    Returns:
+        List[str]: Paths of the issue pages written besides ``output_path``.
+    """
+    pages_dir = pages_directory(output_path)
+    _clear_pages(pages_dir)
+    index = os.path.relpath(output_path, pages_dir)
+    buffered: Dict[Group, List[Mapping[str, Any]]] = {}
+    pages: Optional[Dict[Group, _GroupPages]] = None
+    count = 0
+    try:
+        for issue in issues:
+            group = (issue_group(issue), str(issue.get("severity", "")))
+            count += 1
+            if pages is None:
+                buffered.setdefault(group, []).append(issue)
+                if count <= per_page:
+                    continue
+                pages = {}
+                for key, grouped in buffered.items():
+                    pages[key] = _GroupPages(pages_dir, index, key, per_page)
+                    for earlier in grouped:
+                        pages[key].add(earlier)
+                buffered = {}
+                continue
+            if group not in pages:
+                pages[group] = _GroupPages(pages_dir, index, group, per_page)
+            pages[group].add(issue)
+    finally:
+        for writer in (pages or {}).values():
+            writer.close()
+
+    report = summary() if callable(summary) else summary
+    with open(output_path, "w", encoding="utf-8") as f:
+        if pages is None:
+            _write_report(f, report, buffered, None)
+            return []
+        _write_report(f, report, {k: [] for k in pages}, pages)
+    return [path for writer in pages.values() for path in writer.paths]
+
+
+def pages_directory(output_path: str) -> str:
+    """
+    Directory holding the issue pages of the HTML report at ``output_path``.
+    """
+    return os.path.splitext(output_path)[0] + "-pages"
+
+
+def _clear_pages(directory: str) -> None:
+    if not os.path.isdir(directory):
+        return
+    for name in os.listdir(directory):
+        if _PAGE_NAME.fullmatch(name):
+            os.remove(os.path.join(directory, name))
+    if not os.listdir(directory):
+        os.rmdir(directory)
+
+
+def render_html(report: Dict[str, Any]) -> str:
+    """
+    Render a report as a single HTML page with all issues inline.
+    """
+    groups: Dict[Group, List[Mapping[str, Any]]] = {}
+    for issue in report.get("issues", []):
+        group = (issue_group(issue), str(issue.get("severity", "")))
+        groups.setdefault(group, []).append(issue)
+    out = io.StringIO()
+    _write_report(out, report, groups, None)
+    return out.getvalue()
+
+
+def _write_report(
+    f: TextIO,
+    report: Dict[str, Any],
+    groups: Dict[Group, List[Mapping[str, Any]]],
+    pages: Optional[Dict[Group, _GroupPages]],
+) -> None:
+    f.write(_head("API Scoring Report"))
+    f.write(
+        f"<p><strong>Score:</strong> {escape(str(report.get('score', 'N/A')))}<br>\n"
+        f"<strong>Grade:</strong> {escape(str(report.get('grade', 'N/A')))}</p>\n"
+    )
+
+    f.write("<h2>Criteria Scores</h2>\n<table>\n")
+    f.write("<tr><th>Rule</th><th>Score</th><th>Weight</th></tr>\n")
+    for crit in report.get("criteria", []):
+        f.write(
+            f"<tr><td>{escape(str(crit.get('name', 'Unnamed')))}</td>"
+            f"<td>{escape(str(crit.get('score', 0)))} / 100</td>"
+            f"<td>{escape(str(crit.get('weight', 0)))}</td></tr>\n"
+        )
+    f.write("</table>\n")
+
+    gate = report.get("gate")
+    if gate:
+        verdict = "passed" if gate["passed"] else "failed"
+        f.write(f"<p>Gate {verdict}: fail under {escape(str(gate['fail_under']))}")
+        if gate["skipped_rules"]:
+            skipped = ", ".join(escape(name) for name in gate["skipped_rules"])
+            f.write(f"; stopped early, skipped {skipped}")
+        f.write("</p>\n")
+
+    validation = report.get("validation")
+    if validation:
+        level = escape(str(validation.get("level", "full")))
+        f.write(f"<h2>Validation Errors ({level})</h2>\n<ul>\n")
+        for error in validation.get("errors", []):
+            f.write(f"<li>{escape(str(error))}</li>\n")
+        f.write("</ul>\n")
+
+    f.write("<h2>Issues</h2>\n")
+    order = _group_order(groups, report)
+    if not order:
+        f.write("<p>No issues found. Great job!</p>\n")
+    else:
+        f.write(_overview(order, groups, pages))
+        if pages is None:
+            for group in order:
+                f.write(f'<h3 id="{_slug(group)}">{escape(_title(group))}</h3>\n')
+                f.write(_issue_table(groups[group]))
+    f.write("</body>\n</html>\n")
+
+
+def _overview(
+    order: List[Group],
+    groups: Dict[Group, List[Mapping[str, Any]]],
+    pages: Optional[Dict[Group, _GroupPages]],
+) -> str:
+    severities = [s for s in SEVERITIES if any(g[1] == s for g in order)]
+    severities += sorted({g[1] for g in order} - set(severities))
+    rules = list(dict.fromkeys(rule for rule, _ in order))
+    rows = ["<table>\n<tr><th>Rule</th>"]
+    rows += [f'<th class="{escape(s)}">{escape(s)}</th>' for s in severities]
+    rows.append("</tr>\n")
+    for rule in rules:
+        rows.append(f"<tr><td>{escape(rule)}</td>")
+        for severity in severities:
+            group = (rule, severity)
+            if group not in groups:
+                rows.append("<td></td>")
+            elif pages is None:
+                count = len(groups[group])
+                rows.append(f'<td><a href="#{_slug(group)}">{count}</a></td>')
+            else:
+                writer = pages[group]
+                first = escape(_relative_href(writer.paths[0]))
+                count = writer.count
+                rows.append(
+                    f'<td><a href="{first}">{count}</a> '
+                    f"({len(writer.paths)} pages)</td>"
+                )
+        rows.append("</tr>\n")
+    rows.append("</table>\n")
+    return "".join(rows)
+
+
+class _GroupPages:
+    """
+    Writes the issues of one (rule, severity) group to numbered pages.
+    """
+
+    def __init__(self, directory: str, index: str, group: Group, per_page: int) -> None:
+        self.directory = directory
+        self.index = index
+        self.group = group
+        self.per_page = per_page
+        self.paths: List[str] = []
+        self.count = 0
+        self._file: Optional[TextIO] = None
+
+    def add(self, issue: Mapping[str, Any]) -> None:
+        if self.count % self.per_page == 0:
+            self._next_page()
+        assert self._file is not None
+        self._file.write(_issue_row(issue))
+        self.count += 1
+
+    def close(self, has_next: bool = False) -> None:
+        if self._file is None:
+            return
+        f = self._file
+        page = len(self.paths)
+        index = escape(self.index.replace(os.sep, "/"))
+        f.write("</table>\n<p>")
+        if page > 1:
+            f.write(f'<a href="{escape(self._name(page - 1))}">Previous</a> | ')
+        f.write(f'<a href="{index}">Report</a>')
+        if has_next:
+            f.write(f' | <a href="{escape(self._name(page + 1))}">Next</a>')
+        f.write("</p>\n</body>\n</html>\n")
+        f.close()
+        self._file = None
+
+    def _next_page(self) -> None:
+        self.close(has_next=True)
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, self._name(len(self.paths) + 1))
+        self.paths.append(path)
+        self._file = open(path, "w", encoding="utf-8")
+        self._file.write(_head(f"{_title(self.group)}, page {len(self.paths)}"))
+        self._file.write(_table_header())
+
+    def _name(self, page: int) -> str:
+        return f"{_slug(self.group)}-{page}.html"
+
+
+def _relative_href(page: str) -> str:
+    # Link from the report page to one of its pages: "<name>-pages/<page>".
+    directory, name = os.path.split(page)
+    return f"{os.path.basename(directory)}/{name}"
+
+
+def _group_order(
+    groups: Dict[Group, List[Mapping[str, Any]]], report: Dict[str, Any]
+) -> List[Group]:
+    # Rules in report order, then any others; severities from high to low.
+    rules = [crit.get("name") for crit in report.get("criteria", [])]
+    rank = {name: i for i, name in enumerate(rules)}
+    severity_rank = {s: i for i, s in enumerate(SEVERITIES)}
+    return sorted(
+        groups,
+        key=lambda g: (
+            rank.get(g[0], len(rank)),
+            g[0],
+            severity_rank.get(g[1], len(severity_rank)),
+            g[1],
+        ),
+    )
+
+
+def _issue_table(issues: Iterable[Mapping[str, Any]]) -> str:
+    rows = [_table_header()]
+    rows.extend(_issue_row(issue) for issue in issues)
+    rows.append("</table>\n")
+    return "".join(rows)
+
+
+def _table_header() -> str:
+    cells = "".join(f"<th>{column.capitalize()}</th>" for column in ISSUE_COLUMNS)
+    return f"<table>\n<tr>{cells}</tr>\n"
+
+
+def _issue_row(issue: Mapping[str, Any]) -> str:
+    cells = "".join(
+        f"<td>{escape(str(issue.get(column, 'N/A')))}</td>" for column in ISSUE_COLUMNS
+    )
+    return f"<tr>{cells}</tr>\n"
+
+
+def _head(title: str) -> str:
+    return (
+        '<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n'
+        f"<title>{escape(title)}</title>\n<style>{_STYLE}</style>\n"
+        f"</head>\n<body>\n<h1>{escape(title)}</h1>\n"
+    )
+
+
+def _title(group: Group) -> str:
+    rule, severity = group
+    return f"{rule}: {severity}" if severity else rule
+
+
+def _slug(group: Group) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", "-".join(group).lower()).strip("-")
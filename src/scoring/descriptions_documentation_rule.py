@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from typing import Dict, Any, List, Tuple
 
-from src.scoring.rules_base import Rule
+from src.core.spec_index import PathEntry, SpecIndex
+from src.scoring.issues import OPERATION_DESCRIPTION, PATH_DESCRIPTION, Issue
+from src.scoring.rules_base import Rule, RuleTally
 
 
 def has_meaningful_description(obj: Dict[str, Any], min_length: int = 10) -> bool:
@@ -24,13 +26,15 @@ def has_meaningful_description(obj: Dict[str, Any], min_length: int = 10) -> boo
 class DescriptionsDocumentationRule(Rule):
     name = "Descriptions & Documentation"
     weight = 20
+    cost = 1.8
+    HTTP_METHODS = {"get", "post", "put", "delete", "patch"}
 
     def __init__(self, min_desc_length: int = 10):
         super().__init__()
         self.min_desc_length = min_desc_length
 
     def _check_path_item(
-        self, path: str, path_item: Dict[str, Any], issues: List[Dict[str, str]]
+        self, path: str, path_item: Dict[str, Any], issues: List[Issue]
     ) -> Tuple[int, int]:
         total = 0
         valid = 0
@@ -40,19 +44,12 @@ class DescriptionsDocumentationRule(Rule):
                 valid += 1
             else:
                 issues.append(
-                    {
-                        "path": path,
-                        "operation": "N/A",
-                        "location": f"paths.{path}.description",
-                        "description": "Missing or insufficient path-level description.",
-                        "severity": "low",
-                        "suggestion": "Add a helpful description to this path group.",
-                    }
+                    Issue(PATH_DESCRIPTION, path, "N/A", ("paths", path, "description"))
                 )
         return total, valid
 
     def _check_operation(
-        self, path: str, method: str, op: Dict[str, Any], issues: List[Dict[str, str]]
+        self, path: str, method: str, op: Dict[str, Any], issues: List[Issue]
     ) -> Tuple[int, int]:
         total = 1
         if has_meaningful_description(op, self.min_desc_length):
@@ -60,44 +57,39 @@ class DescriptionsDocumentationRule(Rule):
         else:
             valid = 0
             issues.append(
-                {
-                    "path": path,
-                    "operation": method,
-                    "location": f"paths.{path}.{method}.description",
-                    "description": "Missing or unhelpful operation description.",
-                    "severity": "high",
-                    "suggestion": "Add a meaningful description to this operation.",
-                }
+                Issue(
+                    OPERATION_DESCRIPTION,
+                    path,
+                    method,
+                    ("paths", path, method, "description"),
+                )
             )
         return total, valid
 
-    def apply(self, spec: Dict[str, Any]) -> Tuple[float, List[Dict[str, str]]]:
-        issues: List[Dict[str, str]] = []
-        total = 0
-        valid = 0
+    def check_path(self, index: SpecIndex, entry: PathEntry) -> RuleTally:
+        tally = RuleTally()
+        if not isinstance(entry.item, dict):
+            return tally
+
+        path_total, path_valid = self._check_path_item(
+            entry.path, entry.item, tally.issues
+        )
+        tally.total += path_total
+        tally.passed += path_valid
+
+        for op in entry.operations:
+            if op.method not in self.HTTP_METHODS:
+                continue
+            op_total, op_valid = self._check_operation(
+                op.path, op.key, op.operation, tally.issues
+            )
+            tally.total += op_total
+            tally.passed += op_valid
+        return tally
 
-        for path, path_item in spec.get("paths", {}).items():
-            if isinstance(path_item, dict):
-                path_total, path_valid = self._check_path_item(path, path_item, issues)
-                total += path_total
-                valid += path_valid
-
-                for method, op in path_item.items():
-                    if method.lower() in {
-                        "get",
-                        "post",
-                        "put",
-                        "delete",
-                        "patch",
-                    } and isinstance(op, dict):
-                        op_total, op_valid = self._check_operation(
-                            path, method, op, issues
-                        )
-                        total += op_total
-                        valid += op_valid
-
-        if total == 0:
+    def finalize(self, tally: RuleTally) -> Tuple[float, List[Issue]]:
+        if tally.total == 0:
             return 100, []
 
-        score = round(100 * valid / total)
-        return score, issues
+        score = round(100 * tally.passed / tally.total)
+        return score, tally.issues
@@ -1,12 +1,21 @@
 from __future__ import annotations
 
 from typing import Dict, Any, Tuple, List
-from src.scoring.rules_base import Rule
+
+from src.core.spec_index import PathEntry, SpecIndex
+from src.scoring.issues import (
+    MISSING_REQUEST_EXAMPLE,
+    MISSING_RESPONSE_EXAMPLE,
+    Issue,
+    operation_label,
+)
+from src.scoring.rules_base import Rule, RuleTally
 
 
 class ExamplesSamplesRule(Rule):
     name = "Examples & Samples"
     weight = 10
+    cost = 2.1
     HTTP_METHODS = {"get", "post", "put", "delete", "patch"}
     REQUIRE_REQUEST_EXAMPLES = {"post", "put", "patch"}
 
@@ -15,69 +24,59 @@ class ExamplesSamplesRule(Rule):
             "example" in content_dict or "examples" in content_dict
         )
 
-    def apply(self, spec: Dict[str, Any]) -> Tuple[float, List[Dict[str, str]]]:
-        issues: List[Dict[str, str]] = []
-        total_ops = 0
-        passed_ops = 0
+    def check_path(self, index: SpecIndex, entry: PathEntry) -> RuleTally:
+        tally = RuleTally()
+        issues = tally.issues
 
-        paths = spec.get("paths", {})
-        for path, path_item in paths.items():
-            if not isinstance(path_item, dict):
+        for op in entry.operations:
+            if op.method not in self.HTTP_METHODS:
                 continue
 
-            for method, operation in path_item.items():
-                method_lower = method.lower()
-                if method_lower not in self.HTTP_METHODS:
-                    continue
-
-                total_ops += 1
-                needs_request_check = method_lower in self.REQUIRE_REQUEST_EXAMPLES
-                has_request_example = not needs_request_check
-                has_response_example = False
+            path = op.path
+            tally.total += 1
+            needs_request_check = op.method in self.REQUIRE_REQUEST_EXAMPLES
+            has_request_example = not needs_request_check
+            has_response_example = False
 
-                if needs_request_check:
-                    request_body = operation.get("requestBody", {})
-                    content = request_body.get("content", {})
-                    has_request_example = any(
-                        self._has_examples(media_obj) for media_obj in content.values()
-                    )
-                    if not has_request_example and content:
-                        issues.append(
-                            {
-                                "path": path,
-                                "operation": method.upper(),
-                                "location": f"paths.{path}.{method}.requestBody",
-                                "description": "Missing request example",
-                                "severity": "medium",
-                                "suggestion": "Add an 'example' or 'examples' field to requestBody content",
-                            }
+            if needs_request_check:
+                content = op.request_body.get("content", {})
+                has_request_example = any(
+                    self._has_examples(media_obj) for media_obj in content.values()
+                )
+                if not has_request_example and content:
+                    issues.append(
+                        Issue(
+                            MISSING_REQUEST_EXAMPLE,
+                            path,
+                            operation_label(op.key),
+                            ("paths", path, op.key, "requestBody"),
                         )
+                    )
 
-                responses = operation.get("responses", {})
-                for code, response_obj in responses.items():
-                    if not isinstance(response_obj, dict):
-                        continue
-                    content = response_obj.get("content", {})
-                    if any(
-                        self._has_examples(media_obj) for media_obj in content.values()
-                    ):
-                        has_response_example = True
-                        break
+            responses = op.responses
+            for code, response_obj in responses.items():
+                if not isinstance(response_obj, dict):
+                    continue
+                content = response_obj.get("content", {})
+                if any(self._has_examples(media_obj) for media_obj in content.values()):
+                    has_response_example = True
+                    break
 
-                if not has_response_example and responses:
-                    issues.append(
-                        {
-                            "path": path,
-                            "operation": method.upper(),
-                            "location": f"paths.{path}.{method}.responses",
-                            "description": "Missing response example",
-                            "severity": "medium",
-                            "suggestion": "Add an 'example' or 'examples' field to response content",
-                        }
+            if not has_response_example and responses:
+                issues.append(
+                    Issue(
+                        MISSING_RESPONSE_EXAMPLE,
+                        path,
+                        operation_label(op.key),
+                        ("paths", path, op.key, "responses"),
                     )
+                )
+
+            if has_request_example and has_response_example:
+                tally.passed += 1
 
-                if has_request_example and has_response_example:
-                    passed_ops += 1
+        return tally
 
-        score = 0 if total_ops == 0 else round(100 * passed_ops / total_ops)
-        return score, issues
+    def finalize(self, tally: RuleTally) -> Tuple[float, List[Issue]]:
+        score = 0 if tally.total == 0 else round(100 * tally.passed / tally.total)
+        return score, tally.issues
@@ -1,27 +1,21 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Iterable, List, Optional
 
-from src.scoring.descriptions_documentation_rule import DescriptionsDocumentationRule
-from src.scoring.examples_samples_rule import ExamplesSamplesRule
-from src.scoring.miscellaneous_rule import MiscellaneousBestPracticesRule
-from src.scoring.paths_operation_rule import PathsOperationsRule
-from src.scoring.response_code_rule import ResponseCodesRule
+from src.scoring.registry import default_registry
 from src.scoring.rules_base import Rule
-from src.scoring.schema_type_rule import SchemaTypesRule
-from src.scoring.security_rule import SecurityRule
 
 
-def get_all_rules() -> List[Rule]:
+def get_all_rules(rule_ids: Optional[Iterable[str]] = None) -> List[Rule]:
     """
-    Return instances of all rules to be applied.
+    Return instances of the rules to be applied.
+
+    Rules come from ``default_registry``: the built-in rules plus any
+    installed ``api_scoring.rules`` plugins. Instances are shared between
+    calls.
+
+    Args:
+        rule_ids (Optional[Iterable[str]]): Registry ids of the rules to
+            load; all known rules when omitted.
     """
-    return [
-        SchemaTypesRule(),
-        DescriptionsDocumentationRule(),
-        PathsOperationsRule(),
-        ResponseCodesRule(),
-        ExamplesSamplesRule(),
-        SecurityRule(),
-        MiscellaneousBestPracticesRule(),
-    ]
+    return default_registry.rules(rule_ids)
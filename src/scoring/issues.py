@@ -0,0 +1,418 @@
+from __future__ import annotations
+
+import hashlib
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from src.core.spec_index import Location
+
+ISSUE_FIELDS = (
+    "path",
+    "operation",
+    "location",
+    "description",
+    "severity",
+    "suggestion",
+)
+
+
+class IssueKind:
+    """
+    Constant part of an issue, shared by every occurrence.
+
+    ``description`` may contain ``{}`` placeholders filled from the issue's
+    ``args`` when it is read.
+    """
+
+    __slots__ = ("code", "severity", "description", "suggestion")
+
+    def __init__(
+        self, code: str, severity: str, description: str, suggestion: str
+    ) -> None:
+        self.code = code
+        self.severity = sys.intern(severity)
+        self.description = description
+        self.suggestion = suggestion
+
+    def __repr__(self) -> str:
+        return f"IssueKind({self.code!r})"
+
+    def __reduce__(self) -> Tuple[Any, Tuple[str, ...]]:
+        # Unpickle to the registered instance, e.g. in a worker process.
+        fields = (self.code, self.severity, self.description, self.suggestion)
+        return _registered_kind, fields
+
+
+ISSUE_KINDS: Dict[str, IssueKind] = {}
+
+
+def issue_kind(
+    code: str, severity: str, description: str, suggestion: str
+) -> IssueKind:
+    """
+    Create an issue kind and register it in ``ISSUE_KINDS``.
+    """
+    kind = IssueKind(code, severity, description, suggestion)
+    ISSUE_KINDS[code] = kind
+    return kind
+
+
+def _registered_kind(code: str, *fields: str) -> IssueKind:
+    if code not in ISSUE_KINDS and fields:
+        # A kind created at run time, e.g. by adapt_issue in a worker process.
+        issue_kind(code, *fields)
+    return ISSUE_KINDS[code]
+
+
+def format_location(location: Location) -> str:
+    """
+    Render a structured location as a dotted string, e.g.
+    ``("paths", "/users", "get", "parameters", 0)`` as
+    ``"paths./users.get.parameters[0]"``.
+    """
+    parts = []
+    for part in location:
+        if isinstance(part, int):
+            parts.append(f"[{part}]")
+        elif parts:
+            parts.append(f".{part}")
+        else:
+            parts.append(part)
+    return "".join(parts)
+
+
+class Issue(Mapping[str, str]):
+    """
+    A single finding of a rule.
+
+    Only references are stored: the shared ``IssueKind``, the path and
+    operation strings, a location tuple and any description arguments.
+    Strings are formatted when a field is read, so the record reads like the
+    dict ``{path, operation, location, description, severity, suggestion}``
+    it replaces. The ``code`` of its kind is an attribute, not a key.
+    """
+
+    __slots__ = ("kind", "path", "operation", "where", "args")
+
+    def __init__(
+        self,
+        kind: IssueKind,
+        path: str,
+        operation: str,
+        where: Location,
+        args: Tuple[Any, ...] = (),
+    ) -> None:
+        self.kind = kind
+        self.path = path
+        self.operation = operation
+        self.where = where
+        self.args = args
+
+    @property
+    def location(self) -> str:
+        return format_location(self.where)
+
+    @property
+    def description(self) -> str:
+        if self.args:
+            return self.kind.description.format(*self.args)
+        return self.kind.description
+
+    @property
+    def severity(self) -> str:
+        return self.kind.severity
+
+    @property
+    def suggestion(self) -> str:
+        return self.kind.suggestion
+
+    @property
+    def code(self) -> str:
+        return self.kind.code
+
+    def __getitem__(self, key: str) -> str:
+        if key not in ISSUE_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(ISSUE_FIELDS)
+
+    def __len__(self) -> int:
+        return len(ISSUE_FIELDS)
+
+    def __repr__(self) -> str:
+        return f"Issue({self.kind.code!r}, {self.path!r}, {self.location!r})"
+
+    def to_dict(self) -> Dict[str, str]:
+        return {field: getattr(self, field) for field in ISSUE_FIELDS}
+
+
+class StoredIssue(dict):
+    """
+    A plain dict issue read back from a stored report, such as a cached
+    one, that still knows the ``code`` of its kind. The code is kept out of
+    the keys, so the issue serializes like a fresh ``Issue``.
+    """
+
+    __slots__ = ("code",)
+
+    def __init__(self, fields: Mapping[str, Any], code: Optional[str]) -> None:
+        super().__init__(fields)
+        self.code = code
+
+
+def adapt_issue(issue: Mapping[str, Any], rule_name: str) -> Issue:
+    """
+    Turn a plain dict issue, as returned by rules written before ``Issue``
+    records, into an ``Issue``.
+
+    The kind is registered under "<rule_name>.<hash of severity and
+    suggestion>" and the description is kept as its only argument.
+    """
+    if isinstance(issue, Issue):
+        return issue
+    severity = str(issue.get("severity", "low"))
+    suggestion = str(issue.get("suggestion", ""))
+    digest = hashlib.blake2b(
+        f"{severity}\n{suggestion}".encode("utf-8"), digest_size=4
+    ).hexdigest()
+    code = f"{rule_name}.{digest}"
+    kind = ISSUE_KINDS.get(code) or issue_kind(code, severity, "{}", suggestion)
+    return Issue(
+        kind,
+        str(issue.get("path", "N/A")),
+        str(issue.get("operation", "N/A")),
+        (str(issue.get("location", "N/A")),),
+        (str(issue.get("description", "")),),
+    )
+
+
+def json_default(obj: Any) -> Any:
+    """
+    ``default`` hook for ``json.dump`` that serializes ``Issue`` records.
+    """
+    if isinstance(obj, Issue):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Report section of the built-in issue kinds, by code prefix.
+ISSUE_GROUPS = {
+    "schema": "Schema & Types",
+    "descriptions": "Descriptions & Documentation",
+    "paths": "Paths & Operations",
+    "responses": "Response Codes",
+    "examples": "Examples & Samples",
+    "security": "Security",
+    "misc": "Miscellaneous Best Practices",
+    "engine": "Engine",
+}
+
+
+def issue_group(issue: Mapping[str, str]) -> str:
+    """
+    Name of the report section an issue belongs to, usually its rule.
+
+    The section follows from the prefix of the code of the issue's kind,
+    which ``Issue`` records and ``StoredIssue`` dicts carry. Other issues
+    are "Other".
+    """
+    code: Optional[str] = getattr(issue, "code", None)
+    if not code:
+        return "Other"
+    prefix = code.rsplit(".", 1)[0]
+    return ISSUE_GROUPS.get(prefix, prefix)
+
+
+def operation_label(key: str) -> str:
+    """
+    Upper-cased, interned operation name as shown by some rules ("GET").
+    """
+    return sys.intern(key.upper())
+
+
+# Descriptions & Documentation
+PATH_DESCRIPTION = issue_kind(
+    "descriptions.path",
+    "low",
+    "Missing or insufficient path-level description.",
+    "Add a helpful description to this path group.",
+)
+OPERATION_DESCRIPTION = issue_kind(
+    "descriptions.operation",
+    "high",
+    "Missing or unhelpful operation description.",
+    "Add a meaningful description to this operation.",
+)
+
+# Examples & Samples
+MISSING_REQUEST_EXAMPLE = issue_kind(
+    "examples.request",
+    "medium",
+    "Missing request example",
+    "Add an 'example' or 'examples' field to requestBody content",
+)
+MISSING_RESPONSE_EXAMPLE = issue_kind(
+    "examples.response",
+    "medium",
+    "Missing response example",
+    "Add an 'example' or 'examples' field to response content",
+)
+
+# Miscellaneous Best Practices
+MISSING_VERSION = issue_kind(
+    "misc.version",
+    "medium",
+    "API version is missing or empty.",
+    "Set the version in 'info.version' (e.g., '1.0.0').",
+)
+NO_SERVERS = issue_kind(
+    "misc.servers",
+    "medium",
+    "No servers defined.",
+    "Include at least one server in the 'servers' array.",
+)
+NO_TAGS = issue_kind(
+    "misc.tags",
+    "low",
+    "No tags used in operations.",
+    "Add tags to operations to help group and organize endpoints.",
+)
+NO_COMPONENTS = issue_kind(
+    "misc.components",
+    "low",
+    "No reusable components found.",
+    "Define common schemas, responses, or parameters under 'components' for reuse.",
+)
+
+# Paths & Operations
+PATH_CONFLICT = issue_kind(
+    "paths.conflict",
+    "medium",
+    "Potential path conflict with '{}'.",
+    "Ensure paths are distinct or consolidate similar endpoints.",
+)
+PATH_VERB = issue_kind(
+    "paths.verb",
+    "low",
+    "Path contains a verb, which is discouraged in REST APIs.",
+    "Use nouns for resources (e.g., /users instead of /getUser).",
+)
+POST_WITH_ID = issue_kind(
+    "paths.post_with_id",
+    "medium",
+    "POST should not be used with resource IDs (except for RPC actions).",
+    "Use POST on collection resources (e.g., /users) or add to allowed RPC patterns.",
+)
+METHOD_WITHOUT_ID = issue_kind(
+    "paths.method_without_id",
+    "medium",
+    "{} operations should target specific resources.",
+    "Include an ID parameter (e.g., /users/{id}).",
+)
+NO_PATHS = issue_kind(
+    "paths.empty",
+    "high",
+    "No valid paths or operations found to evaluate path/method quality.",
+    "Define at least one path with standard HTTP methods (e.g., GET, POST).",
+)
+
+# Response Codes
+MISSING_RESPONSES = issue_kind(
+    "responses.missing",
+    "high",
+    "Operation missing 'responses' definition.",
+    "Add at least one success and one error response.",
+)
+INVALID_RESPONSE_CODES = issue_kind(
+    "responses.invalid_codes",
+    "medium",
+    "Invalid HTTP response code(s): {}.",
+    "Use standard 3-digit HTTP status codes.",
+)
+NO_SUCCESS_RESPONSE = issue_kind(
+    "responses.no_success",
+    "high",
+    "No success (2xx) response code defined.",
+    "Add at least one 2xx status code to indicate success.",
+)
+NO_ERROR_RESPONSE = issue_kind(
+    "responses.no_error",
+    "medium",
+    "No error (4xx or 5xx) response code defined.",
+    "Add at least one 4xx or 5xx status code to indicate errors.",
+)
+
+# Schema & Types
+SCHEMA_NOT_OBJECT = issue_kind(
+    "schema.not_object",
+    "high",
+    "Schema is not a dictionary.",
+    "Ensure the schema is a valid object.",
+)
+UNRESOLVABLE_REF = issue_kind(
+    "schema.unresolvable_ref",
+    "high",
+    "Unresolvable $ref: {}.",
+    "Point '$ref' at an existing definition under 'components'.",
+)
+REF_CYCLE = issue_kind(
+    "schema.ref_cycle",
+    "high",
+    "Circular $ref chain: {}.",
+    "Make one '$ref' in the chain point at a schema with a 'type'.",
+)
+MISSING_SCHEMA_TYPE = issue_kind(
+    "schema.missing_type",
+    "high",
+    "Missing 'type' in schema.",
+    "Add a 'type' field, such as 'object', to the schema.",
+)
+INVALID_SCHEMA_TYPE = issue_kind(
+    "schema.invalid_type",
+    "high",
+    "Invalid schema type: {}.",
+    "Use a valid type like 'object', 'array', etc.",
+)
+FREE_FORM_OBJECT = issue_kind(
+    "schema.free_form",
+    "high",
+    "Free-form object without defined structure.",
+    "Define 'properties' or use a valid structure.",
+)
+MISSING_ARRAY_ITEMS = issue_kind(
+    "schema.array_items",
+    "high",
+    "Missing or invalid 'items' in array schema.",
+    "Add an 'items' field with a valid schema.",
+)
+
+# Scheduling
+RULE_TIMEOUT = issue_kind(
+    "engine.rule_timeout",
+    "high",
+    "Rule '{}' did not finish within its {}s deadline; its score only covers the checks completed in time.",
+    "Simplify the spec or raise the rule timeout (--rule-timeout).",
+)
+
+# Security
+NO_SECURITY_SCHEMES = issue_kind(
+    "security.no_schemes",
+    "high",
+    "No security schemes defined",
+    "Define security schemes (e.g., API key, OAuth2) under components.securitySchemes",
+)
+NO_SECURITY_REFERENCE = issue_kind(
+    "security.unreferenced",
+    "high",
+    "No valid security scheme referenced",
+    "Reference at least one defined security scheme",
+)
+NO_OPERATIONS = issue_kind(
+    "security.no_operations",
+    "high",
+    "No operations defined in the OpenAPI specification to evaluate security",
+    "Define at least one path and operation (e.g., GET, POST) to apply security rules",
+)
@@ -1,15 +1,27 @@
 from __future__ import annotations
 
-from typing import Dict, Any, Tuple, List
-from src.scoring.rules_base import Rule
+from typing import List
+
+from src.core.spec_index import SpecIndex
+from src.scoring.issues import (
+    MISSING_VERSION,
+    NO_COMPONENTS,
+    NO_SERVERS,
+    NO_TAGS,
+    Issue,
+)
+from src.scoring.rules_base import Rule, RuleTally
 
 
 class MiscellaneousBestPracticesRule(Rule):
     name = "Miscellaneous Best Practices"
     weight = 10
+    cost = 0.01
+    spec_keys = ("info", "servers", "paths", "components")
 
-    def apply(self, spec: Dict[str, Any]) -> Tuple[float, List[Dict[str, str]]]:
-        issues: List[Dict[str, str]] = []
+    def check_spec(self, index: SpecIndex) -> RuleTally:
+        spec = index.spec
+        issues: List[Issue] = []
         passed = 0
         total = 4
         version = spec.get("info", {}).get("version")
@@ -18,54 +30,20 @@ class MiscellaneousBestPracticesRule(Rule):
             passed += 1
         else:
             issues.append(
-                {
-                    "path": "info.version",
-                    "operation": "GLOBAL",
-                    "location": "info.version",
-                    "description": "API version is missing or empty.",
-                    "severity": "medium",
-                    "suggestion": "Set the version in 'info.version' (e.g., '1.0.0').",
-                }
+                Issue(MISSING_VERSION, "info.version", "GLOBAL", ("info", "version"))
             )
         servers = spec.get("servers", [])
         if isinstance(servers, list) and len(servers) > 0:
             passed += 1
         else:
-            issues.append(
-                {
-                    "path": "servers",
-                    "operation": "GLOBAL",
-                    "location": "servers",
-                    "description": "No servers defined.",
-                    "severity": "medium",
-                    "suggestion": "Include at least one server in the 'servers' array.",
-                }
-            )
-        tags_used = False
-        for path_item in spec.get("paths", {}).values():
-            if isinstance(path_item, dict):
-                for op in path_item.values():
-                    if isinstance(op, dict) and "tags" in op:
-                        tags_used = True
-                        break
-            if tags_used:
-                break
-
+            issues.append(Issue(NO_SERVERS, "servers", "GLOBAL", ("servers",)))
+        tags_used = any("tags" in op.operation for op in index.iter_operations())
         if tags_used:
             passed += 1
         else:
-            issues.append(
-                {
-                    "path": "paths",
-                    "operation": "GLOBAL",
-                    "location": "paths",
-                    "description": "No tags used in operations.",
-                    "severity": "low",
-                    "suggestion": "Add tags to operations to help group and organize endpoints.",
-                }
-            )
+            issues.append(Issue(NO_TAGS, "paths", "GLOBAL", ("paths",)))
 
-        components = spec.get("components", {})
+        components = index.components
         reused = any(
             components.get(key)
             for key in [
@@ -80,16 +58,6 @@ class MiscellaneousBestPracticesRule(Rule):
         if reused:
             passed += 1
         else:
-            issues.append(
-                {
-                    "path": "components",
-                    "operation": "GLOBAL",
-                    "location": "components",
-                    "description": "No reusable components found.",
-                    "severity": "low",
-                    "suggestion": "Define common schemas, responses, or parameters under 'components' for reuse.",
-                }
-            )
+            issues.append(Issue(NO_COMPONENTS, "components", "GLOBAL", ("components",)))
 
-        score = round(100 * passed / total) if total > 0 else 100
-        return score, issues
+        return RuleTally(passed, total, issues)
@@ -1,13 +1,104 @@
 from __future__ import annotations
 
-import re
-from typing import Dict, Any, Tuple, List, Optional, Set
-from src.scoring.rules_base import Rule
+from typing import Any, Dict, Tuple, List, Optional, Set
+
+from src.core.spec_index import (
+    PATH_PARAM_PATTERN,
+    PathEntry,
+    SpecIndex,
+    normalize_path,
+)
+from src.scoring.issues import (
+    METHOD_WITHOUT_ID,
+    NO_PATHS,
+    PATH_CONFLICT,
+    PATH_VERB,
+    POST_WITH_ID,
+    Issue,
+    IssueKind,
+)
+from src.scoring.rules_base import Rule, RuleTally
+
+
+class _TrieNode:
+    __slots__ = ("children", "path", "order", "first")
+
+    def __init__(self, first: int) -> None:
+        self.children: Dict[str, _TrieNode] = {}
+        # Original path and insertion number of a path ending at this node.
+        self.path: Optional[str] = None
+        self.order = -1
+        # Insertion number of the earliest path in this subtree.
+        self.first = first
+
+
+class PathTrie:
+    """
+    Segment trie of normalized paths for conflict lookups.
+
+    Two normalized paths conflict when they are equal or one is a
+    segment-wise prefix of the other (``/users`` and ``/users/{id}``).
+    Lookups walk one node per segment, so the cost depends on the depth of
+    the path, not on the number of paths already inserted.
+    """
+
+    def __init__(self) -> None:
+        self.root = _TrieNode(-1)
+        self.count = 0
+
+    def add(self, normalized: str, path: str) -> None:
+        """
+        Record ``path`` under its normalized form; the first path wins.
+        """
+        order = self.count
+        self.count += 1
+        node = self.root
+        for segment in normalized.split("/"):
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = _TrieNode(order)
+            node = child
+        if node.path is None:
+            node.path = path
+            node.order = order
+
+    def find_conflict(self, normalized: str) -> Optional[str]:
+        """
+        Return the earliest added path conflicting with ``normalized``.
+
+        An exact match is preferred; otherwise the earliest of all ancestor
+        and descendant paths is returned.
+        """
+        best: Optional[_TrieNode] = None
+        best_order = self.count
+        node = self.root
+        for segment in normalized.split("/"):
+            if node.path is not None and node.order < best_order:
+                best, best_order = node, node.order
+            child = node.children.get(segment)
+            if child is None:
+                return best.path if best is not None else None
+            node = child
+
+        if node.path is not None:
+            return node.path
+        if node.first < best_order:
+            # Some path below this node was added before any ancestor.
+            return self._first_path(node)
+        return best.path if best is not None else None
+
+    @staticmethod
+    def _first_path(node: _TrieNode) -> Optional[str]:
+        while node.order != node.first:
+            node = min(node.children.values(), key=lambda child: child.first)
+        return node.path
 
 
 class PathsOperationsRule(Rule):
     name = "Paths & Operations"
     weight = 15
+    cost = 1.2
+    spec_keys = ("paths",)
 
     DEFAULT_HTTP_METHODS = {"get", "post", "put", "delete", "patch", "head", "options"}
     DEFAULT_VERBS = {
@@ -40,8 +131,7 @@ class PathsOperationsRule(Rule):
 
     @staticmethod
     def normalize_path(path: str) -> str:
-        path = path.split("?")[0].lower().rstrip("/")
-        return re.sub(r"\{[^}]+}", "{id}", path)
+        return normalize_path(path)
 
     def contains_verb(self, path: str) -> bool:
         parts = path.strip("/").split("/")
@@ -49,127 +139,96 @@ class PathsOperationsRule(Rule):
             part.lower() in self.verbs for part in parts if not part.startswith("{")
         )
 
-    def is_allowed_post_with_id(self, path: str) -> bool:
-        normalized = self.normalize_path(path)
+    def is_allowed_post_with_id(
+        self, path: str, normalized: Optional[str] = None
+    ) -> bool:
+        if normalized is None:
+            normalized = self.normalize_path(path)
         return any(
             pattern in normalized for pattern in self.allowed_post_with_id_patterns
         )
 
     def detect_path_conflicts(
-        self, path: str, seen_paths: Dict[str, str]
+        self, path: str, seen_paths: PathTrie, normalized: Optional[str] = None
     ) -> Optional[str]:
-        normalized = self.normalize_path(path)
-
-        if normalized in seen_paths:
-            return seen_paths[normalized]
-
-        for existing_path in seen_paths:
-            if existing_path.startswith(normalized + "/") or normalized.startswith(
-                existing_path + "/"
-            ):
-                return seen_paths[existing_path]
-
-        return None
+        if normalized is None:
+            normalized = self.normalize_path(path)
+        return seen_paths.find_conflict(normalized)
 
     def validate_http_method_usage(
-        self, path: str, method: str
-    ) -> Optional[Dict[str, str]]:
+        self, path: str, method: str, normalized: Optional[str] = None
+    ) -> Optional[Tuple[IssueKind, Tuple[Any, ...]]]:
         method = method.lower()
-        has_id_param = re.search(r"\{[^}]+\}", path)
+        has_id_param = PATH_PARAM_PATTERN.search(path)
 
-        if method == "post" and has_id_param and not self.is_allowed_post_with_id(path):
-            return {
-                "description": "POST should not be used with resource IDs (except for RPC actions).",
-                "suggestion": "Use POST on collection resources (e.g., /users) or add to allowed RPC patterns.",
-                "severity": "medium",
-            }
+        if (
+            method == "post"
+            and has_id_param
+            and not self.is_allowed_post_with_id(path, normalized)
+        ):
+            return POST_WITH_ID, ()
 
         if method in {"put", "delete"} and not has_id_param:
-            return {
-                "description": f"{method.upper()} operations should target specific resources.",
-                "suggestion": "Include an ID parameter (e.g., /users/{id}).",
-                "severity": "medium",
-            }
+            return METHOD_WITHOUT_ID, (method.upper(),)
 
         return None
 
-    def apply(self, spec: Dict[str, Any]) -> Tuple[float, List[Dict[str, str]]]:
-        issues: List[Dict[str, str]] = []
-        seen_paths: Dict[str, str] = {}
-        total_checks = 0
-        passed_checks = 0.0
+    def check_spec(self, index: SpecIndex) -> RuleTally:
+        tally = RuleTally()
+        seen_paths = PathTrie()
 
-        for path, path_item in spec.get("paths", {}).items():
-            normalized_path = self.normalize_path(path)
+        for entry in index.paths:
+            path, normalized_path = entry.path, entry.normalized_path
 
-            total_checks += 1
-            conflict_with = self.detect_path_conflicts(path, seen_paths)
+            tally.total += 1
+            conflict_with = self.detect_path_conflicts(
+                path, seen_paths, normalized_path
+            )
             if conflict_with:
-                passed_checks += 0.5
-                issues.append(
-                    {
-                        "path": path,
-                        "operation": "N/A",
-                        "location": "paths",
-                        "description": f"Potential path conflict with '{conflict_with}'.",
-                        "severity": "medium",
-                        "suggestion": "Ensure paths are distinct or consolidate similar endpoints.",
-                    }
-                )
-            else:
-                seen_paths[normalized_path] = path
-                passed_checks += 1
-
-            total_checks += 1
-            if self.contains_verb(normalized_path):
-                issues.append(
-                    {
-                        "path": path,
-                        "operation": "N/A",
-                        "location": "paths",
-                        "description": "Path contains a verb, which is discouraged in REST APIs.",
-                        "severity": "low",
-                        "suggestion": "Use nouns for resources (e.g., /users instead of /getUser).",
-                    }
+                tally.passed += 0.5
+                tally.issues.append(
+                    Issue(PATH_CONFLICT, path, "N/A", ("paths",), (conflict_with,))
                 )
             else:
-                passed_checks += 1
+                seen_paths.add(normalized_path, path)
+                tally.passed += 1
 
-            if not isinstance(path_item, dict):
+        return tally
+
+    def check_path(self, index: SpecIndex, entry: PathEntry) -> RuleTally:
+        tally = RuleTally()
+        path, normalized_path = entry.path, entry.normalized_path
+
+        tally.total += 1
+        if self.contains_verb(normalized_path):
+            tally.issues.append(Issue(PATH_VERB, path, "N/A", ("paths",)))
+        else:
+            tally.passed += 1
+
+        for op in entry.operations:
+            if op.method not in self.http_methods:
                 continue
 
-            for method, _ in path_item.items():
-                method_lower = method.lower()
-                if method_lower not in self.http_methods:
-                    continue
-
-                total_checks += 1
-                method_issue = self.validate_http_method_usage(path, method_lower)
-
-                if method_issue:
-                    issues.append(
-                        {
-                            "path": path,
-                            "operation": method,
-                            "location": f"paths.{path}.{method}",
-                            **method_issue,
-                        }
-                    )
-                else:
-                    passed_checks += 1
-
-        if total_checks == 0:
-            issues.append(
-                {
-                    "path": "paths",
-                    "operation": "GLOBAL",
-                    "location": "paths",
-                    "description": "No valid paths or operations found to evaluate path/method quality.",
-                    "severity": "high",
-                    "suggestion": "Define at least one path with standard HTTP methods (e.g., GET, POST).",
-                }
+            tally.total += 1
+            method_issue = self.validate_http_method_usage(
+                path, op.method, normalized_path
             )
+
+            if method_issue:
+                kind, args = method_issue
+                tally.issues.append(
+                    Issue(kind, path, op.key, ("paths", path, op.key), args)
+                )
+            else:
+                tally.passed += 1
+
+        return tally
+
+    def finalize(self, tally: RuleTally) -> Tuple[float, List[Issue]]:
+        issues = tally.issues
+        if tally.total == 0:
+            issues.append(Issue(NO_PATHS, "paths", "GLOBAL", ("paths",)))
             score = 0
         else:
-            score = round(100 * passed_checks / total_checks)
+            score = round(100 * tally.passed / tally.total)
         return score, issues
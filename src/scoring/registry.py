@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Union
+
+from src.scoring.rules_base import Rule, as_rule
+
+if TYPE_CHECKING:
+    from importlib.metadata import EntryPoint
+
+# Entry point group third-party packages use to contribute rules, e.g. in
+# pyproject.toml: [project.entry-points."api_scoring.rules"]
+# team_naming = "team_rules.naming:NamingRule"
+ENTRY_POINT_GROUP = "api_scoring.rules"
+
+# Built-in rules as "module:Class", in report order.
+BUILTIN_RULES: Dict[str, str] = {
+    "schema_types": "src.scoring.schema_type_rule:SchemaTypesRule",
+    "descriptions": "src.scoring.descriptions_documentation_rule:DescriptionsDocumentationRule",
+    "paths_operations": "src.scoring.paths_operation_rule:PathsOperationsRule",
+    "response_codes": "src.scoring.response_code_rule:ResponseCodesRule",
+    "examples": "src.scoring.examples_samples_rule:ExamplesSamplesRule",
+    "security": "src.scoring.security_rule:SecurityRule",
+    "misc": "src.scoring.miscellaneous_rule:MiscellaneousBestPracticesRule",
+}
+
+RuleFactory = Callable[[], Rule]
+RuleSource = Union[str, RuleFactory, "EntryPoint"]
+
+
+class RuleLoadError(TypeError):
+    """
+    Raised when a registered rule cannot be imported or instantiated, or
+    does not implement the ``Rule`` protocol. The message names the rule id.
+
+    It subclasses ``TypeError``, which the registry raised for rules that do
+    not implement the protocol before load failures were wrapped as well.
+    """
+
+
+class RuleRegistry:
+    """
+    Catalogue of rules by id, imported and instantiated on first use.
+
+    Built-in rules come first, in report order, followed by rules that
+    installed packages publish under the ``api_scoring.rules`` entry point
+    group, sorted by id. Listing ids reads metadata only. A rule's module is
+    imported when that rule is first requested. The instance is then cached,
+    so long-running processes share one instance per rule.
+    """
+
+    def __init__(
+        self,
+        builtins: Optional[Dict[str, str]] = None,
+        group: Optional[str] = ENTRY_POINT_GROUP,
+    ) -> None:
+        """
+        Args:
+            builtins (Optional[Dict[str, str]]): Rule ids mapped to
+                "module:Class"; defaults to ``BUILTIN_RULES``.
+            group (Optional[str]): Entry point group to discover plugins in,
+                or None to disable discovery.
+        """
+        self._sources: Dict[str, RuleSource] = dict(
+            BUILTIN_RULES if builtins is None else builtins
+        )
+        self._group = group
+        self._discovered = False
+        self._instances: Dict[str, Rule] = {}
+
+    def register(self, rule_id: str, source: Union[str, RuleFactory]) -> None:
+        """
+        Add or replace a rule, given as "module:Class" or a factory.
+        """
+        self._sources[rule_id] = source
+        self._instances.pop(rule_id, None)
+
+    def available(self) -> List[str]:
+        """
+        Ids of all known rules, without importing any of them.
+        """
+        self._discover()
+        return list(self._sources)
+
+    def get(self, rule_id: str) -> Rule:
+        """
+        Return the cached instance of a rule, loading it on first use.
+
+        Objects that only implement ``apply(spec)`` are wrapped in an
+        ``ApplyRule``, see ``as_rule``.
+
+        Raises:
+            ValueError: If no rule is registered under ``rule_id``.
+            RuleLoadError: If the rule's module fails to import, the rule
+                cannot be instantiated, or the loaded object does not
+                implement the ``Rule`` protocol.
+        """
+        rule = self._instances.get(rule_id)
+        if rule is None:
+            self._discover()
+            source = self._sources.get(rule_id)
+            if source is None:
+                raise ValueError(
+                    f"Unknown rule '{rule_id}'. Available: {', '.join(self._sources)}"
+                )
+            try:
+                obj = _load(source)()
+            except Exception as e:
+                raise RuleLoadError(
+                    f"Rule '{rule_id}' cannot be loaded: {type(e).__name__}: {e}"
+                ) from e
+            rule = _conform(rule_id, obj)
+            self._instances[rule_id] = rule
+        return rule
+
+    def rules(self, rule_ids: Optional[Iterable[str]] = None) -> List[Rule]:
+        """
+        Instances of the given rules, or of every known rule.
+        """
+        ids = self.available() if rule_ids is None else rule_ids
+        return [self.get(rule_id) for rule_id in ids]
+
+    def select(
+        self,
+        only: Optional[Iterable[str]] = None,
+        skip: Optional[Iterable[str]] = None,
+    ) -> List[str]:
+        """
+        Ids of the rules to run: ``only`` (or every known rule) without
+        ``skip``, in registry order.
+
+        Raises:
+            ValueError: If an id in ``only`` or ``skip`` is unknown.
+        """
+        available = self.available()
+        wanted = set(available if only is None else only)
+        skipped = set(skip or ())
+        unknown = sorted((wanted | skipped) - set(available))
+        if unknown:
+            raise ValueError(
+                f"Unknown rule '{unknown[0]}'. Available: {', '.join(available)}"
+            )
+        return [rule_id for rule_id in available if rule_id in wanted - skipped]
+
+    def loaded(self) -> List[str]:
+        """
+        Ids of the rules instantiated so far.
+        """
+        return list(self._instances)
+
+    def _discover(self) -> None:
+        if self._discovered or self._group is None:
+            return
+        self._discovered = True
+        # importlib.metadata is slow to import; only pay for it when needed.
+        from importlib.metadata import entry_points
+
+        plugins = sorted(entry_points(group=self._group), key=lambda ep: ep.name)
+        for ep in plugins:
+            self._sources.setdefault(ep.name, ep)
+
+
+# Rule methods of which a loaded rule must override at least one.
+_CHECKS = ("check_spec", "check_path", "iter_parts", "apply")
+
+
+def _conform(rule_id: str, obj: object) -> Rule:
+    try:
+        rule = as_rule(obj)
+    except TypeError as e:
+        raise RuleLoadError(f"Rule '{rule_id}' cannot be loaded: {e}")
+    cls = type(rule)
+    if all(getattr(cls, method, None) is getattr(Rule, method) for method in _CHECKS):
+        raise RuleLoadError(
+            f"Rule '{rule_id}' cannot be loaded: it overrides none of "
+            f"{', '.join(_CHECKS)}, so it would always score 100."
+        )
+    return rule
+
+
+def _load(source: RuleSource) -> RuleFactory:
+    if isinstance(source, str):
+        module_name, _, attr = source.partition(":")
+        return getattr(importlib.import_module(module_name), attr)
+    if callable(source):
+        return source
+    return source.load()
+
+
+default_registry = RuleRegistry()
@@ -1,107 +1,82 @@
 from __future__ import annotations
 
-from typing import Dict, Any, Tuple, List
-from src.scoring.rules_base import Rule
 import re
+from typing import Tuple, List
+
+from src.core.spec_index import PathEntry, SpecIndex
+from src.scoring.issues import (
+    INVALID_RESPONSE_CODES,
+    MISSING_RESPONSES,
+    NO_ERROR_RESPONSE,
+    NO_SUCCESS_RESPONSE,
+    Issue,
+)
+from src.scoring.rules_base import Rule, RuleTally
 
 
 class ResponseCodesRule(Rule):
     name = "Response Codes"
     weight = 15
+    cost = 1.1
     HTTP_STATUS_CODE_PATTERN = re.compile(r"^[1-5]\d{2}$")
     SUCCESS_CODES = {str(code) for code in range(200, 300)}
     ERROR_CODES = {str(code) for code in range(400, 600)}
+    HTTP_METHODS = {"get", "post", "put", "delete", "patch", "head", "options"}
 
-    def apply(self, spec: Dict[str, Any]) -> Tuple[float, List[Dict[str, str]]]:
-        issues: List[Dict[str, str]] = []
-        total_ops = 0
-        passed_ops = 0
+    def check_path(self, index: SpecIndex, entry: PathEntry) -> RuleTally:
+        tally = RuleTally()
+        issues = tally.issues
 
-        paths = spec.get("paths", {})
-        for path, path_item in paths.items():
-            if not isinstance(path_item, dict):
+        for op in entry.operations:
+            if op.method not in self.HTTP_METHODS:
                 continue
-            for method, operation in path_item.items():
-                if method.lower() not in {
-                    "get",
-                    "post",
-                    "put",
-                    "delete",
-                    "patch",
-                    "head",
-                    "options",
-                }:
-                    continue
 
-                total_ops += 1
-
-                responses = operation.get("responses", {})
-                if not responses:
-                    issues.append(
-                        {
-                            "path": path,
-                            "operation": method,
-                            "location": f"paths.{path}.{method}.responses",
-                            "description": "Operation missing 'responses' definition.",
-                            "severity": "high",
-                            "suggestion": "Add at least one success and one error response.",
-                        }
-                    )
+            path, method = op.path, op.key
+            where = ("paths", path, method, "responses")
+            tally.total += 1
+
+            responses = op.responses
+            if not responses:
+                issues.append(Issue(MISSING_RESPONSES, path, method, where))
+                continue
+
+            valid_codes = set()
+            has_success = False
+            has_error = False
+            invalid_codes = []
+
+            for code in responses.keys():
+                if not self.HTTP_STATUS_CODE_PATTERN.match(code):
+                    invalid_codes.append(code)
                     continue
+                valid_codes.add(code)
+                if code in self.SUCCESS_CODES:
+                    has_success = True
+                if code in self.ERROR_CODES:
+                    has_error = True
 
-                valid_codes = set()
-                has_success = False
-                has_error = False
-                invalid_codes = []
-
-                for code in responses.keys():
-                    if not self.HTTP_STATUS_CODE_PATTERN.match(code):
-                        invalid_codes.append(code)
-                        continue
-                    valid_codes.add(code)
-                    if code in self.SUCCESS_CODES:
-                        has_success = True
-                    if code in self.ERROR_CODES:
-                        has_error = True
-
-                if invalid_codes:
-                    issues.append(
-                        {
-                            "path": path,
-                            "operation": method,
-                            "location": f"paths.{path}.{method}.responses",
-                            "description": f"Invalid HTTP response code(s): {', '.join(invalid_codes)}.",
-                            "severity": "medium",
-                            "suggestion": "Use standard 3-digit HTTP status codes.",
-                        }
+            if invalid_codes:
+                issues.append(
+                    Issue(
+                        INVALID_RESPONSE_CODES,
+                        path,
+                        method,
+                        where,
+                        (", ".join(invalid_codes),),
                     )
+                )
 
-                if not has_success:
-                    issues.append(
-                        {
-                            "path": path,
-                            "operation": method,
-                            "location": f"paths.{path}.{method}.responses",
-                            "description": "No success (2xx) response code defined.",
-                            "severity": "high",
-                            "suggestion": "Add at least one 2xx status code to indicate success.",
-                        }
-                    )
+            if not has_success:
+                issues.append(Issue(NO_SUCCESS_RESPONSE, path, method, where))
 
-                if not has_error:
-                    issues.append(
-                        {
-                            "path": path,
-                            "operation": method,
-                            "location": f"paths.{path}.{method}.responses",
-                            "description": "No error (4xx or 5xx) response code defined.",
-                            "severity": "medium",
-                            "suggestion": "Add at least one 4xx or 5xx status code to indicate errors.",
-                        }
-                    )
+            if not has_error:
+                issues.append(Issue(NO_ERROR_RESPONSE, path, method, where))
+
+            if has_success and has_error and not invalid_codes:
+                tally.passed += 1
 
-                if has_success and has_error and not invalid_codes:
-                    passed_ops += 1
+        return tally
 
-        score = 0 if total_ops == 0 else round(100 * passed_ops / total_ops)
-        return score, issues
+    def finalize(self, tally: RuleTally) -> Tuple[float, List[Issue]]:
+        score = 0 if tally.total == 0 else round(100 * tally.passed / tally.total)
+        return score, tally.issues
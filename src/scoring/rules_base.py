@@ -1,27 +1,194 @@
 from __future__ import annotations
 
-from typing import Protocol, Any, Dict, List, Tuple
+from typing import Protocol, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.core.spec_index import PathEntry, SpecIndex
+from src.scoring.issues import Issue, adapt_issue
+
+
+class RuleTally:
+    """
+    Running counters and issues of a rule over part of a spec.
+
+    Tallies of disjoint parts (the spec-wide checks and each ``paths`` entry)
+    add up to the tally of the whole spec.
+    """
+
+    __slots__ = ("passed", "total", "issues")
+
+    def __init__(
+        self,
+        passed: float = 0,
+        total: int = 0,
+        issues: Optional[List[Issue]] = None,
+    ) -> None:
+        self.passed = passed
+        self.total = total
+        self.issues: List[Issue] = issues if issues is not None else []
+
+    def add(self, other: RuleTally) -> None:
+        self.passed += other.passed
+        self.total += other.total
+        self.issues.extend(other.issues)
 
 
 class Rule(Protocol):
     """
     Protocol for a scoring rule.
+
+    Rules are written as a spec-wide part (``check_spec``) plus a part that
+    only looks at one ``paths`` entry (``check_path``); ``finalize`` turns the
+    summed tally into a score. This lets callers rescore a single changed path
+    item without rerunning the whole rule. ``spec_keys`` lists the top-level
+    keys (dotted for nested sections) both parts read besides the path entry
+    itself; "paths" means ``check_spec`` looks at every path. ``cost`` is the
+    rule's run time relative to the others, as measured by ``bench``; when
+    scoring may stop early, cheap rules run first.
     """
 
     name: str
     weight: float
+    spec_keys: Tuple[str, ...] = ()
+    cost: float = 1.0
 
-    def apply(self, spec: Dict[str, Any]) -> Tuple[float, List[Dict[str, str]]]:
+    def apply(
+        self, spec: Dict[str, Any], index: Optional[SpecIndex] = None
+    ) -> Tuple[float, List[Issue]]:
         """
         Apply the rule to the OpenAPI spec.
 
         Args:
             spec (Dict[str, Any]): The parsed OpenAPI spec.
+            index (Optional[SpecIndex]): Precomputed index of ``spec``. The
+                engine builds it once and shares it between rules; when omitted
+                the rule builds its own.
 
         Returns:
-            Tuple[float, List[Dict[str, Any]]]: A tuple containing:
+            Tuple[float, List[Issue]]: A tuple containing:
                 - score (float): Score from 0 to 100 for this rule.
-                - issues (List[Dict]): List of issues found, each as dict with keys:
-                  path, operation, location, description, severity, suggestion.
+                - issues (List[Issue]): List of issues found, each readable as a
+                  dict with keys: path, operation, location, description,
+                  severity, suggestion.
+        """
+        index = index or SpecIndex(spec)
+        tally = RuleTally()
+        for part in self.iter_parts(index):
+            tally.add(part)
+        return self.finalize(tally)
+
+    def iter_parts(self, index: SpecIndex) -> Iterator[RuleTally]:
+        """
+        Lazily yield the tally of ``check_spec`` and then one per ``paths``
+        entry, so callers can consume issues without holding all of them.
+        Rules without per-path checks only yield the spec-wide tally.
+        """
+        yield self.check_spec(index)
+        if type(self).check_path is Rule.check_path:
+            return
+        for entry in index.paths:
+            yield self.check_path(index, entry)
+
+    def check_spec(self, index: SpecIndex) -> RuleTally:
+        """
+        Run the checks that are not tied to a single ``paths`` entry.
+
+        Rules that only override ``apply``, the contract before rules were
+        split into parts, are run here in one piece: their score becomes a
+        tally of ``score`` passed out of 100 checks, so it is rounded to a
+        whole number like the scores of the built-in rules.
+        """
+        if applies_whole_spec(self):
+            score, issues = self.apply(index.spec)
+            return RuleTally(score, 100, [adapt_issue(i, self.name) for i in issues])
+        return RuleTally()
+
+    def check_path(self, index: SpecIndex, entry: PathEntry) -> RuleTally:
+        """
+        Run the checks for one ``paths`` entry and its operations.
+        """
+        return RuleTally()
+
+    def check_paths(self, index: SpecIndex, entries: Iterable[PathEntry]) -> RuleTally:
+        """
+        Sum of ``check_path`` over ``entries``, e.g. one shard of ``paths``.
+
+        Adding the tallies of consecutive shards in order yields the same
+        counters and issues as a serial run over all paths.
+        """
+        tally = RuleTally()
+        for entry in entries:
+            tally.add(self.check_path(index, entry))
+        return tally
+
+    def finalize(self, tally: RuleTally) -> Tuple[float, List[Issue]]:
         """
-        ...
+        Turn the tally of the whole spec into a score and issue list.
+
+        Implementations may only append to ``tally.issues``: streaming callers
+        pass a tally with the counters of the whole spec but without the
+        issues already emitted, and emit whatever is returned.
+        """
+        score = round(100 * tally.passed / tally.total) if tally.total else 100
+        return score, tally.issues
+
+
+def applies_whole_spec(rule: Rule) -> bool:
+    """
+    Whether ``rule`` only implements ``apply`` and so must be rerun on the
+    whole spec whenever any part of it changes.
+    """
+    cls = type(rule)
+    return (
+        cls.apply is not Rule.apply
+        and cls.check_spec is Rule.check_spec
+        and cls.check_path is Rule.check_path
+    )
+
+
+class ApplyRule(Rule):
+    """
+    Adapts an object that implements only ``name``, ``weight`` and
+    ``apply(spec)`` to the ``Rule`` protocol.
+    """
+
+    def __init__(self, wrapped: Any) -> None:
+        self.wrapped = wrapped
+        self.name = wrapped.name
+        self.weight = wrapped.weight
+        self.cost = getattr(wrapped, "cost", Rule.cost)
+
+    def apply(
+        self, spec: Dict[str, Any], index: Optional[SpecIndex] = None
+    ) -> Tuple[float, List[Issue]]:
+        return self.wrapped.apply(spec)
+
+
+RULE_METHODS = ("iter_parts", "check_spec", "check_path", "check_paths", "finalize")
+
+
+def as_rule(obj: Any) -> Rule:
+    """
+    Return ``obj`` if it implements the ``Rule`` protocol, wrapped in an
+    ``ApplyRule`` if it only implements ``apply``.
+
+    ``Rule`` subclasses are returned unchanged; one that only overrides
+    ``apply`` is handled by ``Rule.check_spec``.
+
+    Raises:
+        TypeError: If ``obj`` lacks ``name`` or ``weight``, or implements
+            neither the ``Rule`` methods nor ``apply``.
+    """
+    if Rule in type(obj).__mro__:
+        return obj
+    label = getattr(obj, "name", type(obj).__name__)
+    missing = [attr for attr in ("name", "weight") if not hasattr(obj, attr)]
+    if missing:
+        raise TypeError(f"Rule {label!r} has no {' or '.join(missing)} attribute")
+    if all(callable(getattr(obj, method, None)) for method in RULE_METHODS):
+        return obj
+    if callable(getattr(obj, "apply", None)):
+        return ApplyRule(obj)
+    raise TypeError(
+        f"Rule {label!r} implements neither check_spec/check_path nor apply. "
+        "Subclass src.scoring.rules_base.Rule."
+    )
@@ -1,119 +1,160 @@
 from __future__ import annotations
 
-from typing import Dict, Any, Tuple, List
-
-from src.scoring.rules_base import Rule
-
-
-def is_valid_schema(schema: Dict[str, Any]) -> Tuple[bool, str, str]:
+from typing import Dict, Any, FrozenSet, Hashable, Tuple, List, Optional
+
+from src.core.ref_resolver import RefCycleError, RefResolutionError, RefResolver
+from src.core.spec_index import PathEntry, SchemaLocation, SpecIndex
+from src.scoring.issues import (
+    FREE_FORM_OBJECT,
+    INVALID_SCHEMA_TYPE,
+    MISSING_ARRAY_ITEMS,
+    MISSING_SCHEMA_TYPE,
+    REF_CYCLE,
+    SCHEMA_NOT_OBJECT,
+    UNRESOLVABLE_REF,
+    Issue,
+    IssueKind,
+)
+from src.scoring.rules_base import Rule, RuleTally
+
+SchemaVerdict = Tuple[bool, Optional[IssueKind], Tuple[Any, ...]]
+VALID: SchemaVerdict = (True, None, ())
+
+
+def is_valid_schema(
+    schema: Dict[str, Any],
+    resolver: Optional[RefResolver] = None,
+    _active_refs: FrozenSet[str] = frozenset(),
+) -> SchemaVerdict:
+    """
+    Judge a schema, following local refs through ``resolver``.
+
+    Returns:
+        SchemaVerdict: ``(ok, kind, args)``; ``kind`` and ``args`` describe
+            the problem when ``ok`` is False.
+    """
     if not isinstance(schema, dict):
-        return (
-            False,
-            "Schema is not a dictionary.",
-            "Ensure the schema is a valid object.",
-        )
+        return False, SCHEMA_NOT_OBJECT, ()
 
     if "$ref" in schema:
-        return True, "", ""
+        ref = schema["$ref"]
+        # Without a resolver, and for external refs, trust the reference.
+        # A ref already being judged further up, through the items or
+        # additionalProperties of a schema, is a recursive model and is
+        # judged at its definition.
+        if resolver is None or not resolver.is_local(ref) or ref in _active_refs:
+            return VALID
+        try:
+            target = resolver.resolve(schema)
+        except RefCycleError as e:
+            return False, REF_CYCLE, (" -> ".join(e.chain),)
+        except RefResolutionError:
+            return False, UNRESOLVABLE_REF, (ref,)
+        return is_valid_schema(target, resolver, _active_refs | {ref})
 
     schema_type = schema.get("type")
     valid_types = {"string", "number", "integer", "boolean", "array", "object"}
 
     if not schema_type:
-        return (
-            False,
-            "Missing 'type' in schema.",
-            "Add a 'type' field, such as 'object', to the schema.",
-        )
+        return False, MISSING_SCHEMA_TYPE, ()
 
     if schema_type not in valid_types:
-        return (
-            False,
-            f"Invalid schema type: {schema_type}.",
-            "Use a valid type like 'object', 'array', etc.",
-        )
+        return False, INVALID_SCHEMA_TYPE, (schema_type,)
 
     if schema_type == "object":
         has_props = isinstance(schema.get("properties"), dict)
         has_structural = any(k in schema for k in ("allOf", "anyOf", "oneOf"))
         if has_props or has_structural:
-            return True, "", ""
+            return VALID
         ap = schema.get("additionalProperties")
         if ap is False:
-            return True, "", ""
+            return VALID
         if isinstance(ap, dict):
-            return is_valid_schema(ap)
-        return (
-            False,
-            "Free-form object without defined structure.",
-            "Define 'properties' or use a valid structure.",
-        )
+            return is_valid_schema(ap, resolver, _active_refs)
+        return False, FREE_FORM_OBJECT, ()
 
     if schema_type == "array":
         items = schema.get("items")
         if not isinstance(items, dict):
-            return (
-                False,
-                "Missing or invalid 'items' in array schema.",
-                "Add an 'items' field with a valid schema.",
-            )
-        return is_valid_schema(items)
-
-    return True, "", ""
+            return False, MISSING_ARRAY_ITEMS, ()
+        return is_valid_schema(items, resolver, _active_refs)
 
+    return VALID
 
-def collect_schemas(spec: Dict[str, Any]) -> List[Tuple[Dict[str, Any], str, str, str]]:
-    found: List[Tuple[Dict[str, Any], str, str, str]] = []
 
-    def walk(obj: Any, context: str, path: str, operation: str):
-        if isinstance(obj, dict):
-            if "schema" in obj:
-                found.append((obj["schema"], f"{context}.schema", path, operation))
-            for k, v in obj.items():
-                walk(v, f"{context}.{k}", path, operation)
-        elif isinstance(obj, list):
-            for i, item in enumerate(obj):
-                walk(item, f"{context}[{i}]", path, operation)
+def schema_shape(schema: Any) -> Optional[Hashable]:
+    """
+    Hashable projection of the fields ``is_valid_schema`` reads.
 
-    for path, methods in spec.get("paths", {}).items():
-        for method, op in methods.items():
-            if not isinstance(op, dict):
-                continue
-            walk(op, f"paths.{path}.{method}", path, method)
+    Schemas with equal shapes get equal verdicts within one spec, so the
+    projection serves as the structural key of ``SchemaMemo``. It skips
+    ``properties`` and other members that do not affect the verdict. That
+    keeps it cheaper than a full canonical form of large object schemas.
+    """
+    if not isinstance(schema, dict):
+        return None
+    if "$ref" in schema:
+        ref = schema["$ref"]
+        return ("$ref", ref) if isinstance(ref, str) else None
+    schema_type = schema.get("type")
+    if isinstance(schema_type, (list, dict)):
+        return None
+    if schema_type == "object":
+        ap = schema.get("additionalProperties")
+        if isinstance(ap, dict):
+            nested = schema_shape(ap)
+            if nested is None:
+                return None
+        else:
+            nested = ap is False
+        return (
+            "object",
+            isinstance(schema.get("properties"), dict),
+            any(k in schema for k in ("allOf", "anyOf", "oneOf")),
+            nested,
+        )
+    if schema_type == "array":
+        items = schema.get("items")
+        if not isinstance(items, dict):
+            return ("array", None)
+        nested = schema_shape(items)
+        return None if nested is None else ("array", nested)
+    return ("type", schema_type)
 
-    for name, schema in spec.get("components", {}).get("schemas", {}).items():
-        found.append((schema, f"components.schemas.{name}", "N/A", "N/A"))
 
-    return found
+def collect_schemas(spec: Dict[str, Any]) -> List[SchemaLocation]:
+    return SpecIndex(spec).schema_locations
 
 
 class SchemaTypesRule(Rule):
     name = "Schema & Types"
     weight = 20
+    cost = 27
+    spec_keys = ("components",)
 
-    def apply(self, spec: Dict[str, Any]) -> Tuple[float, List[Dict[str, str]]]:
-        issues = []
-        total = 0
-        valid = 0
-        schemas = collect_schemas(spec)
+    def _check_schemas(
+        self, index: SpecIndex, schemas: List[SchemaLocation]
+    ) -> RuleTally:
+        tally = RuleTally()
+        resolver = index.resolver
+
+        def judge(schema: Any) -> SchemaVerdict:
+            return is_valid_schema(schema, resolver)
 
         for schema, context, path, method in schemas:
-            total += 1
-            ok, description, suggestion = is_valid_schema(schema)
-            if ok:
-                valid += 1
+            tally.total += 1
+            _, kind, args = index.schema_memo.get(schema, judge, schema_shape)
+            if kind is None:
+                tally.passed += 1
             else:
-                issues.append(
-                    {
-                        "path": path,
-                        "operation": method,
-                        "location": context,
-                        "description": description,
-                        "severity": "high",
-                        "suggestion": suggestion,
-                    }
-                )
-
-        score = round(100 * valid / total) if total else 100
-
-        return score, issues
+                tally.issues.append(Issue(kind, path, method, context, args))
+        return tally
+
+    def check_spec(self, index: SpecIndex) -> RuleTally:
+        return self._check_schemas(index, index.component_schema_locations())
+
+    def check_path(self, index: SpecIndex, entry: PathEntry) -> RuleTally:
+        schemas = []
+        for op in entry.operations:
+            schemas.extend(index.operation_schema_locations(op))
+        return self._check_schemas(index, schemas)
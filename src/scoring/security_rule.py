@@ -1,82 +1,83 @@
 from __future__ import annotations
 
-from typing import Dict, Any, Tuple, List, Set
-from src.scoring.rules_base import Rule
+from typing import Tuple, List, Set
+
+from src.core.spec_index import PathEntry, SpecIndex
+from src.scoring.issues import (
+    NO_OPERATIONS,
+    NO_SECURITY_REFERENCE,
+    NO_SECURITY_SCHEMES,
+    Issue,
+    operation_label,
+)
+from src.scoring.rules_base import Rule, RuleTally
 
 
 class SecurityRule(Rule):
     name = "Security"
     weight = 10
+    cost = 1
     description = "Defined and referenced security schemes where needed"
+    HTTP_METHODS = {"get", "post", "put", "delete", "patch"}
+    spec_keys = ("components.securitySchemes", "security")
 
-    def apply(self, spec: Dict[str, Any]) -> Tuple[float, List[Dict[str, str]]]:
-        issues: List[Dict[str, str]] = []
-        total_ops = 0
-        secured_ops = 0
-
-        security_schemes = spec.get("components", {}).get("securitySchemes", {})
-        defined_schemes: Set[str] = set(security_schemes.keys())
+    @staticmethod
+    def _defined_schemes(index: SpecIndex) -> Set[str]:
+        security_schemes = index.components.get("securitySchemes", {})
+        return set(security_schemes.keys())
 
-        if not defined_schemes:
-            issues.append(
-                {
-                    "path": "components.securitySchemes",
-                    "operation": "GLOBAL",
-                    "location": "components.securitySchemes",
-                    "description": "No security schemes defined",
-                    "severity": "high",
-                    "suggestion": "Define security schemes (e.g., API key, OAuth2) under components.securitySchemes",
-                }
+    def check_spec(self, index: SpecIndex) -> RuleTally:
+        tally = RuleTally()
+        if not self._defined_schemes(index):
+            tally.issues.append(
+                Issue(
+                    NO_SECURITY_SCHEMES,
+                    "components.securitySchemes",
+                    "GLOBAL",
+                    ("components", "securitySchemes"),
+                )
             )
 
-        paths = spec.get("paths", {})
-        for path, path_item in paths.items():
-            if not isinstance(path_item, dict):
-                continue
+        return tally
 
-            for method, operation in path_item.items():
-                method_lower = method.lower()
-                if method_lower not in {"get", "post", "put", "delete", "patch"}:
-                    continue
+    def check_path(self, index: SpecIndex, entry: PathEntry) -> RuleTally:
+        tally = RuleTally()
+        defined_schemes = self._defined_schemes(index)
 
-                total_ops += 1
-                op_security = operation.get("security", spec.get("security", []))
+        for op in entry.operations:
+            if op.method not in self.HTTP_METHODS:
+                continue
 
-                referenced_schemes: Set[str] = set()
-                for sec_req in op_security or []:
-                    if isinstance(sec_req, dict):
-                        referenced_schemes.update(k for k in sec_req.keys() if k)
+            tally.total += 1
 
-                if referenced_schemes & defined_schemes:
-                    secured_ops += 1
-                elif defined_schemes:
-                    issues.append(
-                        {
-                            "path": path,
-                            "operation": method.upper(),
-                            "location": f"paths.{path}.{method}.security",
-                            "description": "No valid security scheme referenced",
-                            "severity": "high",
-                            "suggestion": "Reference at least one defined security scheme",
-                        }
+            referenced_schemes: Set[str] = set()
+            for sec_req in op.security or []:
+                if isinstance(sec_req, dict):
+                    referenced_schemes.update(k for k in sec_req.keys() if k)
+
+            if referenced_schemes & defined_schemes:
+                tally.passed += 1
+            elif defined_schemes:
+                tally.issues.append(
+                    Issue(
+                        NO_SECURITY_REFERENCE,
+                        op.path,
+                        operation_label(op.key),
+                        ("paths", op.path, op.key, "security"),
                     )
+                )
+
+        return tally
 
+    def finalize(self, tally: RuleTally) -> Tuple[float, List[Issue]]:
+        issues = tally.issues
         # TODO: this case (no operation case) should be handled in separate class
         # We only handle this case in this class, so in similar classes (etc response
         # code rule) we just return empty list with score = 0
-        if total_ops == 0:
+        if tally.total == 0:
             score = 0
-            issues.append(
-                {
-                    "path": "paths",
-                    "operation": "GLOBAL",
-                    "location": "paths",
-                    "description": "No operations defined in the OpenAPI specification to evaluate security",
-                    "severity": "high",
-                    "suggestion": "Define at least one path and operation (e.g., GET, POST) to apply security rules",
-                }
-            )
+            issues.append(Issue(NO_OPERATIONS, "paths", "GLOBAL", ("paths",)))
         else:
-            score = round(100 * secured_ops / total_ops)
+            score = round(100 * tally.passed / tally.total)
 
         return score, issues
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+from src.utils.disk_cache import DEFAULT_MAX_BYTES, DiskCache
+
+if TYPE_CHECKING:
+    import requests
+
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_MAX_SPEC_BYTES = 64 * 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+
+
+class FetchError(Exception):
+    """Raised when a remote spec cannot be downloaded."""
+
+
+class SpecFetcher:
+    """
+    Downloads remote specs over a pooled, keep-alive ``requests`` session.
+
+    Responses are requested gzip-compressed and streamed, aborting once the
+    decoded body grows past ``max_bytes`` or the whole download takes longer
+    than ``timeout`` seconds. When ``cache_dir`` is given, bodies are stored
+    with their ETag/Last-Modified validators and later fetches of the same
+    URL are sent as conditional requests, so an unchanged spec costs a 304.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_bytes: int = DEFAULT_MAX_SPEC_BYTES,
+        cache_max_bytes: int = DEFAULT_MAX_BYTES,
+        pool_size: int = 10,
+    ) -> None:
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+        self.pool_size = pool_size
+        self.cache = (
+            DiskCache(cache_dir, cache_max_bytes, suffix=".http") if cache_dir else None
+        )
+        self._session: Optional[requests.Session] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Sessions hold live sockets; worker processes open their own.
+        state = self.__dict__.copy()
+        state["_session"] = None
+        return state
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            # requests and urllib3 take long to import; only URL specs need them.
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=self.pool_size, pool_maxsize=self.pool_size
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers["Accept-Encoding"] = "gzip, deflate"
+            self._session = session
+        return self._session
+
+    def fetch(self, url: str) -> bytes:
+        """
+        Download ``url``, revalidating a cached copy when one exists.
+
+        Args:
+            url (str): http(s) URL of the spec.
+
+        Returns:
+            bytes: The decoded response body.
+
+        Raises:
+            FetchError: On connection errors, timeouts, error statuses or
+                bodies larger than ``max_bytes``.
+        """
+        return self.fetch_with_status(url)[1]
+
+    def fetch_with_status(self, url: str) -> Tuple[int, bytes]:
+        """
+        Like ``fetch``, but also return the HTTP status of the response, e.g.
+        304 when the cached copy was still current. The status is returned
+        rather than stored because one fetcher is shared between threads.
+
+        Returns:
+            Tuple[int, bytes]: The status code and the decoded body.
+        """
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        cached = self._load(key)
+        headers: Dict[str, str] = {}
+        if cached is not None:
+            meta = cached[0]
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        session = self.session
+        import requests
+
+        deadline = time.monotonic() + self.timeout
+        try:
+            with session.get(
+                url, headers=headers, stream=True, timeout=self.timeout
+            ) as response:
+                status = response.status_code
+                if status == 304 and cached is not None:
+                    return status, cached[1]
+                response.raise_for_status()
+                body = self._read_body(response, deadline)
+        except requests.RequestException as e:
+            raise FetchError(str(e))
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if self.cache is not None and (etag or last_modified):
+            meta = {"url": url, "etag": etag, "last_modified": last_modified}
+            self.cache.put(key, json.dumps(meta).encode("utf-8") + b"\n" + body)
+        return status, body
+
+    def _read_body(self, response: requests.Response, deadline: float) -> bytes:
+        declared = response.headers.get("Content-Length")
+        if (
+            declared
+            and declared.isdigit()
+            and "Content-Encoding" not in response.headers
+            and int(declared) > self.max_bytes
+        ):
+            raise FetchError(f"Spec exceeds {self.max_bytes} bytes")
+
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(CHUNK_SIZE):
+            size += len(chunk)
+            if size > self.max_bytes:
+                raise FetchError(f"Spec exceeds {self.max_bytes} bytes")
+            if time.monotonic() > deadline:
+                raise FetchError(f"Download took longer than {self.timeout}s")
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    def _load(self, key: str) -> Optional[Tuple[Dict[str, Any], bytes]]:
+        if self.cache is None:
+            return None
+        data = self.cache.get(key)
+        if data is None:
+            return None
+        header, _, body = data.partition(b"\n")
+        try:
+            return json.loads(header), body
+        except ValueError:
+            return None
+
+    def clear(self) -> None:
+        if self.cache is not None:
+            self.cache.clear()
+
+
+default_fetcher = SpecFetcher()
@@ -1,19 +1,33 @@
+import hashlib
 import json
-import requests
-import yaml
-from openapi_spec_validator import validate
+from typing import Any, Optional
+
+from src.utils.http import FetchError, SpecFetcher, default_fetcher
+from src.utils.lazy_spec import lazy_loads
+from src.utils.spec_cache import SpecCache
+from src.utils.validation import VerdictCache, validate_spec
 
 
 class SpecLoadError(Exception):
     """Custom error when spec loading fails."""
 
 
-def load_spec(input_path: str) -> dict:
+def load_spec(
+    input_path: str,
+    validation: str = "full",
+    snapshots: Optional[SpecCache] = None,
+    verdicts: Optional[VerdictCache] = None,
+) -> dict:
     """
     Loads and validates an OpenAPI 3.x spec from a local file or URL.
 
     Args:
         input_path (str): Path to local file or URL.
+        validation (str): Validation level, one of "off", "structural", "full".
+        snapshots (Optional[SpecCache]): Cache of parsed specs; unchanged
+            bytes are loaded from it instead of being parsed again.
+        verdicts (Optional[VerdictCache]): Cache of validation verdicts;
+            defaults to the process-wide in-memory cache.
 
     Returns:
         dict: Parsed OpenAPI spec.
@@ -21,36 +35,119 @@ def load_spec(input_path: str) -> dict:
     Raises:
         SpecLoadError: If the spec is invalid or cannot be loaded.
     """
-    spec_content = None
+    return parse_spec(read_spec_source(input_path), validation, snapshots, verdicts)
+
+
+def read_spec_source(input_path: str, fetcher: Optional[SpecFetcher] = None) -> bytes:
+    """
+    Reads the raw bytes of a spec from a local file or URL.
+
+    Args:
+        input_path (str): Path to local file or URL.
+        fetcher (Optional[SpecFetcher]): Downloader for URLs; defaults to the
+            process-wide pooled fetcher without an HTTP cache.
+
+    Returns:
+        bytes: Unparsed spec content.
+
+    Raises:
+        SpecLoadError: If the spec cannot be read.
+    """
     try:
         if input_path.startswith("http://") or input_path.startswith("https://"):
-            response = requests.get(input_path)
-            response.raise_for_status()
-            spec_content = response.text
-        else:
-            with open(input_path, "r", encoding="utf-8") as f:
-                spec_content = f.read()
+            return (fetcher or default_fetcher).fetch(input_path)
+        with open(input_path, "rb") as f:
+            return f.read()
+    except (OSError, FetchError) as e:
+        raise SpecLoadError(f"Failed to load spec: {e}")
 
-        if not spec_content.strip():
-            raise SpecLoadError("Spec content is empty.")
 
-        try:
-            spec = yaml.safe_load(spec_content)
-        except yaml.YAMLError:
-            try:
-                spec = json.loads(spec_content)
-            except json.JSONDecodeError:
-                raise SpecLoadError("Invalid YAML/JSON format.")
+def parse_spec(
+    content: bytes,
+    validation: str = "full",
+    snapshots: Optional[SpecCache] = None,
+    verdicts: Optional[VerdictCache] = None,
+) -> dict:
+    """
+    Parses and validates raw spec content.
+
+    Args:
+        content (bytes): YAML or JSON document, UTF-8 encoded.
+        validation (str): Validation level, one of "off", "structural", "full".
+        snapshots (Optional[SpecCache]): Cache of parsed specs by content
+            digest; valid specs are stored in it after parsing.
+        verdicts (Optional[VerdictCache]): Cache of validation verdicts;
+            defaults to the process-wide in-memory cache.
+
+    Returns:
+        dict: Parsed OpenAPI spec.
 
-        if not isinstance(spec, dict):
-            raise SpecLoadError("Loaded spec is not a valid object.")
+    Raises:
+        SpecLoadError: If the content is not a valid OpenAPI 3.x spec.
+    """
+    digest = hashlib.sha256(content).hexdigest()
+    spec = snapshots.get(digest) if snapshots is not None else None
+    parsed = spec is None
+    if spec is None:
+        spec = decode_spec(content)
+    errors = validate_spec(
+        spec, validation, digest=digest, max_errors=1, verdicts=verdicts
+    )
+    if errors:
+        raise SpecLoadError(f"OpenAPI validation failed: {errors[0]}")
+    if parsed and snapshots is not None:
+        snapshots.put(digest, spec)
+    return spec
+
+
+def decode_spec(content: bytes, lazy: bool = False) -> dict:
+    """
+    Parses raw spec content without validating it.
+
+    Args:
+        content (bytes): YAML or JSON document, UTF-8 encoded.
+        lazy (bool): Decode the path items and component entries of a JSON
+            document only when they are first accessed; see ``lazy_loads``.
+            YAML documents are always decoded in full.
+
+    Returns:
+        dict: Parsed document.
+
+    Raises:
+        SpecLoadError: If the content is not a YAML/JSON object.
+    """
+    try:
+        spec_content = content.decode("utf-8")
+    except UnicodeDecodeError as e:
+        raise SpecLoadError(f"Spec is not valid UTF-8: {e}")
 
+    if not spec_content.strip():
+        raise SpecLoadError("Spec content is empty.")
+
+    spec: Any = None
+    if spec_content.lstrip().startswith("{"):
+        # Most JSON specs parse far faster with json than with PyYAML, and
+        # this keeps yaml unimported for them; flow-style YAML falls through.
         try:
-            validate(spec)
-        except Exception as e:
-            raise SpecLoadError(f"OpenAPI validation failed: {e}")
+            spec = lazy_loads(spec_content) if lazy else json.loads(spec_content)
+        except json.JSONDecodeError:
+            spec = _load_yaml(spec_content)
+    else:
+        spec = _load_yaml(spec_content)
 
-        return spec
+    if not isinstance(spec, dict):
+        raise SpecLoadError("Loaded spec is not a valid object.")
 
-    except (OSError, requests.RequestException) as e:
-        raise SpecLoadError(f"Failed to load spec: {e}")
+    return spec
+
+
+def _load_yaml(spec_content: str) -> Any:
+    import yaml
+
+    try:
+        return yaml.safe_load(spec_content)
+    except yaml.YAMLError:
+        try:
+            return json.loads(spec_content)
+        except json.JSONDecodeError:
+            raise SpecLoadError("Invalid YAML/JSON format.")
@@ -0,0 +1,56 @@
+import os
+import pickle
+from typing import Any, Dict, Optional
+
+from src.utils.disk_cache import DEFAULT_MAX_BYTES, DiskCache
+
+# Bump whenever the snapshot layout changes so stale entries are ignored.
+SNAPSHOT_VERSION = b"spec-snapshot-1\n"
+DEFAULT_SPEC_CACHE_DIR = os.path.join(".cache", "api-scoring", "specs")
+
+
+class SpecCache:
+    """
+    Snapshots of parsed specs keyed by the sha256 digest of their raw bytes.
+
+    Snapshots are pickled, which loads a large spec a hundred times faster
+    than ``yaml.safe_load`` and keeps YAML timestamps and shared anchor
+    nodes intact. A snapshot only records how the bytes parse, not whether
+    the spec is valid. ``load_spec`` stores only specs that passed
+    validation, but ``ScoringEngine`` also stores specs scored with
+    validation off or with collected validation errors, and validates
+    every snapshot it loads at the requested level. The verdicts live in
+    the ``VerdictCache``. Entries are evicted least recently used first
+    once the directory grows past ``max_bytes``.
+
+    Snapshots are unpickled, so the directory must only be writable by
+    trusted users, like the other caches.
+    """
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_SPEC_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        self.store = DiskCache(directory, max_bytes, suffix=".pickle")
+
+    def get(self, digest: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the parsed spec stored for ``digest``, or None on a miss or
+        an unreadable entry.
+        """
+        data = self.store.get(digest)
+        if data is None or not data.startswith(SNAPSHOT_VERSION):
+            return None
+        try:
+            spec = pickle.loads(data[len(SNAPSHOT_VERSION) :])
+        except Exception:
+            return None
+        return spec if isinstance(spec, dict) else None
+
+    def put(self, digest: str, spec: Dict[str, Any]) -> None:
+        data = pickle.dumps(spec, protocol=pickle.HIGHEST_PROTOCOL)
+        self.store.put(digest, SNAPSHOT_VERSION + data)
+
+    def clear(self) -> None:
+        self.store.clear()
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import json
+import random
+from dataclasses import dataclass
+from typing import Any, Dict
+
+COLLECTION_METHODS = ("get", "post", "put", "patch", "delete")
+ITEM_METHODS = ("get", "put", "delete", "patch", "post")
+BODY_METHODS = {"post", "put", "patch"}
+SPEC_FORMATS = ("json", "yaml")
+
+
+@dataclass(frozen=True)
+class SpecShape:
+    """
+    Size and quality knobs of a synthetic spec.
+
+    Attributes:
+        paths (int): Number of ``paths`` entries; even entries are collections
+            (``/resources{n}``), odd ones items (``/resources{n}/{id}``).
+        methods_per_path (int): Operations per path, 1 to 5.
+        schema_depth (int): Nesting depth of every component schema.
+        schemas (int): Number of component schemas; 0 picks one per ten paths.
+        ref_density (float): Share of schemas (in operations and nested in
+            components) written as a ``$ref`` instead of inline.
+        missing_descriptions (float): Share of operations without description.
+        missing_examples (float): Share of media types without example.
+        missing_security (float): Share of operations without security.
+        seed (int): Random seed; equal shapes always produce equal specs.
+    """
+
+    paths: int = 100
+    methods_per_path: int = 2
+    schema_depth: int = 3
+    schemas: int = 0
+    ref_density: float = 0.5
+    missing_descriptions: float = 0.2
+    missing_examples: float = 0.2
+    missing_security: float = 0.2
+    seed: int = 0
+
+
+class _Builder:
+    def __init__(self, shape: SpecShape) -> None:
+        self.shape = shape
+        self.rng = random.Random(shape.seed)
+        self.model_count = shape.schemas or max(1, shape.paths // 10)
+
+    def chance(self, share: float) -> bool:
+        return self.rng.random() < share
+
+    def ref(self, first: int = 0) -> Dict[str, Any]:
+        index = self.rng.randrange(first, self.model_count)
+        return {"$ref": f"#/components/schemas/Model{index}"}
+
+    def schema(self, depth: int, model: int = -1) -> Dict[str, Any]:
+        """
+        Object schema nested ``depth`` levels deep. Nested levels of model N
+        may refer to models after N, so refs never form cycles.
+        """
+        properties: Dict[str, Any] = {
+            "id": {"type": "string"},
+            "count": {"type": "integer"},
+            "tags": {"type": "array", "items": {"type": "string"}},
+        }
+        if depth > 1:
+            if model + 1 < self.model_count and self.chance(self.shape.ref_density):
+                properties["child"] = self.ref(model + 1)
+            else:
+                properties["child"] = self.schema(depth - 1, model)
+        return {"type": "object", "properties": properties}
+
+    def payload_schema(self) -> Dict[str, Any]:
+        if self.chance(self.shape.ref_density):
+            return self.ref()
+        return self.schema(self.shape.schema_depth)
+
+    def media(self) -> Dict[str, Any]:
+        media: Dict[str, Any] = {"schema": self.payload_schema()}
+        if not self.chance(self.shape.missing_examples):
+            media["example"] = {"id": f"id-{self.rng.randrange(10**6)}", "count": 1}
+        return {"application/json": media}
+
+    def operation(self, number: int, method: str, item: bool) -> Dict[str, Any]:
+        op: Dict[str, Any] = {
+            "operationId": f"{method}Resource{number}{'Item' if item else ''}",
+            "summary": f"{method.upper()} resource {number}",
+            "tags": [f"group{number % 10}"],
+        }
+        if not self.chance(self.shape.missing_descriptions):
+            op["description"] = (
+                f"Handles {method.upper()} requests for resource {number} "
+                "and returns its structured representation."
+            )
+        if item:
+            op["parameters"] = [
+                {
+                    "name": "id",
+                    "in": "path",
+                    "required": True,
+                    "schema": {"type": "string"},
+                }
+            ]
+        if method in BODY_METHODS:
+            op["requestBody"] = {"required": True, "content": self.media()}
+        op["responses"] = {
+            "200": {"description": "Success", "content": self.media()},
+            "404": {
+                "description": "Not found",
+                "content": {
+                    "application/json": {
+                        "schema": {"$ref": "#/components/schemas/Error"}
+                    }
+                },
+            },
+        }
+        if not self.chance(self.shape.missing_security):
+            op["security"] = [{"apiKey": []}]
+        return op
+
+    def build(self) -> Dict[str, Any]:
+        shape = self.shape
+        methods_per_path = min(max(shape.methods_per_path, 1), len(ITEM_METHODS))
+        paths: Dict[str, Any] = {}
+        for i in range(shape.paths):
+            number, item = divmod(i, 2)
+            methods = ITEM_METHODS if item else COLLECTION_METHODS
+            path = f"/resources{number}/{{id}}" if item else f"/resources{number}"
+            paths[path] = {
+                method: self.operation(number, method, bool(item))
+                for method in methods[:methods_per_path]
+            }
+
+        schemas: Dict[str, Any] = {
+            f"Model{n}": self.schema(shape.schema_depth, n)
+            for n in range(self.model_count)
+        }
+        schemas["Error"] = {
+            "type": "object",
+            "properties": {"message": {"type": "string"}},
+        }
+        return {
+            "openapi": "3.0.3",
+            "info": {
+                "title": "Synthetic API",
+                "version": "1.0.0",
+                "description": f"Generated with {shape}",
+            },
+            "servers": [{"url": "https://api.example.com/v1"}],
+            "paths": paths,
+            "components": {
+                "schemas": schemas,
+                "securitySchemes": {
+                    "apiKey": {"type": "apiKey", "in": "header", "name": "X-API-Key"}
+                },
+            },
+        }
+
+
+def generate_spec(shape: SpecShape = SpecShape()) -> Dict[str, Any]:
+    """
+    Build a synthetic, valid OpenAPI 3.0 spec.
+
+    Args:
+        shape (SpecShape): Size and quality of the spec.
+
+    Returns:
+        dict: The parsed spec; identical for identical shapes.
+    """
+    return _Builder(shape).build()
+
+
+def dump_spec(spec: Dict[str, Any], fmt: str = "json") -> str:
+    """
+    Serialize a spec as "json" or "yaml".
+    """
+    if fmt == "json":
+        return json.dumps(spec, indent=2)
+    elif fmt == "yaml":
+        import yaml
+
+        return yaml.safe_dump(spec, sort_keys=False)
+    else:
+        raise ValueError(f"Unsupported spec format: {fmt}")
+
+
+def write_spec(shape: SpecShape, output_path: str, fmt: str = "") -> str:
+    """
+    Generate a spec and write it to ``output_path``.
+
+    Args:
+        shape (SpecShape): Size and quality of the spec.
+        output_path (str): Destination file.
+        fmt (str): "json" or "yaml"; guessed from the file suffix if empty.
+
+    Returns:
+        str: The format that was written.
+    """
+    if not fmt:
+        fmt = "yaml" if output_path.lower().endswith((".yaml", ".yml")) else "json"
+    content = dump_spec(generate_spec(shape), fmt)
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    return fmt
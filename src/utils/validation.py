@@ -0,0 +1,209 @@
+import json
+import threading
+from collections import OrderedDict
+from itertools import islice
+from typing import Any, Dict, Hashable, Iterator, List, Mapping, Optional, cast
+
+from src.core.spec_index import HTTP_METHODS
+from src.utils.disk_cache import DEFAULT_MAX_BYTES, DiskCache
+
+VALIDATION_LEVELS = ("off", "structural", "full")
+DEFAULT_MAX_ERRORS = 20
+
+COMPONENT_SECTIONS = (
+    "schemas",
+    "responses",
+    "parameters",
+    "examples",
+    "requestBodies",
+    "headers",
+    "securitySchemes",
+    "links",
+    "callbacks",
+)
+
+
+class VerdictCache:
+    """
+    Validation verdicts keyed by spec content hash and validation level.
+
+    Verdicts are kept in a bounded in-memory LRU and, when ``directory`` is
+    given, persisted so later processes can skip validating the same bytes.
+    The in-memory LRU is safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_entries: int = 1024,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        self.max_entries = max_entries
+        self._memory: "OrderedDict[str, List[str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._store = (
+            DiskCache(directory, max_bytes, suffix=".verdict") if directory else None
+        )
+
+    @staticmethod
+    def key(digest: str, level: str, max_errors: int) -> str:
+        return f"{digest}-{level}-{max_errors}"
+
+    def get(self, key: str) -> Optional[List[str]]:
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+        if self._store is not None:
+            data = self._store.get(key)
+            if data is not None:
+                errors = json.loads(data)
+                self._remember(key, errors)
+                return errors
+        return None
+
+    def put(self, key: str, errors: List[str]) -> None:
+        self._remember(key, errors)
+        if self._store is not None:
+            self._store.put(key, json.dumps(errors).encode("utf-8"))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+        if self._store is not None:
+            self._store.clear()
+
+    def _remember(self, key: str, errors: List[str]) -> None:
+        with self._lock:
+            self._memory[key] = errors
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+
+default_verdicts = VerdictCache()
+
+
+def validate_spec(
+    spec: Dict[str, Any],
+    level: str = "full",
+    digest: Optional[str] = None,
+    max_errors: int = DEFAULT_MAX_ERRORS,
+    verdicts: Optional[VerdictCache] = None,
+) -> List[str]:
+    """
+    Validate a parsed spec and return up to ``max_errors`` error messages.
+
+    Args:
+        spec (Dict[str, Any]): Parsed OpenAPI document.
+        level (str): "off" skips validation, "structural" runs cheap checks of
+            the document skeleton, "full" runs openapi-spec-validator.
+        digest (Optional[str]): Content hash of the raw spec. When given, the
+            verdict is looked up in and stored to ``verdicts``.
+        max_errors (int): Stop collecting after this many errors.
+        verdicts (Optional[VerdictCache]): Verdict cache, defaults to the
+            process-wide in-memory cache.
+
+    Returns:
+        List[str]: Validation errors; empty when the spec is valid.
+    """
+    if level not in VALIDATION_LEVELS:
+        raise ValueError(f"Unsupported validation level: {level}")
+    if level == "off":
+        return []
+
+    verdicts = verdicts if verdicts is not None else default_verdicts
+    key = VerdictCache.key(digest, level, max_errors) if digest else None
+    if key is not None:
+        cached = verdicts.get(key)
+        if cached is not None:
+            return cached
+
+    if level == "structural":
+        errors = list(islice(iter_structural_errors(spec), max_errors))
+    else:
+        errors = full_validation_errors(spec, max_errors)
+
+    if key is not None:
+        verdicts.put(key, errors)
+    return errors
+
+
+def full_validation_errors(spec: Dict[str, Any], max_errors: int) -> List[str]:
+    """
+    Collect up to ``max_errors`` errors from openapi-spec-validator.
+    """
+    from openapi_spec_validator.shortcuts import get_validator_cls
+
+    document = cast(Mapping[Hashable, Any], spec)
+    try:
+        validator = get_validator_cls(document)(document)
+    except Exception as e:
+        return [f"Unable to detect OpenAPI version: {e}"]
+
+    errors: List[str] = []
+    try:
+        for error in validator.iter_errors():
+            errors.append(getattr(error, "message", str(error)))
+            if len(errors) >= max_errors:
+                break
+    except Exception as e:
+        # The validator can trip over malformed subtrees after reporting them.
+        if len(errors) < max_errors:
+            errors.append(f"Validation aborted: {e}")
+    return errors
+
+
+def iter_structural_errors(spec: Dict[str, Any]) -> Iterator[str]:
+    """
+    Yield errors in the document skeleton without validating schemas.
+    """
+    version = spec.get("openapi")
+    if not isinstance(version, str) or not version.startswith("3."):
+        yield "'openapi' must be a 3.x version string."
+
+    info = spec.get("info")
+    if not isinstance(info, dict):
+        yield "'info' must be an object."
+    else:
+        for field in ("title", "version"):
+            if not isinstance(info.get(field), str):
+                yield f"'info.{field}' is required and must be a string."
+
+    paths = spec.get("paths")
+    if paths is None:
+        # 'paths' only became optional in OpenAPI 3.1.
+        if isinstance(version, str) and version.startswith("3.0"):
+            yield "'paths' is required."
+    elif not isinstance(paths, dict):
+        yield "'paths' must be an object."
+    else:
+        for path, item in paths.items():
+            yield from _path_item_errors(path, item)
+
+    components = spec.get("components")
+    if components is not None:
+        if not isinstance(components, dict):
+            yield "'components' must be an object."
+        else:
+            for section in COMPONENT_SECTIONS:
+                value = components.get(section)
+                if value is not None and not isinstance(value, dict):
+                    yield f"'components.{section}' must be an object."
+
+
+def _path_item_errors(path: Any, item: Any) -> Iterator[str]:
+    if not isinstance(path, str) or not path.startswith("/"):
+        yield f"Path '{path}' must start with '/'."
+    if not isinstance(item, dict):
+        yield f"'paths.{path}' must be an object."
+        return
+    for method, op in item.items():
+        if not isinstance(method, str) or method.lower() not in HTTP_METHODS:
+            continue
+        if not isinstance(op, dict):
+            yield f"'paths.{path}.{method}' must be an object."
+            continue
+        responses = op.get("responses")
+        if responses is not None and not isinstance(responses, dict):
+            yield f"'paths.{path}.{method}.responses' must be an object."
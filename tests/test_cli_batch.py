@@ -0,0 +1,80 @@
+import json
+import os
+import re
+import subprocess
+
+from src.core.batch import discover_specs
+
+TEST_DIR = "tests/test_files"
+
+
+def run_batch(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        ["python", "-m", "src.cli", "batch", *args],
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_batch_directory_with_summary(tmp_path) -> None:
+    summary_path = tmp_path / "summary.json"
+    result = run_batch(TEST_DIR, "-j", "2", "--summary", str(summary_path))
+
+    assert result.returncode == 0, result.stderr
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+    assert len(lines) == len(os.listdir(TEST_DIR))
+
+    for line in lines:
+        match = re.search(r"file_(\d+)_(\d+)\.", line["input"])
+        assert match is not None
+        assert int(match.group(1)) <= line["score"] <= int(match.group(2))
+
+    summary = json.loads(summary_path.read_text())
+    assert summary["scored"] == len(lines)
+    assert summary["failed"] == 0
+
+
+def test_batch_manifest_and_export(tmp_path) -> None:
+    manifest = tmp_path / "specs.txt"
+    manifest.write_text(
+        "# nightly specs\n"
+        f"{os.path.abspath(TEST_DIR)}/file_0_20.json\n"
+        "\n"
+        f"{os.path.abspath(TEST_DIR)}/missing.json\n"
+    )
+    export_dir = tmp_path / "reports"
+    result = run_batch(
+        "-m", str(manifest), "-j", "1", "-e", "json", "--export-dir", str(export_dir)
+    )
+
+    assert result.returncode == 1
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [("error" in line) for line in lines] == [False, True]
+    assert os.path.exists(lines[0]["report"])
+
+
+def test_discover_specs_glob_and_dedupe() -> None:
+    found = discover_specs([f"{TEST_DIR}/*.yaml", TEST_DIR])
+
+    assert found[0].endswith(".yaml")
+    assert len(found) == len(set(found)) == len(os.listdir(TEST_DIR))
+
+
+def test_batch_with_an_empty_spec(tmp_path) -> None:
+    (tmp_path / "empty.json").write_text("{}")
+    spec = os.path.join(TEST_DIR, "file_0_20.json")
+    (tmp_path / "file_0_20.json").write_text(open(spec, encoding="utf-8").read())
+    summary_path = tmp_path / "summary.json"
+    result = run_batch(
+        str(tmp_path), "-j", "2", "--validation", "off", "--summary", str(summary_path)
+    )
+
+    assert result.returncode == 0, result.stderr
+    scores = {
+        os.path.basename(line["input"]): line["score"]
+        for line in map(json.loads, result.stdout.splitlines())
+    }
+    assert scores["empty.json"] == 0
+    summary = json.loads(summary_path.read_text())
+    assert summary["scored"] == 2 and summary["min_score"] == 0
+    assert summary["mean_score"] == round(scores["file_0_20.json"] / 2, 2)
@@ -70,3 +70,57 @@ def test_score_bounds(filename: str, export_format: str) -> None:
     )
 
     os.remove(output_path)
+
+
+def test_fail_under_sets_exit_status() -> None:
+    spec = os.path.join(TEST_DIR, "file_0_20.json")
+    command = ["python", "-m", "src.cli", "score", spec, "--validation", "off"]
+    failing = subprocess.run(
+        command + ["--fail-under", "50"], capture_output=True, text=True
+    )
+    assert failing.returncode == 1
+    assert "below --fail-under 50.0" in failing.stderr
+    passing = subprocess.run(command + ["--fail-under", "0"], capture_output=True)
+    assert passing.returncode == 0
+
+
+def test_fail_under_labels_partial_score() -> None:
+    spec = os.path.join(TEST_DIR, "file_0_20.json")
+    command = ["python", "-m", "src.cli", "score", spec, "--validation", "off"]
+    result = subprocess.run(
+        command + ["--fail-under", "99"], capture_output=True, text=True
+    )
+    assert result.returncode == 1
+    assert result.stdout.startswith("Partial score: ")
+    assert "Partial score" in result.stderr and "stopped early" in result.stderr
+
+
+def test_fail_under_fails_specs_that_cannot_be_scored(tmp_path) -> None:
+    invalid = tmp_path / "invalid.json"
+    invalid.write_text('{"openapi": "3.0.0"}')
+    for spec in [str(tmp_path / "missing.json"), str(invalid)]:
+        command = ["python", "-m", "src.cli", "score", spec, "--fail-under", "90"]
+        result = subprocess.run(command, capture_output=True, text=True)
+        assert result.returncode == 1
+        assert "Error:" in result.stderr
+
+
+def test_fail_under_fails_empty_specs(tmp_path) -> None:
+    empty = tmp_path / "empty.json"
+    empty.write_text("{}")
+    command = ["python", "-m", "src.cli", "score", str(empty), "--validation", "off"]
+    result = subprocess.run(
+        command + ["--fail-under", "0"], capture_output=True, text=True
+    )
+    assert result.returncode == 1
+    assert "below --fail-under 0.0" in result.stderr
+
+
+def test_watch_rejects_options_it_would_ignore() -> None:
+    spec = os.path.join(TEST_DIR, "file_0_20.json")
+    command = ["python", "-m", "src.cli", "score", spec, "--watch"]
+    result = subprocess.run(
+        command + ["--fail-under", "50", "--lazy"], capture_output=True, text=True
+    )
+    assert result.returncode == 2
+    assert "--watch cannot be combined with --lazy, --fail-under" in result.stderr
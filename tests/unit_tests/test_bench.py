@@ -0,0 +1,81 @@
+import copy
+
+import src.utils.loader
+from src.core.bench import (
+    check_import_budget,
+    compare,
+    import_time,
+    percentile,
+    run_bench,
+)
+
+
+def test_percentile():
+    samples = [5.0, 1.0, 4.0, 2.0, 3.0]
+    assert percentile(samples, 50) == 3.0
+    assert percentile(samples, 90) == 5.0
+    assert percentile([7.0], 99) == 7.0
+
+
+def test_run_bench_covers_every_stage():
+    results = run_bench(sizes=[4], repeat=2, validation="off", startup=False)
+    stages = results["results"]["4"]
+    assert {"load_spec", "engine.run", "export:json", "export:ndjson"} <= set(stages)
+    assert any(stage.startswith("rule:") for stage in stages)
+    for stats in stages.values():
+        assert stats["min"] <= stats["median"] <= stats["max"]
+        assert stats["peak_kb"] >= 0
+
+
+def test_every_timed_load_validates(monkeypatch):
+    caches = []
+    validate = src.utils.loader.validate_spec
+
+    def spy(*args, **kwargs):
+        caches.append(kwargs.get("verdicts"))
+        return validate(*args, **kwargs)
+
+    monkeypatch.setattr(src.utils.loader, "validate_spec", spy)
+    run_bench(sizes=[4], repeat=3, validation="structural", startup=False)
+    timed = [cache for cache in caches if cache is not None]
+    # Three timed runs and the tracemalloc run, each with its own cache.
+    assert len(timed) == 4 and len({id(cache) for cache in timed}) == 4
+
+
+def test_compare_flags_regressions():
+    baseline = {
+        "results": {
+            "10": {
+                "engine.run": {"median": 0.1, "peak_kb": 100.0},
+                "load_spec": {"median": 0.0001, "peak_kb": 10.0},
+            }
+        }
+    }
+    current = copy.deepcopy(baseline)
+    assert compare(current, baseline) == []
+
+    current["results"]["10"]["engine.run"]["median"] = 0.2
+    # Tiny absolute differences are noise even when the ratio is large.
+    current["results"]["10"]["load_spec"]["median"] = 0.0005
+    regressions = compare(current, baseline, threshold=0.2)
+    assert [(r["stage"], r["metric"]) for r in regressions] == [
+        ("engine.run", "median")
+    ]
+    assert regressions[0]["ratio"] == 2.0
+
+
+def test_run_bench_measures_startup():
+    results = run_bench(sizes=[], repeat=1, validation="off")
+    startup = results["results"]["startup"]
+    assert set(startup) == {"import:src.cli", "cli --help"}
+    assert startup["import:src.cli"]["median"] > 0
+    assert check_import_budget(results, budget_ms=1e9) is None
+    violation = check_import_budget(results, budget_ms=0)
+    assert violation is not None and violation["slowest"]
+
+
+def test_cli_import_skips_heavy_dependencies():
+    _, modules = import_time("src.cli")
+    loaded = {name for name, _ in modules}
+    assert "src.cli" in loaded
+    assert not loaded & {"requests", "yaml", "markdown2", "openapi_spec_validator"}
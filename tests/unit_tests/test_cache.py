@@ -0,0 +1,106 @@
+import os
+
+import src.core.cache as cache_module
+from src.core.cache import ResultCache, rules_fingerprint
+from src.core.scoring_engine import ScoringEngine
+from src.scoring.get_rules import get_all_rules
+from src.scoring.paths_operation_rule import PathsOperationsRule
+from src.scoring.rules_base import as_rule
+from src.utils.disk_cache import DiskCache
+from src.utils.spec_cache import SpecCache
+
+SPEC_PATH = "tests/test_files/file_35_50.json"
+
+
+def test_unchanged_spec_is_served_from_cache(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    first = ScoringEngine(SPEC_PATH, cache=cache)
+    report = first.run()
+
+    second = ScoringEngine(SPEC_PATH, cache=cache)
+    assert second.cached_report is not None
+    assert second.spec == {}
+    assert second.run() == report
+
+
+def test_fingerprint_tracks_rule_set():
+    rules = get_all_rules()
+    fingerprint = rules_fingerprint(rules)
+    assert fingerprint == rules_fingerprint(get_all_rules())
+
+    # Rule instances are shared process-wide, so change a fresh copy.
+    reweighted = [type(rules[0])(), *rules[1:]]
+    reweighted[0].weight = 99
+    assert rules_fingerprint(reweighted) != fingerprint
+    assert rules_fingerprint([PathsOperationsRule(verbs={"get"})]) != (
+        rules_fingerprint([PathsOperationsRule()])
+    )
+
+
+class SlottedRule:
+    __slots__ = ("name", "weight", "limit")
+
+    def __init__(self, limit: int) -> None:
+        self.name = "Slotted"
+        self.weight = 10
+        self.limit = limit
+
+    def apply(self, spec):
+        return 100, []
+
+
+def test_fingerprint_reads_slots_and_code_version(monkeypatch):
+    assert rules_fingerprint([as_rule(SlottedRule(1))]) != (
+        rules_fingerprint([as_rule(SlottedRule(2))])
+    )
+    fingerprint = rules_fingerprint([PathsOperationsRule()])
+    monkeypatch.setattr(
+        "src.scoring.paths_operation_rule.__version__", "2.0", raising=False
+    )
+    cache_module._module_version.cache_clear()
+    try:
+        assert rules_fingerprint([PathsOperationsRule()]) != fingerprint
+    finally:
+        monkeypatch.undo()
+        cache_module._module_version.cache_clear()
+    assert rules_fingerprint([PathsOperationsRule()]) == fingerprint
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    store = DiskCache(str(tmp_path), max_bytes=25)
+    store.put("a", b"x" * 10)
+    store.put("b", b"x" * 10)
+    os.utime(store.path_for("a"), (0, 0))
+    os.utime(store.path_for("b"), (1, 1))
+    assert store.get("a") is not None  # refreshes "a"
+
+    store.put("c", b"x" * 10)
+    assert store.get("b") is None
+    assert store.get("a") is not None
+    assert store.get("c") is not None
+
+    store.clear()
+    assert store.size() == 0
+
+
+def test_spec_snapshot_skips_parsing(tmp_path, monkeypatch):
+    spec_path = "tests/test_files/file_50_60.yaml"
+    snapshots = SpecCache(str(tmp_path))
+    first = ScoringEngine(spec_path, spec_cache=snapshots)
+    assert snapshots.get(first.digest) == first.spec
+
+    def no_parsing(*args, **kwargs):
+        raise AssertionError("spec was parsed again")
+
+    monkeypatch.setattr("src.core.scoring_engine.decode_spec", no_parsing)
+    # Different rules miss the result cache but still reuse the snapshot.
+    second = ScoringEngine(
+        spec_path, rules=get_all_rules(["misc"]), spec_cache=snapshots
+    )
+    assert second.spec == first.spec
+
+
+def test_unreadable_spec_snapshot_is_a_miss(tmp_path):
+    snapshots = SpecCache(str(tmp_path))
+    snapshots.store.put("digest", b"not a snapshot")
+    assert snapshots.get("digest") is None
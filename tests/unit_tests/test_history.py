@@ -0,0 +1,83 @@
+import json
+import subprocess
+
+import pytest
+
+from src.core.history import HistoryError, score_history
+from src.core.scoring_engine import ScoringEngine
+
+SPEC_PATH = "tests/test_files/file_70_80.json"
+
+
+def commit(repo, message):
+    subprocess.run(["git", "add", "-A"], cwd=repo, check=True)
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", message],
+        cwd=repo,
+        check=True,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    with open(SPEC_PATH, encoding="utf-8") as f:
+        spec = json.load(f)
+    versions = []
+    spec_file = tmp_path / "api" / "openapi.json"
+    spec_file.parent.mkdir()
+
+    def save(message):
+        spec_file.write_text(json.dumps(spec, indent=2))
+        commit(tmp_path, message)
+        versions.append(spec_file.read_bytes())
+
+    save("initial")
+    path, item = next(iter(spec["paths"].items()))
+    for op in item.values():
+        if isinstance(op, dict):
+            op["description"] = "Documented now."
+    save("document one path")
+    (tmp_path / "README").write_text("unrelated")
+    commit(tmp_path, "unrelated change")
+    del spec["paths"][path]
+    save("drop a path")
+    return tmp_path, versions
+
+
+def test_history_matches_engine_and_reuses_paths(repo):
+    root, versions = repo
+    points = list(score_history(str(root), "api/openapi.json", validation="off"))
+
+    assert [p["subject"] for p in points] == [
+        "initial",
+        "document one path",
+        "drop a path",
+    ]
+    for point, content in zip(points, versions):
+        report = ScoringEngine("v", content=content, validation="off").run()
+        assert point["score"] == report["score"]
+    assert points[0]["path_checks_reused"] == 0
+    assert points[1]["changed_paths"] == 1
+    assert points[1]["path_checks_reused"] > points[1]["path_checks"]
+
+
+def test_history_unknown_revision(repo):
+    root, _ = repo
+    with pytest.raises(HistoryError):
+        list(score_history(str(root), "api/openapi.json", revisions="nope"))
+
+
+def test_history_from_subdirectory_uses_root_relative_path(repo):
+    root, versions = repo
+    points = list(
+        score_history(str(root / "api"), "api/openapi.json", validation="off")
+    )
+    assert len(points) == len(versions)
+    assert all("error" not in point for point in points)
+
+
+def test_history_without_matching_commits(repo):
+    root, _ = repo
+    with pytest.raises(HistoryError, match="No commits"):
+        list(score_history(str(root), "api/missing.json"))
@@ -0,0 +1,122 @@
+import json
+import os
+import re
+
+from src.core.cache import ResultCache
+from src.core.scoring_engine import ScoringEngine
+from src.reports.export import export_report, render_report
+from src.reports.html import SEVERITIES, write_html
+from src.scoring.issues import ISSUE_FIELDS, json_default
+
+SPEC_PATH = "tests/test_files/file_70_80.json"
+
+
+def test_single_page_groups_by_rule_and_severity():
+    report = ScoringEngine(SPEC_PATH).run()
+    html = render_report(report, "html")
+
+    assert f"<strong>Score:</strong> {report['score']}<br>" in html
+    headings = [
+        h.replace("&amp;", "&").split(": ")
+        for h in re.findall(r'<h3 id="[^"]+">([^<]+)</h3>', html)
+    ]
+    names = [c["name"] for c in report["criteria"]]
+    assert headings
+    assert all(rule in names and sev in SEVERITIES for rule, sev in headings)
+    # Rules in report order, severities from high to low within a rule.
+    order = [(names.index(rule), SEVERITIES.index(sev)) for rule, sev in headings]
+    assert order == sorted(order) and len(set(order)) == len(order)
+    # Criteria rows, overview rows (one per rule) and issue rows.
+    rules = {rule for rule, _ in headings}
+    rows = len(report["criteria"]) + len(rules) + len(report["issues"])
+    assert html.count("<tr><td>") == rows
+
+
+def test_escapes_issue_text():
+    report = {
+        "score": 50,
+        "grade": "F",
+        "criteria": [],
+        "issues": [
+            {
+                "path": "/items/<id>",
+                "operation": "GET",
+                "location": "x",
+                "description": "<script>alert(1)</script>",
+                "severity": "high",
+                "suggestion": "unknown",
+            }
+        ],
+    }
+    html = render_report(report, "html")
+    assert "<script>" not in html
+    assert "&lt;script&gt;" in html and "/items/&lt;id&gt;" in html
+    assert "Other: high" in html
+
+
+def test_large_reports_are_paginated(tmp_path):
+    report = ScoringEngine(SPEC_PATH).run()
+    output = tmp_path / "report.html"
+    stream = ScoringEngine(SPEC_PATH).stream()
+    pages = write_html(stream, stream.summary, str(output), per_page=3)
+
+    assert len(pages) > 1
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["report-pages", "report.html"]
+    names = [os.path.basename(page) for page in pages]
+    assert sorted(os.listdir(tmp_path / "report-pages")) == sorted(names)
+    index = output.read_text()
+    assert f"<strong>Score:</strong> {report['score']}" in index
+    assert "<h3" not in index
+    assert sorted(f"report-pages/{n}" for n in names if n.endswith("-1.html")) == (
+        sorted(re.findall(r'<a href="([^"#]+)">', index))
+    )
+
+    rows = 0
+    for page in pages:
+        text = open(page, encoding="utf-8").read()
+        rows += text.count("<tr><td>")
+        assert text.count("<tr><td>") <= 3
+        assert 'href="../report.html"' in text
+        page_number = int(page.rsplit("-", 1)[1][: -len(".html")])
+        assert ("Previous</a>" in text) == (page_number > 1)
+        next_page = page.replace(f"-{page_number}.html", f"-{page_number + 1}.html")
+        assert ("Next</a>" in text) == (next_page in pages)
+    assert rows == len(report["issues"])
+
+
+def test_rerun_removes_stale_pages(tmp_path):
+    output = tmp_path / "report.html"
+    report = ScoringEngine(SPEC_PATH).run()
+    summary = {k: v for k, v in report.items() if k != "issues"}
+    (tmp_path / "report-pages").mkdir()
+    (tmp_path / "report-pages" / "notes.txt").write_text("kept")
+
+    many = write_html(report["issues"], summary, str(output), per_page=2)
+    fewer = write_html(report["issues"][:3], summary, str(output), per_page=2)
+    assert len(fewer) < len(many)
+    left = sorted(os.listdir(tmp_path / "report-pages"))
+    assert left == sorted([os.path.basename(p) for p in fewer] + ["notes.txt"])
+
+    (tmp_path / "report-pages" / "notes.txt").unlink()
+    assert write_html(report["issues"][:1], summary, str(output), per_page=2) == []
+    assert [p.name for p in tmp_path.iterdir()] == ["report.html"]
+
+
+def test_small_reports_stay_on_one_page(tmp_path):
+    report = ScoringEngine(SPEC_PATH).run()
+    output = tmp_path / "report.html"
+    export_report(report, "html", str(output))
+    assert [p.name for p in tmp_path.iterdir()] == ["report.html"]
+    assert output.read_text() == render_report(report, "html")
+
+
+def test_cached_reports_group_like_fresh_ones(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    report = ScoringEngine(SPEC_PATH, cache=cache).run()
+    cached = ScoringEngine(SPEC_PATH, cache=cache).run()
+    assert render_report(cached, "html") == render_report(report, "html")
+    assert "Other" not in render_report(cached, "html")
+    # The codes stay out of the serialized issues.
+    exported = json.loads(json.dumps(cached, default=json_default))
+    assert exported == json.loads(json.dumps(report, default=json_default))
+    assert all(set(issue) == set(ISSUE_FIELDS) for issue in exported["issues"])
@@ -0,0 +1,87 @@
+import gzip
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.core.scoring_engine import ScoringEngine
+from src.utils.http import FetchError, SpecFetcher
+
+SPEC_PATH = "tests/test_files/file_70_80.json"
+
+with open(SPEC_PATH, "rb") as f:
+    SPEC = f.read()
+
+
+class SpecHandler(BaseHTTPRequestHandler):
+    requests_seen: list = []
+
+    def do_GET(self):
+        self.requests_seen.append((self.path, dict(self.headers)))
+        if self.path == "/slow":
+            time.sleep(2)
+        if self.path == "/big":
+            self._send(200, b"x" * (256 * 1024))
+        elif self.path == "/missing":
+            self._send(404, b"")
+        elif self.headers.get("If-None-Match") == '"v1"':
+            self._send(304, None)
+        else:
+            body = SPEC
+            if "gzip" in self.headers.get("Accept-Encoding", ""):
+                body = gzip.compress(body)
+            self._send(200, body, {"ETag": '"v1"', "Content-Encoding": "gzip"})
+
+    def _send(self, status, body, headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if body is not None:
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SpecHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_gzip_and_conditional_revalidation(base_url, tmp_path):
+    fetcher = SpecFetcher(str(tmp_path))
+    assert fetcher.fetch_with_status(f"{base_url}/spec.json") == (200, SPEC)
+    assert "gzip" in SpecHandler.requests_seen[-1][1]["Accept-Encoding"]
+
+    # A fresh fetcher sharing the cache directory revalidates with a 304.
+    fetcher = SpecFetcher(str(tmp_path))
+    assert fetcher.fetch_with_status(f"{base_url}/spec.json") == (304, SPEC)
+    assert SpecHandler.requests_seen[-1][1]["If-None-Match"] == '"v1"'
+
+
+def test_without_cache_downloads_every_time(base_url):
+    fetcher = SpecFetcher()
+    assert fetcher.fetch(f"{base_url}/spec.json") == SPEC
+    assert fetcher.fetch_with_status(f"{base_url}/spec.json") == (200, SPEC)
+
+
+def test_byte_ceiling_timeout_and_errors(base_url):
+    with pytest.raises(FetchError, match="exceeds"):
+        SpecFetcher(max_bytes=64 * 1024).fetch(f"{base_url}/big")
+    with pytest.raises(FetchError):
+        SpecFetcher(timeout=0.5).fetch(f"{base_url}/slow")
+    with pytest.raises(FetchError, match="404"):
+        SpecFetcher().fetch(f"{base_url}/missing")
+
+
+def test_engine_scores_url(base_url):
+    report = ScoringEngine(f"{base_url}/spec.json", fetcher=SpecFetcher()).run()
+    assert report == ScoringEngine(SPEC_PATH).run()
@@ -0,0 +1,101 @@
+import copy
+import json
+import os
+
+from src.core.incremental import IncrementalScorer, SpecWatcher
+from src.core.scoring_engine import build_report
+from src.scoring.get_rules import get_all_rules
+from src.scoring.paths_operation_rule import PathsOperationsRule
+from src.scoring.rules_base import Rule
+
+SPEC_PATH = "tests/test_files/file_70_80.json"
+
+
+def load():
+    with open(SPEC_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def full_report(spec):
+    return build_report((rule, *rule.apply(spec)) for rule in get_all_rules())
+
+
+def test_matches_full_scoring_after_edits():
+    scorer = IncrementalScorer()
+    spec = load()
+    assert scorer.score(spec) == full_report(spec)
+
+    edited = copy.deepcopy(spec)
+    path = next(iter(edited["paths"]))
+    for op in edited["paths"][path].values():
+        if isinstance(op, dict):
+            op.pop("description", None)
+    edited["paths"]["/brand-new/{id}"] = {"delete": {"responses": {}}}
+
+    assert scorer.score(edited) == full_report(edited)
+    assert scorer.last_stats["changed_paths"] == [path, "/brand-new/{id}"]
+
+
+def test_only_changed_path_items_are_rescored():
+    scorer = IncrementalScorer()
+    spec = load()
+    scorer.score(spec)
+    # Every rule except the miscellaneous one has per-path checks.
+    rules = len(scorer.rules) - 1
+
+    edited = copy.deepcopy(spec)
+    path = next(iter(edited["paths"]))
+    edited["paths"][path]["description"] = "Edited path level description text."
+    scorer.score(edited)
+    assert scorer.last_stats["path_checks"] == rules
+
+    edited["components"].setdefault("schemas", {})["Extra"] = {"type": "string"}
+    scorer.score(edited)
+    # Only the schema rule reads components from its per-path checks.
+    assert scorer.last_stats["path_checks"] == len(edited["paths"])
+    assert scorer.last_stats["changed_components"] == ["schemas.Extra"]
+
+
+def test_watcher_polls_for_changes(tmp_path):
+    spec = load()
+    spec_file = tmp_path / "spec.json"
+    spec_file.write_text(json.dumps(spec))
+    watcher = SpecWatcher(str(spec_file))
+
+    assert watcher.poll() is not None
+    assert watcher.poll() is None
+
+    spec["info"]["version"] = ""
+    spec_file.write_text(json.dumps(spec))
+    os.utime(spec_file, ns=(0, 1))
+    report = watcher.poll()
+    assert report is not None
+    assert report == full_report(spec)
+
+
+def test_spec_wide_issues_come_before_path_issues():
+    with open("tests/test_files/file_0_20.json", "r", encoding="utf-8") as f:
+        spec = json.load(f)
+    _, issues = PathsOperationsRule().apply(spec)
+    conflicts = [
+        i for i, issue in enumerate(issues) if "conflict" in issue["description"]
+    ]
+    assert conflicts == list(range(len(conflicts))) and conflicts
+
+
+class TitleLengthRule(Rule):
+    name = "Title Length"
+    weight = 10
+
+    def apply(self, spec, index=None):
+        return min(len(spec["info"]["title"]), 100), []
+
+
+def test_apply_only_rule_is_rescored_on_any_change():
+    scorer = IncrementalScorer([TitleLengthRule()])
+    spec = load()
+    spec["info"]["title"] = "abc"
+    assert scorer.score(spec)["criteria"][0]["score"] == 3
+
+    spec["info"]["title"] = "abcdef"
+    assert scorer.score(spec)["criteria"][0]["score"] == 6
@@ -0,0 +1,47 @@
+import json
+
+from src.scoring.issues import (
+    INVALID_RESPONSE_CODES,
+    ISSUE_KINDS,
+    MISSING_RESPONSE_EXAMPLE,
+    Issue,
+    format_location,
+    json_default,
+)
+
+
+def test_format_location():
+    assert format_location(("paths", "/users", "get", "parameters", 0, "schema")) == (
+        "paths./users.get.parameters[0].schema"
+    )
+    assert format_location(("paths",)) == "paths"
+
+
+def test_issue_reads_like_the_legacy_dict():
+    issue = Issue(
+        INVALID_RESPONSE_CODES, "/users", "get", ("paths", "/users", "get"), ("2XX",)
+    )
+    expected = {
+        "path": "/users",
+        "operation": "get",
+        "location": "paths./users.get",
+        "description": "Invalid HTTP response code(s): 2XX.",
+        "severity": "medium",
+        "suggestion": "Use standard 3-digit HTTP status codes.",
+    }
+    assert issue == expected
+    assert issue.to_dict() == expected
+    assert issue["location"] == "paths./users.get"
+    assert issue.get("missing", "N/A") == "N/A"
+    assert json.loads(json.dumps([issue], default=json_default)) == [expected]
+
+
+def test_issue_is_compact():
+    issue = Issue(MISSING_RESPONSE_EXAMPLE, "/a", "GET", ("paths", "/a", "get"))
+    assert not hasattr(issue, "__dict__")
+    assert issue.suggestion is MISSING_RESPONSE_EXAMPLE.suggestion
+
+
+def test_kind_codes_are_unique():
+    assert all(code == kind.code for code, kind in ISSUE_KINDS.items())
+    assert len({kind.description for kind in ISSUE_KINDS.values()}) == len(ISSUE_KINDS)
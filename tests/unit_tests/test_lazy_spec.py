@@ -0,0 +1,47 @@
+import glob
+import json
+import pickle
+
+import pytest
+
+from src.core.scoring_engine import ScoringEngine
+from src.utils.lazy_spec import LazyDict, lazy_loads
+
+JSON_SPECS = sorted(glob.glob("tests/test_files/*.json"))
+
+
+@pytest.mark.parametrize("path", JSON_SPECS)
+def test_lazy_loads_matches_json(path):
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    spec = lazy_loads(text)
+    assert isinstance(spec, dict)
+    assert spec == json.loads(text)
+    assert json.dumps(spec, sort_keys=True) == json.dumps(
+        json.loads(text), sort_keys=True
+    )
+    assert type(pickle.loads(pickle.dumps(spec))) is dict
+
+
+def test_values_are_decoded_on_first_access():
+    spec = lazy_loads(
+        '{"info": {"title": "t"}, "paths": {"/a": {"get": {"x": 1}}, "/b": {}}}'
+    )
+    paths = spec["paths"]
+    assert isinstance(paths, LazyDict)
+    item = paths["/a"]
+    assert item.pending() == 1
+    assert item["get"] == {"x": 1}
+    assert item.pending() == 0
+    assert spec["info"]["title"] == "t"
+
+
+def test_syntax_errors_surface_up_front():
+    with pytest.raises(json.JSONDecodeError):
+        lazy_loads('{"paths": {"/a": {"get": {"x": [1,]}}}}')
+
+
+def test_lazy_engine_report_matches_eager():
+    path = "tests/test_files/file_70_80.json"
+    eager = ScoringEngine(path, validation="off").run()
+    assert ScoringEngine(path, validation="off", lazy=True).run() == eager
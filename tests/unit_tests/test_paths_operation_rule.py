@@ -1,6 +1,6 @@
 import pytest
 
-from src.scoring.paths_operation_rule import PathsOperationsRule
+from src.scoring.paths_operation_rule import PathTrie, PathsOperationsRule
 
 
 @pytest.fixture
@@ -46,3 +46,31 @@ def test_valid_paths_no_issues(rule):
     assert score > 85
     # as scoring penalizes even if it sees potential issues
     # so it is hard to achieve perfect score
+
+
+def test_path_trie_finds_earliest_prefix_or_exact_conflict():
+    trie = PathTrie()
+    trie.add("/users/{id}/orders", "/users/{userId}/orders")
+    trie.add("/accounts", "/accounts")
+
+    assert trie.find_conflict("/users/{id}/orders") == "/users/{userId}/orders"
+    assert trie.find_conflict("/users") == "/users/{userId}/orders"
+    assert trie.find_conflict("/accounts/{id}") == "/accounts"
+    assert trie.find_conflict("/users/{id}/invoices") is None
+    assert trie.find_conflict("/user") is None
+
+
+def test_conflict_reported_against_first_matching_path(rule):
+    spec = {
+        "paths": {
+            "/shops/{shopId}/items": {"get": {}},
+            "/shops": {"get": {}},
+            "/shops/{id}": {"get": {}},
+        }
+    }
+    _, issues = rule.apply(spec)
+    conflicts = [i for i in issues if "conflict" in i["description"].lower()]
+    assert [(i["path"], i["description"]) for i in conflicts] == [
+        ("/shops", "Potential path conflict with '/shops/{shopId}/items'."),
+        ("/shops/{id}", "Potential path conflict with '/shops/{shopId}/items'."),
+    ]
@@ -0,0 +1,44 @@
+from src.core.cache import ResultCache
+from src.core.profiling import Profiler, format_timings
+from src.core.scoring_engine import ScoringEngine
+
+SPEC_PATH = "tests/test_files/file_70_80.json"
+
+
+def test_profile_adds_timings_for_every_stage_and_rule():
+    engine = ScoringEngine(SPEC_PATH, profile=True)
+    report = engine.run()
+
+    timings = report["timings"]
+    assert list(timings["stages"]) == ["read", "parse", "validate", "index"]
+    assert list(timings["rules"]) == [rule.name for rule in engine.rules]
+    for entry in timings["rules"].values():
+        assert entry["wall_ms"] >= 0 and entry["peak_kb"] >= 0
+    assert list(report)[-1] == "timings"
+
+    plain = ScoringEngine(SPEC_PATH).run()
+    assert {k: v for k, v in report.items() if k != "timings"} == plain
+
+
+def test_profile_dir_dumps_one_stats_file_per_rule(tmp_path):
+    engine = ScoringEngine(SPEC_PATH, profile_dir=str(tmp_path))
+    engine.run()
+    assert len(list(tmp_path.glob("*.prof"))) == len(engine.rules)
+
+
+def test_timings_are_not_cached(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    ScoringEngine(SPEC_PATH, cache=cache, profile=True).run()
+
+    assert "timings" not in ScoringEngine(SPEC_PATH, cache=cache).run()
+    cached = ScoringEngine(SPEC_PATH, cache=cache, profile=True).run()
+    assert list(cached["timings"]["stages"]) == ["read", "cache_lookup"]
+    assert cached["timings"]["rules"] == {}
+
+
+def test_format_timings():
+    profiler = Profiler(trace_memory=False)
+    with profiler.stage("parse"):
+        pass
+    text = format_timings(profiler.finish())
+    assert "parse" in text and text.splitlines()[-1].startswith("total")
@@ -0,0 +1,47 @@
+import pytest
+
+from src.core.ref_resolver import RefCycleError, RefResolutionError, RefResolver
+
+
+def make_spec():
+    return {
+        "components": {
+            "schemas": {
+                "Pet": {"type": "object", "properties": {}},
+                "Alias": {"$ref": "#/components/schemas/Pet"},
+                "a/b": {"type": "string"},
+                "Loop": {"$ref": "#/components/schemas/Loop2"},
+                "Loop2": {"$ref": "#/components/schemas/Loop"},
+            }
+        }
+    }
+
+
+def test_lookup_is_memoized():
+    spec = make_spec()
+    resolver = RefResolver(spec)
+
+    target = resolver.lookup("#/components/schemas/Pet")
+    assert target is spec["components"]["schemas"]["Pet"]
+
+    del spec["components"]["schemas"]["Pet"]
+    assert resolver.lookup("#/components/schemas/Pet") is target
+
+
+def test_resolve_follows_chains_and_escapes():
+    resolver = RefResolver(make_spec())
+
+    assert resolver.resolve({"$ref": "#/components/schemas/Alias"})["type"] == "object"
+    assert resolver.lookup("#/components/schemas/a~1b") == {"type": "string"}
+    assert resolver.resolve({"type": "string"}) == {"type": "string"}
+
+
+def test_resolve_errors():
+    resolver = RefResolver(make_spec())
+
+    with pytest.raises(RefCycleError):
+        resolver.resolve({"$ref": "#/components/schemas/Loop"})
+    with pytest.raises(RefResolutionError):
+        resolver.lookup("#/components/schemas/Missing")
+    with pytest.raises(RefResolutionError):
+        resolver.lookup("other.yaml#/Pet")
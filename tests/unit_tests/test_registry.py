@@ -0,0 +1,140 @@
+import importlib.metadata
+import subprocess
+import sys
+
+import pytest
+
+from src.scoring.get_rules import get_all_rules
+from src.core.batch import score_batch
+from src.scoring.registry import (
+    BUILTIN_RULES,
+    ENTRY_POINT_GROUP,
+    RuleLoadError,
+    RuleRegistry,
+    default_registry,
+)
+from src.scoring.rules_base import ApplyRule, Rule, RuleTally
+
+
+class TeamRule(Rule):
+    name = "Team Conventions"
+    weight = 5
+
+    def check_spec(self, index):
+        return RuleTally(1, 1)
+
+
+class LegacyPlugin:
+    name = "Legacy"
+    weight = 5
+
+    def apply(self, spec):
+        return 50, []
+
+
+class EmptyRule(Rule):
+    name = "Empty"
+    weight = 5
+
+
+class NoChecks:
+    name = "No checks"
+    weight = 5
+
+
+def test_builtin_rules_in_report_order():
+    names = [rule.name for rule in get_all_rules()]
+    assert names == [
+        "Schema & Types",
+        "Descriptions & Documentation",
+        "Paths & Operations",
+        "Response Codes",
+        "Examples & Samples",
+        "Security",
+        "Miscellaneous Best Practices",
+    ]
+    assert get_all_rules()[0] is get_all_rules()[0]
+
+
+def test_only_selected_rule_modules_are_imported():
+    code = (
+        "import sys\n"
+        "from src.scoring.get_rules import get_all_rules\n"
+        "get_all_rules(['security'])\n"
+        "print(sorted(m for m in sys.modules if m.endswith('_rule')))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert out.strip() == "['src.scoring.security_rule']"
+
+
+def test_entry_point_plugins_are_discovered(monkeypatch):
+    plugin = importlib.metadata.EntryPoint(
+        name="team", value=f"{__name__}:TeamRule", group=ENTRY_POINT_GROUP
+    )
+    monkeypatch.setattr(
+        importlib.metadata,
+        "entry_points",
+        lambda group: [plugin] if group == ENTRY_POINT_GROUP else [],
+    )
+    registry = RuleRegistry()
+
+    assert registry.available() == [*BUILTIN_RULES, "team"]
+    assert registry.loaded() == []
+    assert isinstance(registry.get("team"), TeamRule)
+    assert registry.loaded() == ["team"]
+
+
+def test_register_and_unknown_rule():
+    registry = RuleRegistry(builtins={}, group=None)
+    registry.register("team", TeamRule)
+    assert [rule.name for rule in registry.rules()] == ["Team Conventions"]
+    with pytest.raises(ValueError, match="Unknown rule 'nope'"):
+        registry.get("nope")
+
+
+def test_select_only_and_skip():
+    registry = RuleRegistry(group=None)
+    assert registry.select(["misc", "security"]) == ["security", "misc"]
+    assert "schema_types" not in registry.select(skip=["schema_types"])
+    with pytest.raises(ValueError, match="Unknown rule 'nope'"):
+        registry.select(skip=["nope"])
+
+
+def test_plugins_are_checked_on_load():
+    registry = RuleRegistry(builtins={}, group=None)
+    registry.register("legacy", LegacyPlugin)
+    registry.register("empty", EmptyRule)
+    registry.register("none", NoChecks)
+
+    legacy = registry.get("legacy")
+    assert isinstance(legacy, ApplyRule)
+    assert legacy.apply({}) == (50, [])
+    with pytest.raises(TypeError, match="Rule 'empty' .* always score 100"):
+        registry.get("empty")
+    with pytest.raises(TypeError, match="Rule 'none' cannot be loaded"):
+        registry.get("none")
+
+
+def test_load_failures_name_the_rule():
+    registry = RuleRegistry(builtins={}, group=None)
+    registry.register("missing", "no_such_plugin.rules:Rule")
+    registry.register("renamed", f"{__name__}:NoSuchRule")
+    with pytest.raises(RuleLoadError, match="Rule 'missing' .* ModuleNotFoundError"):
+        registry.get("missing")
+    with pytest.raises(RuleLoadError, match="Rule 'renamed' .* AttributeError"):
+        registry.get("renamed")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_batch_reports_broken_plugins_per_spec(monkeypatch, workers):
+    sources = {**default_registry._sources, "broken": "no_such_plugin.rules:Rule"}
+    monkeypatch.setattr(default_registry, "_sources", sources)
+    monkeypatch.setattr(default_registry, "_discovered", True)
+    monkeypatch.setattr("src.core.batch._worker_rules", None)
+    specs = ["tests/test_files/file_0_20.json", "tests/test_files/file_70_80.json"]
+    results = list(score_batch(specs, workers=workers))
+    assert len(results) == 2
+    for result in results:
+        assert result["error"].startswith("Rule 'broken' cannot be loaded")
@@ -0,0 +1,103 @@
+import time
+
+import pytest
+
+from src.core import scheduler
+from src.core.cache import ResultCache
+from src.core.scheduler import RuleScheduler, run_rule, shard_ranges
+from src.core.scoring_engine import ScoringEngine
+from src.core.spec_index import SpecIndex
+from src.scoring.get_rules import get_all_rules
+from src.scoring.issues import RULE_TIMEOUT
+from src.scoring.rules_base import Rule, RuleTally
+from src.utils.spec_generator import SpecShape, write_spec
+
+SPEC_PATH = "tests/test_files/file_70_80.json"
+
+
+class SlowPathsRule(Rule):
+    name = "Slow Paths"
+    weight = 1
+
+    def __init__(self, spec_delay: float = 0.0, path_delay: float = 0.0) -> None:
+        self.spec_delay = spec_delay
+        self.path_delay = path_delay
+
+    def check_spec(self, index):
+        time.sleep(self.spec_delay)
+        return RuleTally()
+
+    def check_path(self, index, entry):
+        time.sleep(self.path_delay)
+        return RuleTally(passed=1, total=1)
+
+
+def make_index(paths: int = 10) -> SpecIndex:
+    return SpecIndex({"paths": {f"/items{n}": {"get": {}} for n in range(paths)}})
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_concurrent_rules_match_sequential_report(executor):
+    expected = ScoringEngine(SPEC_PATH).run()
+    report = ScoringEngine(SPEC_PATH, rule_workers=3, rule_executor=executor).run()
+    assert report == expected
+
+
+def test_deadline_gives_partial_score():
+    score, issues = run_rule(SlowPathsRule(path_delay=0.05), make_index(), 0.08)
+    assert score == 100
+    assert [issue.kind for issue in issues] == [RULE_TIMEOUT]
+    assert "Slow Paths" in issues[0]["description"]
+
+
+def test_stuck_rule_is_abandoned(monkeypatch):
+    monkeypatch.setattr(scheduler, "HARD_GRACE", 0.05)
+    rules = [SlowPathsRule(spec_delay=2), *get_all_rules()]
+    runner = RuleScheduler(workers=2, rule_timeout=0.1)
+
+    start = time.monotonic()
+    outcomes = list(runner.run(rules, make_index()))
+    assert time.monotonic() - start < 1.5
+
+    rule, score, issues = outcomes[0]
+    assert score == 0 and [issue.kind for issue in issues] == [RULE_TIMEOUT]
+    assert runner.timed_out == ["Slow Paths"]
+    assert len(outcomes) == len(rules)
+
+
+def test_timed_out_reports_are_not_cached(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    rules = [SlowPathsRule(path_delay=0.05), *get_all_rules()]
+    report = ScoringEngine(SPEC_PATH, rules=rules, cache=cache, rule_timeout=0.01).run()
+
+    assert any(issue["location"] == "rules.Slow Paths" for issue in report["issues"])
+    assert not list(tmp_path.rglob("*.json"))
+
+    ScoringEngine(SPEC_PATH, cache=cache, rule_timeout=60).run()
+    assert len(list(tmp_path.rglob("*.json"))) == 1
+
+
+def test_unknown_executor():
+    with pytest.raises(ValueError):
+        RuleScheduler(executor="fiber")
+
+
+def test_shard_ranges():
+    assert shard_ranges(10, 3) == [(0, 4), (4, 7), (7, 10)]
+    assert shard_ranges(2, 8) == [(0, 1), (1, 2)]
+    assert shard_ranges(0, 4) == [(0, 0)]
+
+
+def test_path_sharding_matches_serial_report(tmp_path):
+    spec_path = tmp_path / "spec.json"
+    write_spec(SpecShape(paths=60, missing_descriptions=0.5), str(spec_path))
+
+    for path in (SPEC_PATH, str(spec_path)):
+        expected = ScoringEngine(path, validation="off").run()
+        sharded = ScoringEngine(path, validation="off", path_workers=3).run()
+        assert sharded == expected
+
+
+def test_path_sharding_excludes_rule_scheduling():
+    with pytest.raises(ValueError):
+        ScoringEngine(SPEC_PATH, path_workers=2, rule_workers=2)
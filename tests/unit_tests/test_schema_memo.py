@@ -0,0 +1,93 @@
+import yaml
+
+from src.core.schema_memo import SchemaMemo, canonical_key
+from src.core.spec_index import SpecIndex
+from src.scoring.schema_type_rule import (
+    SchemaTypesRule,
+    is_valid_schema,
+    schema_shape,
+)
+
+ANCHORED_SPEC = """
+openapi: 3.0.3
+paths:
+  /a:
+    get:
+      responses:
+        "200":
+          content:
+            application/json:
+              schema: &page {type: object, properties: {next: {type: string}}}
+  /b:
+    get:
+      responses:
+        "200":
+          content:
+            application/json:
+              schema: *page
+        "404":
+          content:
+            application/json:
+              schema: {properties: {next: {type: string}}, type: object}
+"""
+
+
+def test_identity_and_structural_hits():
+    calls = []
+    memo = SchemaMemo()
+
+    def judge(schema):
+        calls.append(schema)
+        return len(schema)
+
+    shared = {"type": "string"}
+    assert memo.get(shared, judge) == 1
+    assert memo.get(shared, judge) == 1
+    assert memo.get({"type": "string"}, judge) == 1
+    assert memo.get({"type": "integer"}, judge) == 1
+    assert len(calls) == 2
+    assert memo.stats() == {
+        "lookups": 4,
+        "identity_hits": 1,
+        "structural_hits": 1,
+        "misses": 2,
+        "distinct_shapes": 2,
+        "hit_ratio": 0.5,
+    }
+
+
+def test_canonical_key_ignores_key_order():
+    assert canonical_key({"a": 1, "b": [2]}) == canonical_key({"b": [2], "a": 1})
+    assert canonical_key({1: "x", "y": 2}) is None
+
+
+def test_yaml_anchors_are_judged_once():
+    index = SpecIndex(yaml.safe_load(ANCHORED_SPEC))
+    score, issues = SchemaTypesRule().apply(index.spec, index=index)
+
+    assert score == 100 and not issues
+    stats = index.schema_memo.stats()
+    assert (stats["identity_hits"], stats["structural_hits"], stats["misses"]) == (
+        1,
+        1,
+        1,
+    )
+
+
+def test_schema_shape_gives_same_verdicts_as_full_check():
+    schemas = [
+        {"type": "object"},
+        {"type": "object", "properties": {}},
+        {"type": "object", "additionalProperties": False},
+        {"type": "object", "additionalProperties": {"type": "array"}},
+        {"type": "object", "additionalProperties": {"type": "string"}},
+        {"type": "array", "items": {"type": "object", "allOf": []}},
+        {"type": "array"},
+        {"type": "bogus"},
+        {},
+        {"$ref": "#/missing"},
+    ]
+    for schema in schemas:
+        for other in schemas:
+            if schema_shape(schema) == schema_shape(other):
+                assert is_valid_schema(schema) == is_valid_schema(other)
@@ -118,3 +118,61 @@ def test_apply_partial_score(rule):
     score, issues = rule.apply(spec)
     assert 0 < score < 100
     assert len(issues) == 1
+
+
+def test_apply_follows_refs(rule):
+    spec = {
+        "paths": {"/test": make_path_response_with_ref_schema()},
+        "components": {
+            "schemas": {
+                "ValidSchema": {"$ref": "#/components/schemas/Loose"},
+                "Loose": {"type": "object"},
+            }
+        },
+    }
+    score, issues = rule.apply(spec)
+    assert score == 0
+    assert len(issues) == 3
+
+
+def test_apply_recursive_and_unresolvable_refs(rule):
+    spec = {
+        "paths": {"/test": make_path_response_with_ref_schema()},
+        "components": {
+            "schemas": {
+                "Tree": {
+                    "type": "array",
+                    "items": {"$ref": "#/components/schemas/Tree"},
+                },
+            }
+        },
+    }
+    score, issues = rule.apply(spec)
+    assert score == 50
+    assert issues[0]["description"].startswith("Unresolvable $ref")
+
+
+def test_apply_flags_pure_ref_cycles(rule):
+    spec = {
+        "paths": {"/test": make_path_response_with_ref_schema()},
+        "components": {
+            "schemas": {
+                "ValidSchema": {"$ref": "#/components/schemas/A"},
+                "A": {"$ref": "#/components/schemas/B"},
+                "B": {"$ref": "#/components/schemas/A"},
+                "Tree": {
+                    "type": "array",
+                    "items": {"$ref": "#/components/schemas/Tree"},
+                },
+            }
+        },
+    }
+    score, issues = rule.apply(spec)
+    # Every ref into the loop is flagged; the recursive Tree is not.
+    assert score == 20
+    assert len(issues) == 4
+    for issue in issues:
+        assert issue["description"].startswith("Circular $ref chain")
+        assert (
+            "#/components/schemas/A -> #/components/schemas/B" in (issue["description"])
+        )
@@ -0,0 +1,125 @@
+import json
+
+import pytest
+
+from src.core.cache import ResultCache
+from src.core.scoring_engine import ScoringEngine
+from src.reports.export import export_report, write_ndjson
+from src.scoring.rules_base import Rule
+
+SPEC_PATH = "tests/test_files/file_70_80.json"
+
+
+def test_stream_matches_run():
+    report = ScoringEngine(SPEC_PATH).run()
+    stream = ScoringEngine(SPEC_PATH).stream()
+    issues = list(stream)
+    assert issues == report["issues"]
+    assert stream.summary() == {k: v for k, v in report.items() if k != "issues"}
+
+
+def test_stream_is_lazy():
+    stream = ScoringEngine(SPEC_PATH).stream()
+    iterator = iter(stream)
+    next(iterator)
+    assert len(stream.scores) < len(stream.rules)
+    with pytest.raises(RuntimeError):
+        stream.summary()
+
+
+def test_ndjson_export(tmp_path):
+    report = ScoringEngine(SPEC_PATH).run()
+    stream = ScoringEngine(SPEC_PATH).stream()
+    streamed = tmp_path / "streamed.ndjson"
+    with open(streamed, "w", encoding="utf-8") as f:
+        write_ndjson(stream, stream.summary, f)
+    exported = tmp_path / "exported.ndjson"
+    export_report(report, "ndjson", str(exported))
+
+    assert streamed.read_text() == exported.read_text()
+    lines = [json.loads(line) for line in streamed.read_text().splitlines()]
+    assert [line["type"] for line in lines[:-1]] == ["issue"] * len(report["issues"])
+    assert lines[-1]["type"] == "summary"
+    assert lines[-1]["score"] == report["score"]
+
+
+def test_fail_under_stops_once_out_of_reach(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    engine = ScoringEngine(SPEC_PATH, cache=cache, fail_under=99)
+    report = engine.run()
+    assert engine.rules[0].name == "Miscellaneous Best Practices"
+    assert report["gate"]["passed"] is False
+    assert "Schema & Types" in report["gate"]["skipped_rules"]
+    ran = {criterion["name"] for criterion in report["criteria"]}
+    assert ran.isdisjoint(report["gate"]["skipped_rules"])
+    # Stopped reports are partial and must not be cached.
+    assert ScoringEngine(SPEC_PATH, cache=cache).cached_report is None
+
+
+def test_fail_under_reachable_runs_every_rule():
+    full = ScoringEngine(SPEC_PATH).run()
+    gated = ScoringEngine(SPEC_PATH, fail_under=full["score"]).run()
+    assert gated["score"] == full["score"]
+    assert gated["gate"] == {
+        "fail_under": full["score"],
+        "passed": True,
+        "skipped_rules": [],
+    }
+
+
+def test_fail_under_fails_empty_specs(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    for _ in range(2):  # Freshly scored, then from the cache.
+        report = ScoringEngine(
+            "empty.json", content=b"{}", cache=cache, validation="off", fail_under=0
+        ).run()
+        assert report["gate"] == {"fail_under": 0, "passed": False, "skipped_rules": []}
+    assert (
+        "gate" not in ScoringEngine("empty.json", content=b"{}", validation="off").run()
+    )
+
+
+LEGACY_ISSUE = {
+    "path": "/x",
+    "operation": "GET",
+    "location": "paths./x.get",
+    "description": "Legacy rule issue.",
+    "severity": "medium",
+    "suggestion": "Fix it.",
+}
+
+
+class ApplyOnlyRule(Rule):
+    name = "Apply Only"
+    weight = 10
+
+    def apply(self, spec, index=None):
+        return 40, [LEGACY_ISSUE]
+
+
+class DuckTypedRule:
+    name = "Duck Typed"
+    weight = 10
+
+    def apply(self, spec):
+        return 40, [LEGACY_ISSUE]
+
+
+@pytest.mark.parametrize("rule", [ApplyOnlyRule(), DuckTypedRule()])
+@pytest.mark.parametrize(
+    "options", [{}, {"rule_workers": 2, "rule_executor": "process"}]
+)
+def test_apply_only_rules_keep_score_and_issues(rule, options):
+    report = ScoringEngine(SPEC_PATH, rules=[rule], **options).run()
+    assert report["criteria"] == [{"name": rule.name, "score": 40, "weight": 10}]
+    assert [dict(issue) for issue in report["issues"]] == [LEGACY_ISSUE]
+    assert report["issues"][0].code.startswith(f"{rule.name}.")
+
+
+def test_object_without_apply_is_rejected():
+    class NotARule:
+        name = "Not a rule"
+        weight = 10
+
+    with pytest.raises(TypeError, match="Not a rule"):
+        ScoringEngine(SPEC_PATH, rules=[NotARule()])
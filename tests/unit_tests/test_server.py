@@ -0,0 +1,103 @@
+import http.client
+import json
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.core.scoring_engine import ScoringEngine
+from src.core.server import ScoringServer, ScoringService
+
+SPEC_PATH = "tests/test_files/file_70_80.json"
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    server = ScoringServer(("127.0.0.1", 0), ScoringService(), 1024 * 1024, True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def request(url, data=None):
+    try:
+        with urllib.request.urlopen(url, data=data, timeout=30) as response:
+            return response.status, response.read().decode("utf-8")
+    except urllib.error.HTTPError as e:
+        return e.code, e.read().decode("utf-8")
+
+
+def test_health(base_url):
+    status, body = request(f"{base_url}/health")
+    assert status == 200
+    assert json.loads(body)["status"] == "ok"
+
+
+def test_score_body_matches_engine(base_url):
+    with open(SPEC_PATH, "rb") as f:
+        content = f.read()
+    status, body = request(f"{base_url}/score", data=content)
+    assert status == 200
+    assert json.loads(body) == ScoringEngine(SPEC_PATH).run()
+
+
+def test_score_path_and_format(base_url):
+    status, body = request(f"{base_url}/score?path={SPEC_PATH}&format=markdown")
+    assert status == 200
+    assert body.startswith("# API Scoring Report")
+
+
+def test_concurrent_requests(base_url):
+    with open(SPEC_PATH, "rb") as f:
+        content = f.read()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(
+            pool.map(lambda _: request(f"{base_url}/score", data=content), range(8))
+        )
+    assert {status for status, _ in results} == {200}
+    assert len({body for _, body in results}) == 1
+
+
+def test_errors(base_url):
+    status, body = request(f"{base_url}/score", data=b"openapi: [")
+    assert status == 422
+    assert "error" in json.loads(body)
+
+    assert request(f"{base_url}/score?format=pdf", data=b"{}")[0] == 400
+    assert request(f"{base_url}/nope")[0] == 404
+
+
+def test_oversized_body_is_rejected_before_reading(base_url):
+    conn = http.client.HTTPConnection(base_url.split("//")[1], timeout=30)
+    conn.putrequest("POST", "/score")
+    conn.putheader("Content-Length", str(2 * 1024 * 1024))
+    conn.endheaders()
+    assert conn.getresponse().status == 413
+    conn.close()
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b'{"openapi": "3.0.0", "paths": {"/x": {"get": {"responses": []}}}}',
+        b'{"openapi": "3.0.0", "info": [], "paths": {}}',
+    ],
+)
+def test_rule_failure_is_answered_with_500(base_url, body):
+    status, text = request(f"{base_url}/score?validation=off", data=body)
+    assert status == 500
+    assert "error" in json.loads(text)
+
+
+@pytest.mark.parametrize("length", ["abc", "-5"])
+def test_invalid_content_length_is_rejected(base_url, length):
+    conn = http.client.HTTPConnection(base_url.split("//")[1], timeout=30)
+    conn.putrequest("POST", "/score")
+    conn.putheader("Content-Length", length)
+    conn.endheaders()
+    assert conn.getresponse().status == 400
+    conn.close()
@@ -0,0 +1,68 @@
+import sys
+
+from src.core.spec_index import SpecIndex, normalize_path, walk_schemas
+from src.scoring.issues import format_location
+
+
+def make_spec():
+    return {
+        "security": [{"apiKey": []}],
+        "paths": {
+            "/Users/{userId}/": {
+                "GET": {"responses": {"200": {"description": "ok"}}},
+                "post": {"security": [], "requestBody": {"content": {}}},
+                "parameters": [],
+                "x-internal": {"tags": ["hidden"]},
+            },
+            "/broken": None,
+        },
+        "components": {"schemas": {"User": {"type": "object"}}},
+    }
+
+
+def test_normalize_path():
+    assert normalize_path("/Users/{userId}/?page=1") == "/users/{id}"
+
+
+def test_operations_are_indexed_once():
+    index = SpecIndex(make_spec())
+
+    assert [entry.path for entry in index.paths] == ["/Users/{userId}/", "/broken"]
+    assert [(op.method, op.key) for op in index.operations] == [
+        ("get", "GET"),
+        ("post", "post"),
+    ]
+
+    get_op, post_op = index.operations
+    assert get_op.normalized_path == "/users/{id}"
+    assert get_op.security == [{"apiKey": []}]
+    assert post_op.security == []
+    assert post_op.responses == {}
+    assert list(index.operations_for({"post"})) == [post_op]
+
+
+def test_schema_locations():
+    spec = make_spec()
+    spec["paths"]["/Users/{userId}/"]["GET"]["responses"]["200"]["content"] = {
+        "application/json": {"schema": {"type": "string"}}
+    }
+    index = SpecIndex(spec)
+
+    locations = [format_location(where) for _, where, _, _ in index.schema_locations]
+    assert locations == [
+        "paths./Users/{userId}/.GET.responses.200.content.application/json.schema",
+        "components.schemas.User",
+    ]
+
+
+def test_walk_schemas_handles_nesting_beyond_recursion_limit():
+    node: dict = {"schema": {"type": "string"}}
+    for _ in range(sys.getrecursionlimit() + 100):
+        node = {"items": [node]}
+
+    (found,) = walk_schemas(node, ("components", "parameters", "Deep"))
+    schema, where, path, operation = found
+    assert schema == {"type": "string"}
+    assert where[:4] == ("components", "parameters", "Deep", "items")
+    assert where[4] == 0 and where[-1] == "schema"
+    assert (path, operation) == ("N/A", "N/A")
@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+from src.core.scoring_engine import ScoringEngine
+from src.utils.loader import SpecLoadError
+from src.utils.validation import VerdictCache, validate_spec
+
+
+def make_invalid_spec():
+    return {
+        "openapi": "3.0.0",
+        "info": {},
+        "paths": {
+            "/a": {"get": {"responses": {"abc": {"description": "x"}}}},
+            "/b": {"get": {"responses": {"xyz": {"description": "x"}}}},
+        },
+    }
+
+
+def test_levels():
+    spec = make_invalid_spec()
+
+    assert validate_spec(spec, "off") == []
+    assert validate_spec(spec, "structural") == [
+        "'info.title' is required and must be a string.",
+        "'info.version' is required and must be a string.",
+    ]
+    assert len(validate_spec(spec, "full", max_errors=3)) == 3
+    with pytest.raises(ValueError):
+        validate_spec(spec, "strict")
+
+
+def test_verdicts_are_cached_by_digest(tmp_path):
+    verdicts = VerdictCache(str(tmp_path))
+    spec = make_invalid_spec()
+    errors = validate_spec(spec, "full", digest="abc", verdicts=verdicts)
+
+    # A fresh cache over the same directory serves the stored verdict.
+    reloaded = VerdictCache(str(tmp_path))
+    assert validate_spec({}, "full", digest="abc", verdicts=reloaded) == errors
+
+
+def test_engine_collects_validation_errors(tmp_path):
+    spec_path = tmp_path / "spec.json"
+    spec_path.write_text(json.dumps(make_invalid_spec()))
+
+    with pytest.raises(SpecLoadError):
+        ScoringEngine(str(spec_path))
+
+    report = ScoringEngine(str(spec_path), max_validation_errors=2).run()
+    assert report["validation"]["level"] == "full"
+    assert len(report["validation"]["errors"]) == 2
+    assert "score" in report